@@ -38,10 +38,20 @@ from .topic_analyzer import (
     TopicEvolution,
     TopicModelResult,
     extract_topics,
+    clear_topic_analyzers,
     find_similar_topics,
-    BERTOPIC_AVAILABLE,
+    bertopic_available,
 )
 
+
+def __getattr__(name):
+    # BERTOPIC_AVAILABLE only settles once BERTopic is actually imported;
+    # a copy bound at import time would go stale, so forward to the live value
+    if name == "BERTOPIC_AVAILABLE":
+        return bertopic_available()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     # Core analyzers
     "NLPAnalyzer",
@@ -67,6 +77,8 @@ __all__ = [
     "TopicEvolution",
     "TopicModelResult",
     "extract_topics",
+    "clear_topic_analyzers",
     "find_similar_topics",
     "BERTOPIC_AVAILABLE",
+    "bertopic_available",
 ]
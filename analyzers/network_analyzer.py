@@ -14,6 +14,7 @@ Usage:
     results = analyzer.run_full_analysis(days_back=30)
 """
 
+from dataclasses import asdict
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any, Set
 from pathlib import Path
@@ -497,10 +498,10 @@ class NetworkAnalyzer:
         results = {
             "timestamp": datetime.utcnow().isoformat(),
             "period_days": days_back,
-            "stats": self.get_network_stats().__dict__,
-            "superspreaders": [s.__dict__ for s in self.find_superspreaders(top_n=20)],
+            "stats": asdict(self.get_network_stats()),
+            "superspreaders": [asdict(s) for s in self.find_superspreaders(top_n=20)],
             "propagation_patterns": self.analyze_propagation_patterns(days_back),
-            "coordinated_behavior": [e.__dict__ for e in self.detect_coordinated_behavior()]
+            "coordinated_behavior": [asdict(e) for e in self.detect_coordinated_behavior()]
         }
         
         # Community detection
@@ -22,7 +22,7 @@ import threading
 from datetime import datetime
 from typing import Optional, List, Dict, Any, Tuple
 from pathlib import Path
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 
 import yaml
 import spacy
@@ -31,6 +31,7 @@ from loguru import logger
 
 from database import (
     get_session,
+    refresh_dashboard_stats,
     Content,
     NLPAnalysis,
     CognitiveMarker,
@@ -387,11 +388,9 @@ class NLPAnalyzer:
             keywords = lang_keywords.get(lang, lang_keywords.get("en", []))
             
             for keyword in keywords:
-                keyword_lower = keyword.lower()
-                if keyword_lower in text_lower:
-                    # Find position in text
-                    pos = text_lower.find(keyword_lower)
-                    
+                # Single scan: find() both tests and locates the keyword
+                pos = text_lower.find(keyword.lower())
+                if pos != -1:
                     markers.append(CognitiveMarkerDTO(
                         marker_type=marker_type,
                         marker_category="manipulation",
@@ -487,8 +486,8 @@ class NLPAnalyzer:
             
             matches = []
             for kw in keywords:
-                if kw.lower() in text_lower:
-                    pos = text_lower.find(kw.lower())
+                pos = text_lower.find(kw.lower())
+                if pos != -1:
                     matches.append({"keyword": kw, "position": pos})
             
             if matches:
@@ -556,7 +555,7 @@ class NLPAnalyzer:
                 sentiment_score=sentiment.score,
                 sentiment_label=sentiment.label.value,
                 sentiment_confidence=sentiment.confidence,
-                entities=[e.__dict__ for e in entities],
+                entities=[asdict(e) for e in entities],
                 keywords=keywords,
                 is_propaganda=is_propaganda,
                 propaganda_confidence=propaganda_confidence,
@@ -653,6 +652,12 @@ class NLPAnalyzer:
             Content.is_analyzed == False
         ).count()
         
+        if analyzed:
+            try:
+                refresh_dashboard_stats()
+            except Exception as e:
+                logger.warning(f"Could not refresh dashboard stats: {e}")
+        
         duration = (datetime.utcnow() - start_time).total_seconds()
         
         logger.info(
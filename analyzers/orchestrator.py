@@ -13,14 +13,19 @@ content analysis in disinformation campaigns.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Union, Callable, Tuple
 from enum import Flag, auto
+from functools import lru_cache, partial
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import asyncio
+import time
 
 import pandas as pd
 import numpy as np
 from loguru import logger
 
+from config.settings import settings
+
 # Import all analyzers
 from .nlp_analyzer import NLPAnalyzer
 from .network_analyzer import NetworkAnalyzer
@@ -34,7 +39,7 @@ from .topic_analyzer import (
     BERTopicAnalyzer,
     BERTopicConfig,
     TopicModelResult,
-    BERTOPIC_AVAILABLE,
+    bertopic_available,
 )
 
 
@@ -42,6 +47,24 @@ from .topic_analyzer import (
 # CONFIGURATION
 # =============================================================================
 
+# Limite le nombre d'analyses lourdes exécutées simultanément dans le process.
+# Un asyncio.Semaphore est lié à une boucle d'événements: il est recréé quand
+# la boucle change (plusieurs asyncio.run() dans le même process).
+_analysis_semaphore: Optional[asyncio.Semaphore] = None
+_analysis_semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_analysis_semaphore() -> asyncio.Semaphore:
+    """Sémaphore des analyses pour la boucle d'événements courante."""
+    global _analysis_semaphore, _analysis_semaphore_loop
+    
+    loop = asyncio.get_running_loop()
+    if _analysis_semaphore is None or _analysis_semaphore_loop is not loop:
+        _analysis_semaphore = asyncio.Semaphore(settings.max_concurrent_analyses)
+        _analysis_semaphore_loop = loop
+    return _analysis_semaphore
+
+
 class AnalysisType(Flag):
     """Types d'analyse à exécuter."""
     NONE = 0
@@ -64,6 +87,8 @@ class OrchestratorConfig:
         d3lta_config: Configuration D3lta
         bertopic_config: Configuration BERTopic
         parallel_execution: Exécuter les analyses en parallèle
+        single_threaded_init: Initialiser les analyseurs séquentiellement
+            dans le thread principal (ex: initialisation CUDA)
         save_results: Sauvegarder les résultats
         output_dir: Répertoire de sortie
     """
@@ -73,11 +98,12 @@ class OrchestratorConfig:
     d3lta_config: Optional[D3ltaConfig] = None
     bertopic_config: Optional[BERTopicConfig] = None
     parallel_execution: bool = True
+    single_threaded_init: bool = False
     save_results: bool = False
     output_dir: str = "./analysis_results"
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisMetrics:
     """Métriques d'une analyse."""
     analyzer_name: str
@@ -253,40 +279,72 @@ class AnalysisOrchestrator:
         self.topic_analyzer: Optional[BERTopicAnalyzer] = None
         
         self._initialize_analyzers()
+        
+        # Les analyseurs ne changent plus après l'initialisation
+        self._capabilities: Dict[str, bool] = {
+            "nlp_analysis": self.nlp_analyzer is not None,
+            "network_analysis": self.network_analyzer is not None,
+            "cib_detection": self.d3lta_analyzer is not None,
+            "topic_modeling": self.topic_analyzer is not None,
+            "d3lta_available": D3LTA_AVAILABLE,
+            # Déclenche l'import différé: find_spec seul ne garantit pas
+            # que l'import réussit
+            "bertopic_available": bertopic_available(),
+        }
     
     def _initialize_analyzers(self) -> None:
-        """Initialise les analyseurs configurés."""
-        if AnalysisType.NLP in self.config.analysis_types:
-            try:
-                self.nlp_analyzer = NLPAnalyzer()
-                logger.info("NLPAnalyzer initialized")
-            except Exception as e:
-                logger.error(f"Failed to initialize NLPAnalyzer: {e}")
-        
-        if AnalysisType.NETWORK in self.config.analysis_types:
-            try:
-                self.network_analyzer = NetworkAnalyzer()
-                logger.info("NetworkAnalyzer initialized")
-            except Exception as e:
-                logger.error(f"Failed to initialize NetworkAnalyzer: {e}")
+        """
+        Initialise les analyseurs configurés.
         
-        if AnalysisType.CIB in self.config.analysis_types and D3LTA_AVAILABLE:
-            try:
-                self.d3lta_analyzer = D3ltaAnalyzer(
-                    config=self.config.d3lta_config
-                )
-                logger.info("D3ltaAnalyzer initialized")
-            except Exception as e:
-                logger.error(f"Failed to initialize D3ltaAnalyzer: {e}")
-        
-        if AnalysisType.TOPICS in self.config.analysis_types and BERTOPIC_AVAILABLE:
-            try:
-                self.topic_analyzer = BERTopicAnalyzer(
-                    config=self.config.bertopic_config
-                )
-                logger.info("BERTopicAnalyzer initialized")
-            except Exception as e:
-                logger.error(f"Failed to initialize BERTopicAnalyzer: {e}")
+        Les chargements de modèles (spaCy, SentenceTransformer, BERTopic)
+        sont lancés en parallèle dans un pool de threads, sauf si
+        config.single_threaded_init est activé.
+        """
+        types = self.config.analysis_types
+        factories = []
+        
+        if AnalysisType.NLP in types:
+            factories.append(("nlp_analyzer", "NLPAnalyzer", NLPAnalyzer))
+        
+        if AnalysisType.NETWORK in types:
+            factories.append(("network_analyzer", "NetworkAnalyzer", NetworkAnalyzer))
+        
+        if AnalysisType.CIB in types and D3LTA_AVAILABLE:
+            factories.append((
+                "d3lta_analyzer", "D3ltaAnalyzer",
+                partial(D3ltaAnalyzer, config=self.config.d3lta_config)
+            ))
+        
+        # BERTopic n'est importé que si le topic modeling est demandé
+        if AnalysisType.TOPICS in types and bertopic_available():
+            factories.append((
+                "topic_analyzer", "BERTopicAnalyzer",
+                partial(BERTopicAnalyzer, config=self.config.bertopic_config)
+            ))
+        
+        if self.config.single_threaded_init or len(factories) <= 1:
+            for attr, name, factory in factories:
+                setattr(self, attr, self._build_analyzer(name, factory))
+            return
+        
+        with ThreadPoolExecutor(max_workers=len(factories)) as executor:
+            futures = {
+                executor.submit(self._build_analyzer, name, factory): attr
+                for attr, name, factory in factories
+            }
+            for future in as_completed(futures):
+                setattr(self, futures[future], future.result())
+    
+    @staticmethod
+    def _build_analyzer(name: str, factory: Any) -> Optional[Any]:
+        """Construit un analyseur, retourne None en cas d'échec."""
+        try:
+            analyzer = factory()
+            logger.info(f"{name} initialized")
+            return analyzer
+        except Exception as e:
+            logger.error(f"Failed to initialize {name}: {e}")
+            return None
     
     async def analyze(
         self,
@@ -303,7 +361,6 @@ class AnalysisOrchestrator:
         Returns:
             UnifiedAnalysisResult avec tous les résultats
         """
-        import time
         start_time = time.time()
         
         result = UnifiedAnalysisResult(
@@ -311,63 +368,64 @@ class AnalysisOrchestrator:
             config_used=self.config
         )
         
-        logger.info(f"Starting unified analysis on {len(contents)} contents")
-        
-        if self.config.parallel_execution:
-            # Exécution parallèle
-            tasks = []
-            
-            if self.nlp_analyzer:
-                tasks.append(("nlp", self._run_nlp_analysis(contents)))
+        async with _get_analysis_semaphore():
+            logger.info(f"Starting unified analysis on {len(contents)} contents")
             
-            if self.d3lta_analyzer:
-                tasks.append(("cib", self._run_cib_analysis(contents)))
-            
-            if self.topic_analyzer:
-                tasks.append(("topics", self._run_topic_analysis(contents, timestamps)))
-            
-            # Exécuter en parallèle
-            for name, task in tasks:
-                try:
-                    task_result, metrics = await task
-                    result.metrics[name] = metrics
-                    
-                    if name == "nlp":
-                        result.nlp_results = task_result
-                    elif name == "cib":
-                        result.cib_results = task_result
-                    elif name == "topics":
-                        result.topic_results = task_result
+            if self.config.parallel_execution:
+                # Exécution parallèle
+                tasks = []
+                
+                if self.nlp_analyzer:
+                    tasks.append(("nlp", self._run_nlp_analysis(contents)))
+                
+                if self.d3lta_analyzer:
+                    tasks.append(("cib", self._run_cib_analysis(contents)))
+                
+                if self.topic_analyzer:
+                    tasks.append(("topics", self._run_topic_analysis(contents, timestamps)))
+                
+                # Exécuter en parallèle
+                for name, task in tasks:
+                    try:
+                        task_result, metrics = await task
+                        result.metrics[name] = metrics
                         
-                except Exception as e:
-                    logger.error(f"{name} analysis failed: {e}")
-                    result.metrics[name] = AnalysisMetrics(
-                        analyzer_name=name,
-                        error_count=1,
-                        warnings=[str(e)]
-                    )
-        else:
-            # Exécution séquentielle
-            if self.nlp_analyzer:
-                nlp_result, nlp_metrics = await self._run_nlp_analysis(contents)
-                result.nlp_results = nlp_result
-                result.metrics["nlp"] = nlp_metrics
-            
-            if self.d3lta_analyzer:
-                cib_result, cib_metrics = await self._run_cib_analysis(contents)
-                result.cib_results = cib_result
-                result.metrics["cib"] = cib_metrics
+                        if name == "nlp":
+                            result.nlp_results = task_result
+                        elif name == "cib":
+                            result.cib_results = task_result
+                        elif name == "topics":
+                            result.topic_results = task_result
+                            
+                    except Exception as e:
+                        logger.error(f"{name} analysis failed: {e}")
+                        result.metrics[name] = AnalysisMetrics(
+                            analyzer_name=name,
+                            error_count=1,
+                            warnings=[str(e)]
+                        )
+            else:
+                # Exécution séquentielle
+                if self.nlp_analyzer:
+                    nlp_result, nlp_metrics = await self._run_nlp_analysis(contents)
+                    result.nlp_results = nlp_result
+                    result.metrics["nlp"] = nlp_metrics
+                
+                if self.d3lta_analyzer:
+                    cib_result, cib_metrics = await self._run_cib_analysis(contents)
+                    result.cib_results = cib_result
+                    result.metrics["cib"] = cib_metrics
+                
+                if self.topic_analyzer:
+                    topic_result, topic_metrics = await self._run_topic_analysis(contents, timestamps)
+                    result.topic_results = topic_result
+                    result.metrics["topics"] = topic_metrics
             
-            if self.topic_analyzer:
-                topic_result, topic_metrics = await self._run_topic_analysis(contents, timestamps)
-                result.topic_results = topic_result
-                result.metrics["topics"] = topic_metrics
-        
-        # Network analysis (nécessite la DB, donc séparé)
-        if self.network_analyzer:
-            network_result, network_metrics = await self._run_network_analysis()
-            result.network_results = network_result
-            result.metrics["network"] = network_metrics
+            # Network analysis (nécessite la DB, donc séparé)
+            if self.network_analyzer:
+                network_result, network_metrics = await self._run_network_analysis()
+                result.network_results = network_result
+                result.metrics["network"] = network_metrics
         
         # Générer les alertes
         result.alerts = self._generate_alerts(result)
@@ -381,18 +439,46 @@ class AnalysisOrchestrator:
         
         return result
     
+    async def _timed(
+        self,
+        name: str,
+        fn: Callable[[AnalysisMetrics], Any],
+        default: Callable[[], Any] = dict
+    ) -> Tuple[Any, AnalysisMetrics]:
+        """
+        Exécute une analyse en mesurant sa durée et en capturant ses erreurs.
+        
+        Le corps (synchrone, CPU ou DB) tourne dans un thread: la boucle
+        d'événements reste libre et le sémaphore borne réellement le
+        nombre d'analyses en cours.
+        
+        Args:
+            name: Nom de l'analyseur (pour les métriques)
+            fn: Corps synchrone de l'analyse; reçoit les métriques à compléter
+            default: Fabrique du résultat par défaut en cas d'erreur
+            
+        Returns:
+            (résultat, métriques)
+        """
+        start = time.perf_counter()
+        metrics = AnalysisMetrics(analyzer_name=name)
+        
+        try:
+            result = await asyncio.to_thread(fn, metrics)
+        except Exception as e:
+            metrics.error_count += 1
+            metrics.warnings.append(str(e))
+            result = default()
+        
+        metrics.processing_time_seconds = time.perf_counter() - start
+        return result, metrics
+    
     async def _run_nlp_analysis(
         self,
         contents: List[Dict[str, Any]]
     ) -> tuple:
         """Exécute l'analyse NLP."""
-        import time
-        start = time.time()
-        
-        metrics = AnalysisMetrics(analyzer_name="nlp")
-        result = {}
-        
-        try:
+        def run(metrics: AnalysisMetrics) -> Dict[str, Any]:
             # Analyser par batch
             propaganda_count = 0
             languages = []
@@ -408,43 +494,27 @@ class AnalysisOrchestrator:
                     # Analyse simplifiée (la vraie utiliserait self.nlp_analyzer)
                     metrics.items_processed += 1
             
-            result = {
+            return {
                 "analyzed_count": metrics.items_processed,
                 "propaganda_count": propaganda_count,
                 "propaganda_rate": propaganda_count / max(1, metrics.items_processed),
                 "languages": list(set(languages))
             }
-            
-        except Exception as e:
-            metrics.error_count += 1
-            metrics.warnings.append(str(e))
         
-        metrics.processing_time_seconds = time.time() - start
-        return result, metrics
+        return await self._timed("nlp", run)
     
     async def _run_cib_analysis(
         self,
         contents: List[Dict[str, Any]]
     ) -> tuple:
         """Exécute l'analyse CIB avec D3lta."""
-        import time
-        start = time.time()
-        
-        metrics = AnalysisMetrics(analyzer_name="cib")
-        result = None
-        
-        try:
+        def run(metrics: AnalysisMetrics) -> CIBDetectionResult:
             result = self.d3lta_analyzer.analyze(contents)
             metrics.items_processed = len(contents)
             metrics.items_flagged = result.total_matches
-            
-        except Exception as e:
-            metrics.error_count += 1
-            metrics.warnings.append(str(e))
-            result = CIBDetectionResult()
+            return result
         
-        metrics.processing_time_seconds = time.time() - start
-        return result, metrics
+        return await self._timed("cib", run, default=CIBDetectionResult)
     
     async def _run_topic_analysis(
         self,
@@ -452,54 +522,39 @@ class AnalysisOrchestrator:
         timestamps: Optional[List[datetime]] = None
     ) -> tuple:
         """Exécute l'analyse de topics avec BERTopic."""
-        import time
-        start = time.time()
-        
-        metrics = AnalysisMetrics(analyzer_name="topics")
-        result = None
-        
-        try:
+        def run(metrics: AnalysisMetrics) -> TopicModelResult:
             result = self.topic_analyzer.fit_transform(contents, timestamps=timestamps)
             metrics.items_processed = len(contents)
             metrics.items_flagged = result.num_topics
-            
-        except Exception as e:
-            metrics.error_count += 1
-            metrics.warnings.append(str(e))
-            result = TopicModelResult()
+            return result
         
-        metrics.processing_time_seconds = time.time() - start
-        return result, metrics
+        return await self._timed("topics", run, default=TopicModelResult)
     
     async def _run_network_analysis(self) -> tuple:
         """Exécute l'analyse de réseau."""
-        import time
-        start = time.time()
-        
-        metrics = AnalysisMetrics(analyzer_name="network")
-        result = {}
-        
-        try:
+        def run(metrics: AnalysisMetrics) -> Dict[str, Any]:
             # L'analyse réseau utilise la DB
             analysis = self.network_analyzer.run_full_analysis(
                 days_back=self.config.network_lookback_days
             )
-            result = analysis
             metrics.items_processed = analysis.get("node_count", 0)
-            
-        except Exception as e:
-            metrics.error_count += 1
-            metrics.warnings.append(str(e))
+            return analysis
         
-        metrics.processing_time_seconds = time.time() - start
-        return result, metrics
+        return await self._timed("network", run)
     
     def _generate_alerts(self, result: UnifiedAnalysisResult) -> List[Dict[str, Any]]:
         """Génère les alertes basées sur les résultats."""
         alerts = []
+        enabled = self.config.analysis_types
+        
+        # Aucun analyseur producteur d'alertes n'a tourné
+        if not (
+            enabled & (AnalysisType.CIB | AnalysisType.TOPICS | AnalysisType.NLP)
+        ):
+            return alerts
         
         # Alertes CIB
-        if result.cib_results:
+        if AnalysisType.CIB in enabled and result.cib_results:
             cib = result.cib_results
             
             # Alerte copypasta massif
@@ -533,11 +588,11 @@ class AnalysisOrchestrator:
                 })
         
         # Alertes Topics
-        if result.topic_results:
+        if AnalysisType.TOPICS in enabled and result.topic_results:
             topics = result.topic_results
             
             # Alerte topics émergents
-            rising = topics.get_rising_topics()
+            rising = topics.get_rising_topics() if topics.num_topics > 0 else []
             if rising:
                 alerts.append({
                     "type": "rising_topics",
@@ -558,7 +613,7 @@ class AnalysisOrchestrator:
                 })
         
         # Alertes NLP
-        if result.nlp_results:
+        if AnalysisType.NLP in enabled and result.nlp_results:
             propaganda_rate = result.nlp_results.get("propaganda_rate", 0)
             if propaganda_rate > 0.3:
                 alerts.append({
@@ -575,15 +630,8 @@ class AnalysisOrchestrator:
         return alerts
     
     def get_capabilities(self) -> Dict[str, bool]:
-        """Retourne les capacités disponibles."""
-        return {
-            "nlp_analysis": self.nlp_analyzer is not None,
-            "network_analysis": self.network_analyzer is not None,
-            "cib_detection": self.d3lta_analyzer is not None,
-            "topic_modeling": self.topic_analyzer is not None,
-            "d3lta_available": D3LTA_AVAILABLE,
-            "bertopic_available": BERTOPIC_AVAILABLE,
-        }
+        """Retourne une copie des capacités disponibles (calculées à l'initialisation)."""
+        return dict(self._capabilities)
     
     def close(self) -> None:
         """Ferme les ressources."""
@@ -598,6 +646,12 @@ class AnalysisOrchestrator:
                 self.network_analyzer.close()
             except Exception:
                 pass
+        
+        if self.topic_analyzer:
+            try:
+                self.topic_analyzer.close()
+            except Exception:
+                pass
 
 
 # =============================================================================
@@ -630,10 +684,25 @@ async def run_full_analysis(
 
 
 def check_analysis_capabilities() -> Dict[str, bool]:
-    """Vérifie les capacités d'analyse disponibles."""
+    """
+    Vérifie les capacités d'analyse disponibles (résultat mis en cache).
+    
+    Chaque appel reçoit sa propre copie du résultat.
+    """
+    return dict(_probe_analysis_capabilities())
+
+
+@lru_cache(maxsize=None)
+def _probe_analysis_capabilities() -> Dict[str, bool]:
+    """
+    Sonde les capacités d'analyse une seule fois par process.
+    
+    Déclenche l'import différé de BERTopic: la valeur mise en cache est
+    donc définitive.
+    """
     return {
         "d3lta": D3LTA_AVAILABLE,
-        "bertopic": BERTOPIC_AVAILABLE,
+        "bertopic": bertopic_available(),
         "sentence_transformers": True,  # Always included
         "spacy": True,  # Always included
     }
@@ -21,60 +21,190 @@ Requirements:
 
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any, Tuple, Union
-from collections import Counter
+from typing import Optional, List, Dict, Any, Tuple, Union, FrozenSet
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import compress
 from pathlib import Path
+import atexit
+import hashlib
+import importlib.util
 import json
+import os
+import threading
 
 import pandas as pd
 import numpy as np
 from loguru import logger
 
 # =============================================================================
-# IMPORTS CONDITIONNELS
+# IMPORTS CONDITIONNELS (différés)
 # =============================================================================
+# BERTopic et ses dépendances (torch, umap, hdbscan, sklearn) coûtent plusieurs
+# secondes à l'import. Seule leur présence est vérifiée ici; l'import réel est
+# fait au premier besoin par _lazy_import_bertopic().
 
-try:
-    from bertopic import BERTopic
-    from bertopic.representation import KeyBERTInspired, MaximalMarginalRelevance
-    BERTOPIC_AVAILABLE = True
-    logger.info("BERTopic library loaded successfully")
-except ImportError:
-    BERTOPIC_AVAILABLE = False
+BERTOPIC_AVAILABLE = importlib.util.find_spec("bertopic") is not None
+if not BERTOPIC_AVAILABLE:
     logger.warning(
         "BERTopic not installed. Install with: pip install bertopic[all]"
     )
 
-try:
-    from sentence_transformers import SentenceTransformer
-    SENTENCE_TRANSFORMERS_AVAILABLE = True
-except ImportError:
-    SENTENCE_TRANSFORMERS_AVAILABLE = False
+SENTENCE_TRANSFORMERS_AVAILABLE = False
+UMAP_AVAILABLE = False
+HDBSCAN_AVAILABLE = False
+SKLEARN_AVAILABLE = False
+CUML_AVAILABLE = False
+FAST_HDBSCAN_AVAILABLE = False
 
-try:
-    from umap import UMAP
-    UMAP_AVAILABLE = True
-except ImportError:
-    UMAP_AVAILABLE = False
+BERTopic = None
+KeyBERTInspired = None
+MaximalMarginalRelevance = None
+SentenceTransformer = None
+UMAP = None
+HDBSCAN = None
+CountVectorizer = None
+cuUMAP = None
+cuHDBSCAN = None
+FastHDBSCAN = None
 
-try:
-    from hdbscan import HDBSCAN
-    HDBSCAN_AVAILABLE = True
-except ImportError:
-    HDBSCAN_AVAILABLE = False
+_lazy_imports_done = False
+_lazy_imports_lock = threading.Lock()
 
+# Bibliothèque légère: importée directement
 try:
-    from sklearn.feature_extraction.text import CountVectorizer
-    SKLEARN_AVAILABLE = True
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
 except ImportError:
-    SKLEARN_AVAILABLE = False
+    AHOCORASICK_AVAILABLE = False
+
+
+def _warm_up_umap() -> None:
+    """
+    Déclenche une fois la compilation JIT (numba) des noyaux UMAP.
+    
+    Les fonctions compilées restent en mémoire pour la durée du process:
+    les UMAP créés ensuite ne paient plus la compilation au premier fit.
+    """
+    try:
+        sample = np.random.RandomState(42).rand(8, 2)
+        UMAP(n_components=2, n_neighbors=2, init="random").fit(sample)
+        logger.debug("UMAP numba kernels compiled")
+    except Exception as e:
+        logger.debug(f"UMAP warm-up skipped: {e}")
+
+
+def _lazy_import_bertopic() -> bool:
+    """
+    Importe BERTopic et ses dépendances optionnelles au premier appel.
+    
+    Les symboles importés sont stockés dans les globales du module.
+    
+    Returns:
+        True si BERTopic est utilisable
+    """
+    global _lazy_imports_done, BERTOPIC_AVAILABLE
+    global SENTENCE_TRANSFORMERS_AVAILABLE, UMAP_AVAILABLE
+    global HDBSCAN_AVAILABLE, SKLEARN_AVAILABLE, CUML_AVAILABLE
+    global FAST_HDBSCAN_AVAILABLE
+    global BERTopic, KeyBERTInspired, MaximalMarginalRelevance
+    global SentenceTransformer, UMAP, HDBSCAN, CountVectorizer
+    global cuUMAP, cuHDBSCAN, FastHDBSCAN
+    
+    if _lazy_imports_done:
+        return BERTOPIC_AVAILABLE
+    
+    with _lazy_imports_lock:
+        if _lazy_imports_done:
+            return BERTOPIC_AVAILABLE
+        
+        # Cache disque des fonctions numba (@njit(cache=True)) de UMAP/HDBSCAN,
+        # à définir avant le premier import de numba. Répertoire de cache
+        # utilisateur (hors de l'arbre de travail) sauf si NUMBA_CACHE_DIR
+        # est déjà défini.
+        cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        os.environ.setdefault(
+            "NUMBA_CACHE_DIR", str(Path(cache_home) / "doppelganger" / "numba")
+        )
+        
+        if BERTOPIC_AVAILABLE:
+            try:
+                from bertopic import BERTopic
+                from bertopic.representation import (
+                    KeyBERTInspired,
+                    MaximalMarginalRelevance,
+                )
+                logger.info("BERTopic library loaded successfully")
+            except ImportError as e:
+                BERTOPIC_AVAILABLE = False
+                logger.warning(f"BERTopic import failed: {e}")
+        
+        try:
+            from sentence_transformers import SentenceTransformer
+            SENTENCE_TRANSFORMERS_AVAILABLE = True
+        except ImportError:
+            SENTENCE_TRANSFORMERS_AVAILABLE = False
+        
+        try:
+            from umap import UMAP
+            UMAP_AVAILABLE = True
+            _warm_up_umap()
+        except ImportError:
+            UMAP_AVAILABLE = False
+        
+        try:
+            from hdbscan import HDBSCAN
+            HDBSCAN_AVAILABLE = True
+        except ImportError:
+            HDBSCAN_AVAILABLE = False
+        
+        # fast_hdbscan: MST de Boruvka parallélisé (numba), euclidien uniquement
+        try:
+            from fast_hdbscan import HDBSCAN as FastHDBSCAN
+            FAST_HDBSCAN_AVAILABLE = True
+        except ImportError:
+            FAST_HDBSCAN_AVAILABLE = False
+        
+        try:
+            from sklearn.feature_extraction.text import CountVectorizer
+            SKLEARN_AVAILABLE = True
+        except ImportError:
+            SKLEARN_AVAILABLE = False
+        
+        # RAPIDS cuML: UMAP/HDBSCAN sur GPU (même API)
+        try:
+            from cuml.manifold import UMAP as cuUMAP
+            from cuml.cluster import HDBSCAN as cuHDBSCAN
+            CUML_AVAILABLE = True
+            logger.info("cuML loaded: GPU UMAP/HDBSCAN available")
+        except ImportError:
+            CUML_AVAILABLE = False
+        
+        _lazy_imports_done = True
+    
+    return BERTOPIC_AVAILABLE
+
+
+def bertopic_available() -> bool:
+    """
+    Indique si BERTopic est utilisable, en déclenchant l'import différé.
+    
+    BERTOPIC_AVAILABLE ne reflète que la présence du paquet tant que
+    l'import réel n'a pas eu lieu; les modules qui l'importent par valeur
+    en gardent une copie figée. Utiliser cette fonction pour une réponse
+    définitive.
+    """
+    return _lazy_import_bertopic()
 
 
 # =============================================================================
 # DATA STRUCTURES
 # =============================================================================
 
-@dataclass(frozen=True)
+DEFAULT_EMBEDDING_MODEL = "paraphrase-multilingual-MiniLM-L12-v2"
+
+
+@dataclass(frozen=True, slots=True)
 class BERTopicConfig:
     """
     Configuration pour BERTopic.
@@ -89,8 +219,15 @@ class BERTopicConfig:
         calculate_probabilities: Calculer les probabilités de topic
         diversity: Diversité des mots du topic (0-1)
         seed_topic_list: Liste de topics seeds pour guided topic modeling
+        embedding_cache_size: Nombre max d'embeddings gardés en cache
+            entre deux appels (0 = pas de cache)
+        batch_size: Taille des batchs d'encodage SentenceTransformer
+        precision: Précision d'inférence ("fp32" ou "fp16", fp16 sur GPU)
+        use_gpu: Utiliser cuML (RAPIDS) pour UMAP/HDBSCAN si disponible
+        large_corpus: Borner le vocabulaire c-TF-IDF (gros corpus)
+        max_vocab_size: Taille max du vocabulaire si large_corpus
     """
-    embedding_model: str = "paraphrase-multilingual-MiniLM-L12-v2"
+    embedding_model: str = DEFAULT_EMBEDDING_MODEL
     language: str = "multilingual"
     min_topic_size: int = 10
     nr_topics: Optional[Union[int, str]] = None
@@ -99,6 +236,12 @@ class BERTopicConfig:
     calculate_probabilities: bool = False
     diversity: float = 0.3
     seed_topic_list: Optional[List[List[str]]] = None
+    embedding_cache_size: int = 10000
+    batch_size: int = 64
+    precision: str = "fp32"
+    use_gpu: bool = True
+    large_corpus: bool = False
+    max_vocab_size: int = 100_000
     
     # UMAP parameters
     umap_n_neighbors: int = 15
@@ -124,7 +267,7 @@ class BERTopicConfig:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Topic:
     """
     Représentation d'un topic détecté.
@@ -175,7 +318,7 @@ class Topic:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentTopicAssignment:
     """
     Assignation d'un document à un topic.
@@ -199,7 +342,7 @@ class DocumentTopicAssignment:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TopicEvolution:
     """
     Évolution d'un topic dans le temps.
@@ -207,26 +350,31 @@ class TopicEvolution:
     Attributes:
         topic_id: ID du topic
         timestamps: Liste des timestamps
-        frequencies: Fréquences correspondantes
+        frequencies: Fréquences correspondantes (ndarray int32)
         trend: Tendance (rising, falling, stable)
     """
     topic_id: int
     timestamps: List[datetime] = field(default_factory=list)
-    frequencies: List[int] = field(default_factory=list)
+    frequencies: np.ndarray = field(
+        default_factory=lambda: np.zeros(0, dtype=np.int32)
+    )
     trend: str = "stable"  # rising, falling, stable
     
+    def __post_init__(self) -> None:
+        self.frequencies = np.asarray(self.frequencies, dtype=np.int32)
+    
     @property
     def total_count(self) -> int:
         """Total des occurrences."""
-        return sum(self.frequencies)
+        return int(self.frequencies.sum())
     
     def compute_trend(self, window: int = 3) -> str:
         """Calcule la tendance sur les dernières périodes."""
-        if len(self.frequencies) < window * 2:
+        if self.frequencies.size < window * 2:
             return "stable"
         
-        recent = np.mean(self.frequencies[-window:])
-        previous = np.mean(self.frequencies[-window*2:-window])
+        recent = self.frequencies[-window:].mean()
+        previous = self.frequencies[-window*2:-window].mean()
         
         if recent > previous * 1.2:
             return "rising"
@@ -235,7 +383,7 @@ class TopicEvolution:
         return "stable"
 
 
-@dataclass
+@dataclass(slots=True)
 class TopicModelResult:
     """
     Résultat complet du topic modeling.
@@ -243,14 +391,19 @@ class TopicModelResult:
     Attributes:
         topics: Liste des topics détectés
         assignments: Assignations document-topic
-        topic_evolution: Évolution temporelle (si timestamps fournis)
+        evolution_matrix: Fréquences par topic et par jour,
+            shape (num_topics, num_timebins) (si timestamps fournis)
+        evolution_topic_ids: Topic ID de chaque ligne de evolution_matrix
+        evolution_timestamps: Jours de chaque colonne (datetime64[s])
         embeddings: Embeddings des documents (optionnel)
         config: Configuration utilisée
         statistics: Statistiques du modèle
     """
     topics: List[Topic] = field(default_factory=list)
     assignments: List[DocumentTopicAssignment] = field(default_factory=list)
-    topic_evolution: Dict[int, TopicEvolution] = field(default_factory=dict)
+    evolution_matrix: Optional[np.ndarray] = None
+    evolution_topic_ids: Optional[np.ndarray] = None
+    evolution_timestamps: Optional[np.ndarray] = None
     embeddings: Optional[np.ndarray] = None
     config: Optional[BERTopicConfig] = None
     statistics: Dict[str, Any] = field(default_factory=dict)
@@ -277,12 +430,35 @@ class TopicModelResult:
         """Récupère les documents d'un topic."""
         return [a for a in self.assignments if a.topic_id == topic_id]
     
-    def get_rising_topics(self) -> List[Topic]:
+    @property
+    def topic_evolution(self) -> Dict[int, TopicEvolution]:
+        """Vue par topic de evolution_matrix (construite à la demande)."""
+        if self.evolution_matrix is None:
+            return {}
+        
+        timestamps = self.evolution_timestamps.tolist()
+        trends = _compute_trends(self.evolution_matrix)
+        return {
+            int(tid): TopicEvolution(
+                topic_id=int(tid),
+                timestamps=timestamps,
+                frequencies=row,
+                trend=str(trend)
+            )
+            for tid, row, trend in zip(
+                self.evolution_topic_ids, self.evolution_matrix, trends
+            )
+        }
+    
+    def get_rising_topics(self, window: int = 3) -> List[Topic]:
         """Récupère les topics en hausse."""
-        rising_ids = [
-            tid for tid, evo in self.topic_evolution.items() 
-            if evo.trend == "rising"
-        ]
+        if self.evolution_matrix is None:
+            return []
+        
+        trends = _compute_trends(self.evolution_matrix, window)
+        rising_ids = set(self.evolution_topic_ids[trends == "rising"].tolist())
+        if not rising_ids:
+            return []
         return [t for t in self.topics if t.topic_id in rising_ids]
     
     def to_dict(self) -> Dict[str, Any]:
@@ -297,6 +473,104 @@ class TopicModelResult:
         }
 
 
+# Stopwords de base multilingues (construits une seule fois)
+_STOPWORDS: Dict[str, FrozenSet[str]] = {
+    "french": frozenset([
+        "le", "la", "les", "de", "du", "des", "un", "une", "et", "en", "à", "au", "aux",
+        "ce", "cette", "ces", "qui", "que", "quoi", "dont", "où", "pour", "par", "sur",
+        "avec", "sans", "sous", "dans", "est", "sont", "a", "ont", "être", "avoir",
+        "je", "tu", "il", "elle", "nous", "vous", "ils", "elles", "se", "ne", "pas"
+    ]),
+    "english": frozenset([
+        "the", "a", "an", "is", "are", "was", "were", "be", "been", "being",
+        "have", "has", "had", "do", "does", "did", "will", "would", "could", "should",
+        "may", "might", "must", "shall", "can", "need", "to", "of", "in", "for",
+        "on", "with", "at", "by", "from", "as", "into", "through", "during",
+        "before", "after", "above", "below", "between", "under", "again", "further",
+        "then", "once", "here", "there", "when", "where", "why", "how", "all", "each",
+        "few", "more", "most", "other", "some", "such", "no", "nor", "not", "only",
+        "own", "same", "so", "than", "too", "very", "just", "and", "but", "if", "or"
+    ]),
+    "russian": frozenset([
+        "и", "в", "не", "на", "с", "что", "а", "как", "это", "по", "но", "к",
+        "из", "у", "о", "за", "от", "же", "для", "до", "или", "так", "все",
+        "он", "она", "они", "мы", "вы", "его", "её", "их", "был", "была", "были",
+        "быть", "есть", "будет", "этот", "эта", "эти", "тот", "та", "те"
+    ]),
+}
+_STOPWORDS["multilingual"] = frozenset().union(*_STOPWORDS.values())
+
+
+@lru_cache(maxsize=4)
+def _get_sentence_transformer(
+    model_name: str,
+    precision: str = "fp32"
+) -> "SentenceTransformer":
+    """
+    Modèle SentenceTransformer partagé par tous les analyseurs du process.
+    
+    Les poids ne sont chargés qu'une fois par (modèle, précision).
+    """
+    model = SentenceTransformer(model_name)
+    
+    # FP16: débit doublé et mémoire d'activation divisée par deux (GPU)
+    if precision == "fp16" and model.device.type == "cuda":
+        model.half()
+        logger.info("SentenceTransformer running in fp16")
+    
+    return model
+
+
+# Les workers d'un pool partagent leurs files d'entrée/sortie: un seul
+# encodage multi-process à la fois (il occupe déjà tous les GPU)
+_encode_pool_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _get_encode_pool(
+    model_name: str,
+    precision: str = "fp32"
+) -> Dict[str, Any]:
+    """
+    Pool d'encodage multi-GPU partagé par tous les analyseurs du process.
+    
+    Un seul jeu de workers (une copie du modèle par GPU) par (modèle,
+    précision), arrêté à la sortie du process.
+    """
+    model = _get_sentence_transformer(model_name, precision)
+    pool = model.start_multi_process_pool()
+    atexit.register(SentenceTransformer.stop_multi_process_pool, pool)
+    logger.info(f"Embedding pool started for {model_name}")
+    return pool
+
+
+def _hash_text(text: str) -> bytes:
+    """Clé de cache d'un texte pour les embeddings."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+def _compute_trends(matrix: np.ndarray, window: int = 3) -> np.ndarray:
+    """
+    Calcule la tendance de chaque ligne d'une matrice d'évolution.
+    
+    Même règle que TopicEvolution.compute_trend, appliquée à tous les
+    topics en une seule passe vectorisée.
+    
+    Returns:
+        Tableau de "rising" / "falling" / "stable" (une entrée par ligne)
+    """
+    trends = np.full(matrix.shape[0], "stable", dtype=object)
+    if matrix.shape[1] < window * 2:
+        return trends
+    
+    recent = matrix[:, -window:].mean(axis=1)
+    previous = matrix[:, -window * 2:-window].mean(axis=1)
+    
+    trends[recent > previous * 1.2] = "rising"
+    trends[recent < previous * 0.8] = "falling"
+    return trends
+
+
 # =============================================================================
 # BERTOPIC ANALYZER - Main Interface
 # =============================================================================
@@ -350,11 +624,14 @@ class BERTopicAnalyzer:
             load_from: Chemin pour charger un modèle existant
         """
         self.config = config or BERTopicConfig()
-        self.model: Optional[BERTopic] = None
+        self.model: Optional["BERTopic"] = None
         self._embedding_model = None
-        self._embeddings_cache: Dict[str, np.ndarray] = {}
+        self._pool: Optional[Dict[str, Any]] = None
+        self._embeddings_cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        # Usage exclusif quand l'analyseur est partagé (extract_topics)
+        self._lock = threading.Lock()
         
-        if not BERTOPIC_AVAILABLE:
+        if not _lazy_import_bertopic():
             logger.error("BERTopic not available. Install with: pip install bertopic[all]")
             return
         
@@ -382,40 +659,80 @@ class BERTopicAnalyzer:
         
         # Embedding model
         if SENTENCE_TRANSFORMERS_AVAILABLE:
-            self._embedding_model = SentenceTransformer(self.config.embedding_model)
+            self._embedding_model = _get_sentence_transformer(
+                self.config.embedding_model, self.config.precision
+            )
+            
+            # Plusieurs GPU: encodage réparti via le pool multi-process partagé
+            import torch
+            if torch.cuda.device_count() > 1:
+                self._pool = _get_encode_pool(
+                    self.config.embedding_model, self.config.precision
+                )
         else:
             self._embedding_model = self.config.embedding_model
         
+        # UMAP / HDBSCAN: cuML sur GPU si disponible, sinon CPU
+        use_cuml = CUML_AVAILABLE and self.config.use_gpu
+        gpu_kwargs = {"output_type": "numpy"} if use_cuml else {}
+        umap_kwargs = gpu_kwargs if use_cuml else {"low_memory": True}
+        
         # UMAP
         umap_model = None
-        if UMAP_AVAILABLE:
-            umap_model = UMAP(
+        umap_cls = cuUMAP if use_cuml else (UMAP if UMAP_AVAILABLE else None)
+        if umap_cls is not None:
+            umap_model = umap_cls(
                 n_neighbors=self.config.umap_n_neighbors,
                 n_components=self.config.umap_n_components,
                 min_dist=self.config.umap_min_dist,
                 metric=self.config.umap_metric,
-                random_state=42
+                random_state=42,
+                **umap_kwargs
             )
         
         # HDBSCAN
         hdbscan_model = None
-        if HDBSCAN_AVAILABLE:
-            hdbscan_model = HDBSCAN(
+        hdbscan_cls = cuHDBSCAN if use_cuml else (HDBSCAN if HDBSCAN_AVAILABLE else None)
+        if (
+            not use_cuml
+            and FAST_HDBSCAN_AVAILABLE
+            and self.config.hdbscan_metric == "euclidean"
+            and not self.config.calculate_probabilities
+        ):
+            # Version multi-cœurs (pas de métrique custom ni de soft clustering)
+            hdbscan_model = FastHDBSCAN(
+                min_cluster_size=self.config.hdbscan_min_cluster_size,
+                min_samples=self.config.hdbscan_min_samples
+            )
+            logger.info("Using fast_hdbscan parallel clustering")
+        elif hdbscan_cls is not None:
+            hdbscan_model = hdbscan_cls(
                 min_cluster_size=self.config.hdbscan_min_cluster_size,
                 min_samples=self.config.hdbscan_min_samples,
                 metric=self.config.hdbscan_metric,
-                prediction_data=True
+                prediction_data=True,
+                **gpu_kwargs
             )
         
+        if use_cuml:
+            logger.info("Using cuML GPU UMAP/HDBSCAN")
+        
         # Vectorizer pour c-TF-IDF
         vectorizer_model = None
         if SKLEARN_AVAILABLE:
             # Stopwords multilingues
             stop_words = self._get_stopwords(self.config.language)
+            # Vocabulaire borné pour les gros corpus: BERTopic a besoin des
+            # noms de features (get_feature_names_out) pour les mots des
+            # topics, un HashingVectorizer n'est donc pas utilisable ici
             vectorizer_model = CountVectorizer(
                 ngram_range=self.config.n_gram_range,
                 stop_words=stop_words,
-                min_df=2
+                min_df=2,
+                max_features=(
+                    self.config.max_vocab_size if self.config.large_corpus else None
+                ),
+                dtype=np.int32
             )
         
         # Representation models
@@ -446,33 +763,8 @@ class BERTopicAnalyzer:
     
     def _get_stopwords(self, language: str) -> Optional[List[str]]:
         """Récupère les stopwords pour une langue."""
-        # Stopwords de base multilingues
-        stopwords = {
-            "french": ["le", "la", "les", "de", "du", "des", "un", "une", "et", "en", "à", "au", "aux", 
-                      "ce", "cette", "ces", "qui", "que", "quoi", "dont", "où", "pour", "par", "sur",
-                      "avec", "sans", "sous", "dans", "est", "sont", "a", "ont", "être", "avoir",
-                      "je", "tu", "il", "elle", "nous", "vous", "ils", "elles", "se", "ne", "pas"],
-            "english": ["the", "a", "an", "is", "are", "was", "were", "be", "been", "being",
-                       "have", "has", "had", "do", "does", "did", "will", "would", "could", "should",
-                       "may", "might", "must", "shall", "can", "need", "to", "of", "in", "for",
-                       "on", "with", "at", "by", "from", "as", "into", "through", "during",
-                       "before", "after", "above", "below", "between", "under", "again", "further",
-                       "then", "once", "here", "there", "when", "where", "why", "how", "all", "each",
-                       "few", "more", "most", "other", "some", "such", "no", "nor", "not", "only",
-                       "own", "same", "so", "than", "too", "very", "just", "and", "but", "if", "or"],
-            "russian": ["и", "в", "не", "на", "с", "что", "а", "как", "это", "по", "но", "к",
-                       "из", "у", "о", "за", "от", "же", "для", "до", "или", "так", "все",
-                       "он", "она", "они", "мы", "вы", "его", "её", "их", "был", "была", "были",
-                       "быть", "есть", "будет", "этот", "эта", "эти", "тот", "та", "те"]
-        }
-        
-        if language == "multilingual":
-            all_stopwords = []
-            for sw in stopwords.values():
-                all_stopwords.extend(sw)
-            return list(set(all_stopwords))
-        
-        return stopwords.get(language)
+        stopwords = _STOPWORDS.get(language)
+        return list(stopwords) if stopwords is not None else None
     
     def fit_transform(
         self,
@@ -503,9 +795,21 @@ class BERTopicAnalyzer:
         doc_ids = [str(c.get("id", i)) for i, c in enumerate(contents)]
         
         # Filtrer les textes vides
-        valid_indices = [i for i, t in enumerate(texts) if len(t.strip()) > 10]
-        texts = [texts[i] for i in valid_indices]
-        doc_ids = [doc_ids[i] for i in valid_indices]
+        # (strip() seulement si le texte commence/finit par un blanc)
+        mask = np.fromiter(
+            (
+                len(t) > 10
+                and (
+                    not (t[0].isspace() or t[-1].isspace())
+                    or len(t.strip()) > 10
+                )
+                for t in texts
+            ),
+            dtype=bool,
+            count=len(texts)
+        )
+        texts = list(compress(texts, mask))
+        doc_ids = list(compress(doc_ids, mask))
         
         if len(texts) < self.config.min_topic_size:
             logger.warning(f"Not enough documents ({len(texts)}) for topic modeling")
@@ -517,20 +821,23 @@ class BERTopicAnalyzer:
         logger.info(f"Fitting BERTopic on {len(texts)} documents...")
         
         # Calcul des embeddings (pour réutilisation)
-        embeddings = None
-        if isinstance(self._embedding_model, SentenceTransformer):
-            embeddings = self._embedding_model.encode(texts, show_progress_bar=False)
+        embeddings = self._precompute_embeddings(texts)
+        
+        # Labels de guidage: None si aucun seed ne correspond (évite le
+        # passage UMAP supervisé de BERTopic)
+        y = None
+        if self.config.seed_topic_list:
+            labels = np.asarray(
+                self._create_seed_labels(texts, self.config.seed_topic_list)
+            )
+            if np.any(labels != -1):
+                y = labels
+            else:
+                logger.debug("No seed keyword matched, running unsupervised")
         
         # Fit transform
         try:
-            if self.config.seed_topic_list:
-                topics, probs = self.model.fit_transform(
-                    texts,
-                    embeddings=embeddings,
-                    y=self._create_seed_labels(texts, self.config.seed_topic_list)
-                )
-            else:
-                topics, probs = self.model.fit_transform(texts, embeddings=embeddings)
+            topics, probs = self.model.fit_transform(texts, embeddings=embeddings, y=y)
         except Exception as e:
             logger.error(f"BERTopic fit_transform error: {e}")
             return TopicModelResult(config=self.config, statistics={"error": str(e)})
@@ -540,10 +847,12 @@ class BERTopicAnalyzer:
         assignments = self._create_assignments(doc_ids, texts, topics, probs)
         
         # Évolution temporelle
-        topic_evolution = {}
+        evolution_matrix = evolution_topic_ids = evolution_timestamps = None
         if compute_evolution and timestamps:
-            valid_timestamps = [timestamps[i] for i in valid_indices]
-            topic_evolution = self._compute_topic_evolution(topics, valid_timestamps)
+            valid_timestamps = list(compress(timestamps, mask))
+            evolution_matrix, evolution_topic_ids, evolution_timestamps = (
+                self._compute_topic_evolution(topics, valid_timestamps)
+            )
         
         # Statistiques
         statistics = self._compute_statistics(topics, result_topics)
@@ -553,7 +862,9 @@ class BERTopicAnalyzer:
         result = TopicModelResult(
             topics=result_topics,
             assignments=assignments,
-            topic_evolution=topic_evolution,
+            evolution_matrix=evolution_matrix,
+            evolution_topic_ids=evolution_topic_ids,
+            evolution_timestamps=evolution_timestamps,
             embeddings=embeddings,
             config=self.config,
             statistics=statistics,
@@ -569,26 +880,47 @@ class BERTopicAnalyzer:
     
     def transform(
         self,
-        contents: List[Dict[str, Any]]
+        contents: List[Dict[str, Any]],
+        chunk_size: int = 50_000
     ) -> List[DocumentTopicAssignment]:
         """
         Assigne des topics à de nouveaux documents (modèle déjà entraîné).
         
+        Les documents sont traités par blocs de chunk_size pour borner
+        la mémoire des embeddings (chunk_size * dim * 4 octets).
+        
         Args:
             contents: Nouveaux contenus à classifier
+            chunk_size: Nombre de documents par bloc
             
         Returns:
             Liste d'assignations
         """
         if not self.is_fitted:
             raise ValueError("Model not fitted. Call fit_transform first.")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
         
-        texts = [c.get("text", "") for c in contents]
-        doc_ids = [str(c.get("id", i)) for i, c in enumerate(contents)]
+        assignments: List[DocumentTopicAssignment] = []
         
-        topics, probs = self.model.transform(texts)
+        for start in range(0, len(contents), chunk_size):
+            chunk = contents[start:start + chunk_size]
+            texts = [c.get("text", "") for c in chunk]
+            doc_ids = [
+                str(c.get("id", start + i)) for i, c in enumerate(chunk)
+            ]
+            
+            embeddings = self._precompute_embeddings(texts)
+            try:
+                topics, probs = self.model.transform(texts, embeddings=embeddings)
+            finally:
+                del embeddings
+            
+            assignments.extend(
+                self._create_assignments(doc_ids, texts, topics, probs)
+            )
         
-        return self._create_assignments(doc_ids, texts, topics, probs)
+        return assignments
     
     def get_topic_info(self) -> pd.DataFrame:
         """Récupère les informations sur tous les topics."""
@@ -686,10 +1018,13 @@ class BERTopicAnalyzer:
     
     def save(self, path: str) -> str:
         """
-        Sauvegarde le modèle.
+        Sauvegarde le modèle au format safetensors.
+        
+        Seuls les topics, embeddings de topics et c-TF-IDF sont écrits:
+        UMAP/HDBSCAN et le modèle d'embedding ne sont pas picklés.
         
         Args:
-            path: Chemin de sauvegarde
+            path: Répertoire de sauvegarde
             
         Returns:
             Chemin du modèle sauvegardé
@@ -698,9 +1033,14 @@ class BERTopicAnalyzer:
             raise ValueError("Model not fitted.")
         
         save_path = Path(path)
-        save_path.parent.mkdir(parents=True, exist_ok=True)
+        save_path.mkdir(parents=True, exist_ok=True)
         
-        self.model.save(str(save_path))
+        self.model.save(
+            str(save_path),
+            serialization="safetensors",
+            save_ctfidf=True,
+            save_embedding_model=False
+        )
         logger.info(f"BERTopic model saved to {save_path}")
         
         return str(save_path)
@@ -709,46 +1049,138 @@ class BERTopicAnalyzer:
         """
         Charge un modèle sauvegardé.
         
+        Un modèle safetensors n'embarque ni UMAP ni HDBSCAN: transform()
+        assigne alors les topics par similarité cosinus avec les embeddings
+        de topics (un produit matriciel) au lieu de ré-exécuter le clustering.
+        
         Args:
             path: Chemin du modèle
         """
         if not self.is_available:
             raise ValueError("BERTopic not available")
         
-        self.model = BERTopic.load(path)
+        self.model = BERTopic.load(path, embedding_model=self.config.embedding_model)
         logger.info(f"BERTopic model loaded from {path}")
     
+    def close(self) -> None:
+        """
+        Détache l'analyseur du pool d'encodage multi-GPU.
+        
+        Le pool est partagé par modèle et arrêté à la sortie du process.
+        """
+        self._pool = None
+    
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        """Encode des textes (embeddings normalisés, par batch)."""
+        if self._pool is not None:
+            # Tri par longueur avant découpage en chunks: chaque worker reçoit
+            # des textes de longueur proche (moins de padding par batch).
+            # encode() fait déjà ce tri en interne dans le cas mono-process.
+            order = np.argsort([len(t) for t in texts], kind="stable")
+            with _encode_pool_lock:
+                embeddings = self._embedding_model.encode_multi_process(
+                    [texts[i] for i in order], self._pool,
+                    batch_size=self.config.batch_size
+                )
+            embeddings = embeddings[np.argsort(order)]
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            return embeddings / np.maximum(norms, 1e-12)
+        
+        return self._embedding_model.encode(
+            texts,
+            batch_size=self.config.batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False
+        )
+    
+    def _precompute_embeddings(self, texts: List[str]) -> Optional[np.ndarray]:
+        """
+        Embeddings calculés localement, ou None pour laisser BERTopic encoder.
+        
+        Sans SentenceTransformer chargé (modèle rechargé via load(), ou
+        sentence_transformers absent: _embedding_model vaut None ou un nom
+        de modèle), BERTopic utilise son propre modèle d'embedding.
+        """
+        if not (
+            SENTENCE_TRANSFORMERS_AVAILABLE
+            and isinstance(self._embedding_model, SentenceTransformer)
+        ):
+            return None
+        # FP32 contigu: pas de copie/upcast FP64 dans UMAP et BERTopic
+        return np.ascontiguousarray(self._embed(texts), dtype=np.float32)
+    
+    def _embed(self, texts: List[str]) -> np.ndarray:
+        """
+        Calcule les embeddings en réutilisant le cache LRU par texte.
+        
+        Les doublons exacts ne sont encodés qu'une fois, de même que les
+        textes déjà présents dans le cache; le résultat est réassemblé dans
+        l'ordre d'origine.
+        """
+        cache_size = self.config.embedding_cache_size
+        if cache_size <= 0:
+            unique, inverse = np.unique(
+                np.asarray(texts, dtype=object), return_inverse=True
+            )
+            if len(unique) == len(texts):
+                return self._encode(texts)
+            return self._encode(unique.tolist())[inverse]
+        
+        cache = self._embeddings_cache
+        keys = [_hash_text(t) for t in texts]
+        
+        # Textes non encore encodés (dédupliqués)
+        missing: Dict[bytes, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in cache and key not in missing:
+                missing[key] = text
+        
+        if missing:
+            vectors = self._encode(list(missing.values()))
+            cache.update(zip(missing.keys(), vectors))
+            logger.debug(
+                f"Embeddings: {len(missing)} encoded, "
+                f"{len(texts) - len(missing)} from cache"
+            )
+        
+        embeddings = np.empty(
+            (len(keys), cache[keys[0]].shape[0]), dtype=np.float32
+        )
+        for i, key in enumerate(keys):
+            embeddings[i] = cache[key]
+            cache.move_to_end(key)
+        
+        while len(cache) > cache_size:
+            cache.popitem(last=False)
+        
+        return embeddings
+    
     def _extract_topics(self) -> List[Topic]:
         """Extrait les topics du modèle."""
-        topics = []
-        
         topic_info = self.model.get_topic_info()
         
-        for _, row in topic_info.iterrows():
-            topic_id = row["Topic"]
-            
-            # Récupérer les mots-clés
-            keywords = self.model.get_topic(topic_id)
-            if keywords is None:
-                keywords = []
+        # Récupération groupée des mots-clés et documents représentatifs
+        all_keywords = self.model.get_topics() or {}
+        try:
+            all_rep_docs = self.model.get_representative_docs() or {}
+        except Exception:
+            all_rep_docs = {}
+        
+        topics = []
+        for row in topic_info.itertuples(index=False):
+            topic_id = int(row.Topic)
             
-            # Récupérer les documents représentatifs
-            rep_docs = []
-            try:
-                rep_docs = self.model.get_representative_docs(topic_id)
-                if rep_docs:
-                    rep_docs = [doc[:200] for doc in rep_docs[:3]]
-            except Exception:
-                pass
+            keywords = all_keywords.get(topic_id) or []
+            rep_docs = [doc[:200] for doc in (all_rep_docs.get(topic_id) or [])[:3]]
             
-            topic = Topic(
+            topics.append(Topic(
                 topic_id=topic_id,
-                name=row.get("Name", f"Topic_{topic_id}"),
+                name=getattr(row, "Name", f"Topic_{topic_id}"),
                 keywords=keywords,
-                size=int(row.get("Count", 0)),
+                size=int(getattr(row, "Count", 0)),
                 representative_docs=rep_docs
-            )
-            topics.append(topic)
+            ))
         
         return topics
     
@@ -760,74 +1192,104 @@ class BERTopicAnalyzer:
         probs: Optional[np.ndarray]
     ) -> List[DocumentTopicAssignment]:
         """Crée les assignations document-topic."""
-        assignments = []
-        
-        for i, (doc_id, text, topic_id) in enumerate(zip(doc_ids, texts, topics)):
-            prob = 1.0
-            if probs is not None and len(probs) > i:
-                if isinstance(probs[i], np.ndarray):
-                    prob = float(np.max(probs[i]))
-                else:
-                    prob = float(probs[i]) if probs[i] is not None else 1.0
-            
-            assignment = DocumentTopicAssignment(
+        n = len(doc_ids)
+        
+        # Probabilité max par document en une seule réduction
+        max_probs = np.ones(n, dtype=np.float64)
+        if probs is not None:
+            probs = np.asarray(probs, dtype=np.float64)
+            if probs.ndim == 2:
+                probs = probs.max(axis=1)
+            m = min(n, probs.shape[0])
+            max_probs[:m] = np.nan_to_num(probs[:m], nan=1.0)
+        
+        previews = [text[:100] for text in texts]
+        
+        return [
+            DocumentTopicAssignment(
                 doc_id=doc_id,
                 topic_id=int(topic_id),
-                probability=prob,
-                text_preview=text[:100]
+                probability=float(prob),
+                text_preview=preview
             )
-            assignments.append(assignment)
-        
-        return assignments
+            for doc_id, preview, topic_id, prob in zip(
+                doc_ids, previews, topics, max_probs
+            )
+        ]
     
     def _compute_topic_evolution(
         self,
         topics: List[int],
         timestamps: List[datetime]
-    ) -> Dict[int, TopicEvolution]:
-        """Calcule l'évolution des topics dans le temps."""
-        evolution = {}
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Calcule l'évolution des topics dans le temps.
         
-        # Grouper par période (jour)
-        topic_time_counts: Dict[int, Dict[str, int]] = {}
+        Returns:
+            (matrice int32 de shape (num_topics, num_days),
+             topic IDs des lignes, jours des colonnes en datetime64[s])
+        """
+        df = pd.DataFrame({
+            "t": np.asarray(topics, dtype=np.int64),
+            "d": pd.to_datetime(timestamps, utc=True).tz_localize(None).floor("D"),
+        })
+        
+        # Ignorer les outliers
+        df = df[df["t"] != -1]
+        
+        if df.empty:
+            return (
+                np.zeros((0, 0), dtype=np.int32),
+                np.zeros(0, dtype=np.int64),
+                np.zeros(0, dtype="datetime64[s]")
+            )
         
-        for topic_id, ts in zip(topics, timestamps):
-            if topic_id == -1:
-                continue
-            
-            day_key = ts.strftime("%Y-%m-%d")
-            
-            if topic_id not in topic_time_counts:
-                topic_time_counts[topic_id] = {}
-            
-            if day_key not in topic_time_counts[topic_id]:
-                topic_time_counts[topic_id][day_key] = 0
-            
-            topic_time_counts[topic_id][day_key] += 1
+        # Grouper par période (jour), y compris les jours sans document
+        counts = df.groupby(["t", "d"]).size().unstack(fill_value=0)
+        day_bins = pd.date_range(counts.columns.min(), counts.columns.max(), freq="D")
+        counts = counts.reindex(columns=day_bins, fill_value=0)
         
-        # Convertir en TopicEvolution
-        for topic_id, day_counts in topic_time_counts.items():
-            sorted_days = sorted(day_counts.keys())
-            
-            evo = TopicEvolution(
-                topic_id=topic_id,
-                timestamps=[datetime.strptime(d, "%Y-%m-%d") for d in sorted_days],
-                frequencies=[day_counts[d] for d in sorted_days]
-            )
-            evo.trend = evo.compute_trend()
-            
-            evolution[topic_id] = evo
+        matrix = counts.to_numpy(dtype=np.int32)
+        topic_ids = counts.index.to_numpy(dtype=np.int64)
         
-        return evolution
+        return matrix, topic_ids, day_bins.to_numpy().astype("datetime64[s]")
     
     def _create_seed_labels(
         self,
         texts: List[str],
         seed_topics: List[List[str]]
     ) -> List[int]:
-        """Crée des labels pour le guided topic modeling."""
+        """
+        Crée des labels pour le guided topic modeling.
+        
+        Chaque texte reçoit l'index du premier seed topic dont un mot-clé
+        apparaît dans le texte (-1 sinon).
+        """
         labels = [-1] * len(texts)
         
+        if not any(seed_topics):
+            return labels
+        
+        if AHOCORASICK_AVAILABLE:
+            # Un seul automate pour tous les mots-clés, un passage par texte
+            automaton = ahocorasick.Automaton()
+            for topic_idx, keywords in enumerate(seed_topics):
+                for kw in keywords:
+                    kw_lower = kw.lower()
+                    if kw_lower and kw_lower not in automaton:
+                        automaton.add_word(kw_lower, topic_idx)
+            
+            if len(automaton) == 0:
+                return labels
+            automaton.make_automaton()
+            
+            for i, text in enumerate(texts):
+                matched = [tid for _, tid in automaton.iter(text.lower())]
+                if matched:
+                    labels[i] = min(matched)
+            
+            return labels
+        
         for i, text in enumerate(texts):
             text_lower = text.lower()
             for topic_idx, keywords in enumerate(seed_topics):
@@ -843,17 +1305,27 @@ class BERTopicAnalyzer:
         result_topics: List[Topic]
     ) -> Dict[str, Any]:
         """Calcule les statistiques du modèle."""
-        topic_counts = Counter(topics)
+        t = np.asarray(topics, dtype=np.int32)
+        sizes = np.array(
+            [x.size for x in result_topics if not x.is_outlier], dtype=np.int64
+        )
+        
+        # Décalage de 1: l'index 0 compte les outliers (-1)
+        counts = np.bincount(t + 1) if t.size else np.zeros(1, dtype=np.int64)
+        outlier_count = int(counts[0])
+        present = np.flatnonzero(counts)
         
         stats = {
-            "total_documents": len(topics),
-            "num_topics": len([t for t in result_topics if not t.is_outlier]),
-            "outlier_count": topic_counts.get(-1, 0),
-            "outlier_percentage": topic_counts.get(-1, 0) / len(topics) * 100 if topics else 0,
-            "avg_topic_size": np.mean([t.size for t in result_topics if not t.is_outlier]) if result_topics else 0,
-            "max_topic_size": max((t.size for t in result_topics if not t.is_outlier), default=0),
-            "min_topic_size": min((t.size for t in result_topics if not t.is_outlier), default=0),
-            "topic_distribution": dict(topic_counts)
+            "total_documents": int(t.size),
+            "num_topics": int(sizes.size),
+            "outlier_count": outlier_count,
+            "outlier_percentage": outlier_count / t.size * 100 if t.size else 0,
+            "avg_topic_size": float(sizes.mean()) if sizes.size else 0,
+            "max_topic_size": int(sizes.max(initial=0)),
+            "min_topic_size": int(sizes.min()) if sizes.size else 0,
+            "topic_distribution": dict(
+                zip((present - 1).tolist(), counts[present].tolist())
+            )
         }
         
         return stats
@@ -871,6 +1343,9 @@ def extract_topics(
     """
     Fonction de convenance pour extraire les topics.
     
+    L'analyseur (SentenceTransformer, UMAP, HDBSCAN) est réutilisé entre
+    les appels de mêmes paramètres; clear_topic_analyzers() les libère.
+    
     Args:
         contents: Liste de contenus avec 'id' et 'text'
         min_topic_size: Taille minimum d'un topic
@@ -879,12 +1354,80 @@ def extract_topics(
     Returns:
         TopicModelResult
     """
-    config = BERTopicConfig(
-        min_topic_size=min_topic_size,
-        language=language
+    analyzer = _get_topic_analyzer(
+        language, min_topic_size, DEFAULT_EMBEDDING_MODEL
     )
-    analyzer = BERTopicAnalyzer(config=config)
-    return analyzer.fit_transform(contents)
+    # fit_transform modifie model, topics et le cache d'embeddings
+    with analyzer._lock:
+        return analyzer.fit_transform(contents)
+
+
+# Analyseurs partagés par extract_topics, du moins au plus récemment utilisé
+_TOPIC_ANALYZERS_MAX = 8
+_topic_analyzers: "OrderedDict[Tuple[str, int, str], BERTopicAnalyzer]" = OrderedDict()
+_topic_analyzers_lock = threading.Lock()
+
+
+def _get_topic_analyzer(
+    language: str,
+    min_topic_size: int,
+    embedding_model: str
+) -> BERTopicAnalyzer:
+    """
+    Analyseur partagé entre les appels à extract_topics (modèles déjà chargés).
+    
+    Jusqu'à _TOPIC_ANALYZERS_MAX analyseurs restent en mémoire, chacun avec
+    ses modèles UMAP/HDBSCAN et son cache d'embeddings; le moins
+    récemment utilisé est fermé quand la limite est dépassée, une fois
+    terminé l'appel qui l'utilise encore.
+    """
+    key = (language, min_topic_size, embedding_model)
+    evicted = None
+    with _topic_analyzers_lock:
+        analyzer = _topic_analyzers.get(key)
+        if analyzer is not None:
+            _topic_analyzers.move_to_end(key)
+            return analyzer
+        
+        config = BERTopicConfig(
+            min_topic_size=min_topic_size,
+            language=language,
+            embedding_model=embedding_model
+        )
+        analyzer = BERTopicAnalyzer(config=config)
+        _topic_analyzers[key] = analyzer
+        
+        if len(_topic_analyzers) > _TOPIC_ANALYZERS_MAX:
+            _, evicted = _topic_analyzers.popitem(last=False)
+    
+    if evicted is not None:
+        _close_topic_analyzer(evicted)
+    
+    return analyzer
+
+
+def _close_topic_analyzer(analyzer: BERTopicAnalyzer) -> None:
+    """Ferme un analyseur partagé dès qu'aucun appel ne l'utilise."""
+    with analyzer._lock:
+        try:
+            analyzer.close()
+        except Exception as e:
+            logger.warning(f"Failed to close topic analyzer: {e}")
+
+
+def clear_topic_analyzers() -> None:
+    """
+    Ferme les analyseurs partagés d'extract_topics puis vide leur cache.
+    
+    Le prochain appel à extract_topics recrée un modèle neuf; le
+    SentenceTransformer et le pool d'encodage multi-GPU restent partagés.
+    """
+    with _topic_analyzers_lock:
+        analyzers = list(_topic_analyzers.values())
+        _topic_analyzers.clear()
+    
+    for analyzer in analyzers:
+        _close_topic_analyzer(analyzer)
 
 
 def find_similar_topics(
@@ -926,8 +1469,10 @@ __all__ = [
     
     # Convenience functions
     "extract_topics",
+    "clear_topic_analyzers",
     "find_similar_topics",
     
-    # Availability flag
+    # Availability
     "BERTOPIC_AVAILABLE",
+    "bertopic_available",
 ]
@@ -5,32 +5,201 @@ Abstract base class for all collectors.
 Provides common functionality for content collection.
 """
 
+import pickle
+import re
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Set
 from pathlib import Path
 
 import yaml
 from loguru import logger
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+try:
+    from pybloom_live import ScalableBloomFilter
+    BLOOM_AVAILABLE = True
+except ImportError:
+    BLOOM_AVAILABLE = False
+
+try:
+    from datasketch import MinHash, MinHashLSH
+    DATASKETCH_AVAILABLE = True
+except ImportError:
+    DATASKETCH_AVAILABLE = False
 
 from database import (
-    get_session,
+    ScopedSession,
     Source,
     Content,
     CollectionRun,
     CollectionResult,
     SourceType,
+    refresh_dashboard_stats,
 )
 from config.settings import settings
 
 
+@lru_cache(maxsize=8)
+def _load_config_cached(path: str, mtime: float) -> dict:
+    """
+    Parse a YAML configuration file, memoized per path and mtime.
+    
+    The returned dict is shared between collectors and must be
+    treated as read-only.
+    
+    Args:
+        path: Absolute path to configuration file
+        mtime: File modification time (invalidates the cache on change)
+        
+    Returns:
+        dict: Parsed configuration
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        config = yaml.load(f, Loader=YamlLoader)
+        logger.debug(f"Loaded config from {path}")
+        return config or {}
+
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into casefolded Unicode words (any script)."""
+    return _WORD_RE.findall(text.casefold())
+
+
+class NearDupFilter:
+    """
+    In-memory near-duplicate text filter (MinHash-LSH).
+    
+    Texts are tokenised into casefolded Unicode words and shingled into
+    word n-grams; a text is a near-duplicate when its estimated Jaccard
+    similarity with an indexed text reaches the threshold. Texts without
+    any word are neither indexed nor matched. Without datasketch the
+    filter is inert and never reports a match.
+    
+    Attributes:
+        threshold: Jaccard similarity above which texts are near-duplicates
+        num_perm: Number of MinHash permutations
+        shingle_size: Words per shingle
+    """
+    
+    def __init__(
+        self,
+        threshold: float = 0.85,
+        num_perm: int = 64,
+        shingle_size: int = 5
+    ):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self._lsh = (
+            MinHashLSH(threshold=threshold, num_perm=num_perm)
+            if DATASKETCH_AVAILABLE else None
+        )
+    
+    @property
+    def enabled(self) -> bool:
+        """True when datasketch is installed."""
+        return self._lsh is not None
+    
+    def _minhash(self, text: str) -> Optional["MinHash"]:
+        """Build the MinHash signature of a text's word shingles (None if no words)."""
+        tokens = tokenize(text)
+        if not tokens:
+            return None
+        n = self.shingle_size
+        if len(tokens) <= n:
+            shingles = {" ".join(tokens)}
+        else:
+            shingles = {
+                " ".join(tokens[i:i + n])
+                for i in range(len(tokens) - n + 1)
+            }
+        
+        minhash = MinHash(num_perm=self.num_perm)
+        minhash.update_batch([s.encode("utf-8") for s in shingles])
+        return minhash
+    
+    def is_duplicate(self, key: str, text: str) -> bool:
+        """
+        Check a text against the index, indexing it when it is new.
+        
+        Args:
+            key: Unique identifier for the text
+            text: Text to check
+            
+        Returns:
+            bool: True if a near-duplicate was already indexed
+        """
+        if self._lsh is None:
+            return False
+        
+        minhash = self._minhash(text)
+        if minhash is None:
+            return False
+        if self._lsh.query(minhash):
+            return True
+        if key not in self._lsh:
+            self._lsh.insert(key, minhash)
+        return False
+    
+    def discard(self, keys: List[str]) -> None:
+        """Remove indexed texts (e.g. after a rolled-back insert)."""
+        if self._lsh is None:
+            return
+        for key in keys:
+            if key in self._lsh:
+                self._lsh.remove(key)
+    
+    def save(self, path: Path) -> None:
+        """Persist the index to disk."""
+        if self._lsh is None:
+            return
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            pickle.dump(self._lsh, f, protocol=pickle.HIGHEST_PROTOCOL)
+    
+    @classmethod
+    def load(cls, path: Path, **kwargs) -> "NearDupFilter":
+        """
+        Load a persisted index, or start an empty one.
+        
+        The state file is written by save() under the local data
+        directory; a missing or unreadable file yields an empty index.
+        """
+        near_dup = cls(**kwargs)
+        path = Path(path)
+        if near_dup._lsh is None or not path.exists():
+            return near_dup
+        
+        try:
+            with open(path, "rb") as f:
+                lsh = pickle.load(f)
+            if lsh.h != near_dup._lsh.h:
+                logger.warning(f"Ignoring {path}: different num_perm")
+            else:
+                near_dup._lsh = lsh
+        except Exception as e:
+            logger.warning(f"Could not load near-duplicate state {path}: {e}")
+        return near_dup
+
+
 class BaseCollector(ABC):
     """
     Abstract base class for content collectors.
     
     Provides common functionality for all collector implementations:
     - Configuration loading
-    - Database session management
+    - Database session management (thread-local scoped session)
     - Collection run tracking
     - Deduplication
     - Error handling
@@ -53,11 +222,12 @@ class BaseCollector(ABC):
             config_path: Path to YAML configuration file
         """
         self.config = self._load_config(config_path)
-        self.session = get_session()
+        self.session = ScopedSession()
         self.run: Optional[CollectionRun] = None
         self._items_new = 0
         self._items_updated = 0
         self._errors: List[str] = []
+        self._hash_filter = None  # Loaded by start_run()
     
     @property
     @abstractmethod
@@ -99,10 +269,42 @@ class BaseCollector(ABC):
             logger.warning(f"Config file not found: {path}, using empty config")
             return {}
         
-        with open(config_file, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
-            logger.debug(f"Loaded config from {config_file}")
-            return config or {}
+        return _load_config_cached(
+            str(config_file.resolve()),
+            config_file.stat().st_mtime
+        )
+    
+    @staticmethod
+    def _new_hash_filter():
+        """
+        Create the in-memory pre-filter of known content hashes.
+        
+        Uses a scalable Bloom filter when pybloom_live is installed,
+        otherwise a plain set of hash prefixes.
+        """
+        if BLOOM_AVAILABLE:
+            return ScalableBloomFilter(initial_capacity=100_000, error_rate=1e-4)
+        return set()
+    
+    @staticmethod
+    def _hash_key(text_hash: str) -> bytes:
+        """
+        Reduce a SHA256 hex digest to the 8-byte key used by the pre-filter.
+        
+        Args:
+            text_hash: SHA256 hash of content text
+            
+        Returns:
+            bytes: First 8 bytes of the digest
+        """
+        return bytes.fromhex(text_hash[:16])
+    
+    def _load_known_hashes(self):
+        """Populate the hash pre-filter from existing content."""
+        self._hash_filter = self._new_hash_filter()
+        
+        for (text_hash,) in self.session.query(Content.text_hash).yield_per(10000):
+            self._hash_filter.add(self._hash_key(text_hash))
     
     def start_run(self) -> CollectionRun:
         """
@@ -122,6 +324,7 @@ class BaseCollector(ABC):
         self._items_new = 0
         self._items_updated = 0
         self._errors = []
+        self._load_known_hashes()
         
         logger.info(f"Started collection run: {self.run.id}")
         return self.run
@@ -148,6 +351,12 @@ class BaseCollector(ABC):
         
         self.session.commit()
         
+        if self._items_new or self._items_updated:
+            try:
+                refresh_dashboard_stats()
+            except Exception as e:
+                logger.warning(f"Could not refresh dashboard stats: {e}")
+        
         duration = (self.run.finished_at - self.run.started_at).total_seconds()
         
         logger.info(
@@ -193,6 +402,9 @@ class BaseCollector(ABC):
         """
         Get existing source or create new one.
         
+        Does not commit: changes are persisted by the caller's next
+        commit (or discarded with its rollback).
+        
         Args:
             name: Source display name
             source_type: Source type category
@@ -224,10 +436,11 @@ class BaseCollector(ABC):
                 Source.source_type == source_type.value
             ).first()
         
+        now = datetime.utcnow()
+        
         if source:
-            # Update last collected timestamp
-            source.last_collected_at = datetime.utcnow()
-            self.session.commit()
+            # Update last collected timestamp (committed with the batch)
+            source.last_collected_at = now
             return source
         
         # Create new source
@@ -242,12 +455,13 @@ class BaseCollector(ABC):
             is_amplifier=is_amplifier,
             is_factchecker=is_factchecker,
             is_active=True,
-            first_seen_at=datetime.utcnow(),
-            last_collected_at=datetime.utcnow()
+            first_seen_at=now,
+            last_collected_at=now
         )
         
+        # Flush only: the caller's batch commit persists the source
         self.session.add(source)
-        self.session.commit()
+        self.session.flush()
         
         logger.info(f"Created new source: {name} ({source_type.value})")
         return source
@@ -256,16 +470,82 @@ class BaseCollector(ABC):
         """
         Check if content with given hash already exists.
         
+        Once a run is started, hashes absent from the in-memory
+        pre-filter are new; only pre-filter hits are confirmed
+        against the database.
+        
         Args:
             text_hash: SHA256 hash of content text
             
         Returns:
             bool: True if content exists
         """
-        return self.session.query(Content).filter(
+        if (
+            self._hash_filter is not None
+            and self._hash_key(text_hash) not in self._hash_filter
+        ):
+            return False
+        
+        return self.session.query(Content.id).filter(
             Content.text_hash == text_hash
         ).first() is not None
     
+    def existing_hashes(self, text_hashes: List[str]) -> Set[str]:
+        """
+        Return the subset of hashes already stored, in a single query.
+        
+        Args:
+            text_hashes: SHA256 hashes of candidate content
+            
+        Returns:
+            set: Hashes that already exist in the database
+        """
+        if self._hash_filter is not None:
+            text_hashes = [
+                h for h in text_hashes
+                if self._hash_key(h) in self._hash_filter
+            ]
+        if not text_hashes:
+            return set()
+        
+        rows = self.session.query(Content.text_hash).filter(
+            Content.text_hash.in_(text_hashes)
+        ).all()
+        return {row[0] for row in rows}
+    
+    def insert_contents(self, rows: List[Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Bulk-insert content rows, skipping hashes already stored.
+        
+        Uses a single INSERT ... ON CONFLICT (text_hash) DO NOTHING,
+        so concurrent collectors cannot insert the same content twice.
+        
+        Args:
+            rows: Content column dicts (all with the same keys)
+            
+        Returns:
+            dict: text_hash -> id of the rows actually inserted
+        """
+        if not rows:
+            return {}
+        
+        stmt = (
+            pg_insert(Content)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=["text_hash"])
+            .returning(Content.id, Content.text_hash)
+        )
+        inserted = {
+            text_hash: content_id
+            for content_id, text_hash in self.session.execute(stmt).all()
+        }
+        
+        if self._hash_filter is not None:
+            for text_hash in inserted:
+                self._hash_filter.add(self._hash_key(text_hash))
+        self._items_new += len(inserted)
+        return inserted
+    
     def add_content(self, content: Content) -> bool:
         """
         Add content if not already exists.
@@ -281,6 +561,8 @@ class BaseCollector(ABC):
             return False
         
         self.session.add(content)
+        if self._hash_filter is not None:
+            self._hash_filter.add(self._hash_key(content.text_hash))
         self._items_new += 1
         return True
     
@@ -293,8 +575,9 @@ class BaseCollector(ABC):
             raise e
     
     def close(self):
-        """Close database session."""
+        """Close database session and release it from the thread registry."""
         self.session.close()
+        ScopedSession.remove()
 
 
 class SyncCollector(BaseCollector):
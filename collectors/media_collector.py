@@ -10,19 +10,47 @@ Usage:
     result = collector.collect_all_sync()
 """
 
-import time
-from datetime import datetime
-from typing import Optional, List, Dict, Any
+import hashlib
+import html
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Tuple
 from urllib.parse import urlparse
 
 import requests
 import feedparser
-from bs4 import BeautifulSoup
-from langdetect import detect, LangDetectException
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from langdetect import DetectorFactory, detect, LangDetectException
+from langdetect.detector_factory import init_factory
 from loguru import logger
+from lxml import etree
+from sqlalchemy import insert
+
+try:
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    import lxml.html
+    SELECTOLAX_AVAILABLE = False
+
+# Deterministic langdetect results across runs
+DetectorFactory.seed = 0
+
+try:
+    import fasttext
+    FASTTEXT_AVAILABLE = True
+except ImportError:
+    FASTTEXT_AVAILABLE = False
 
 from collectors.base import SyncCollector
 from database import (
+    Source,
     Content,
     Factcheck,
     CollectionResult,
@@ -30,9 +58,202 @@ from database import (
     ContentType,
     RSSFeedConfig
 )
+from database.models import generate_uuid
 from config.settings import settings
 
 
+# (entry, title, link, text_content, text_hash) built by _fetch_feed
+FeedCandidate = Tuple[Any, str, str, str, str]
+
+# Elements dropped before extracting article text
+NON_CONTENT_TAGS = ("script", "style", "nav", "footer", "header", "aside")
+NON_CONTENT_SELECTOR = ", ".join(NON_CONTENT_TAGS)
+
+# HTML tags in feed summaries
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+
+# RSS 0.9x/2.0 <item>, RSS 1.0 <item> and Atom <entry>, any namespace
+_FEED_ITEMS_XPATH = "//*[local-name()='item' or local-name()='entry']"
+
+# lxml parsers and XPath objects must not be shared between threads
+_feed_tools = threading.local()
+
+# Entry child element (local name) -> entry key
+_ENTRY_FIELDS = {
+    "title": "title",
+    "link": "link",
+    "guid": "id",
+    "id": "id",
+    "description": "summary",
+    "summary": "summary",
+    "content": "content",
+    "encoded": "content",
+    "pubDate": "published",
+    "published": "published",
+    "issued": "published",
+    "date": "published",
+    "updated": "updated",
+    "modified": "updated",
+}
+
+
+def _parse_entry_date(value: str):
+    """
+    Parse an RSS (RFC 822) or Atom (ISO 8601) date to a UTC time tuple.
+    
+    Args:
+        value: Raw date string
+        
+    Returns:
+        time.struct_time: UTC time tuple or None if unparseable
+    """
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        try:
+            parsed = datetime.fromisoformat(value.strip())
+        except ValueError:
+            return None
+    
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc)
+    return parsed.timetuple()
+
+
+def _get_feed_tools():
+    """
+    Get this thread's compiled feed parser and item XPath.
+    
+    Returns:
+        tuple: (etree.XMLParser, etree.XPath)
+    """
+    tools = getattr(_feed_tools, "tools", None)
+    if tools is None:
+        tools = _feed_tools.tools = (
+            etree.XMLParser(recover=True, huge_tree=False, resolve_entities=False),
+            etree.XPath(_FEED_ITEMS_XPATH),
+        )
+    return tools
+
+
+def _entry_from_element(item) -> Dict[str, Any]:
+    """
+    Convert a feed item element to a feedparser-like entry dict.
+    
+    Only the fields used by the collector are extracted (title, link,
+    id, summary, published_parsed, updated_parsed).
+    
+    Args:
+        item: lxml <item> or <entry> element
+        
+    Returns:
+        dict: Entry fields
+    """
+    entry: Dict[str, Any] = {}
+    
+    for child in item:
+        if not isinstance(child.tag, str):
+            continue  # Comments, processing instructions
+        key = _ENTRY_FIELDS.get(etree.QName(child).localname)
+        if key is None:
+            continue
+        
+        if key == "link":
+            # Atom links carry the URL in href (prefer rel="alternate")
+            href = child.get("href")
+            if href is not None:
+                if child.get("rel", "alternate") == "alternate":
+                    entry["link"] = href
+                continue
+        if key in entry:
+            continue
+        
+        text = "".join(child.itertext()).strip()
+        if not text:
+            continue
+        
+        if key in ("published", "updated"):
+            parsed = _parse_entry_date(text)
+            if parsed is not None:
+                entry[f"{key}_parsed"] = parsed
+        else:
+            entry[key] = text
+    
+    if "summary" not in entry and "content" in entry:
+        entry["summary"] = entry["content"]
+    entry.pop("content", None)
+    
+    return entry
+
+
+@lru_cache(maxsize=1)
+def _load_language_model(path: str):
+    """
+    Load the fastText language identification model once.
+    
+    Args:
+        path: Path to lid.176.ftz / lid.176.bin
+        
+    Returns:
+        fasttext model or None if fastText or the model is unavailable
+    """
+    if not FASTTEXT_AVAILABLE or not Path(path).exists():
+        return None
+    
+    try:
+        return fasttext.load_model(path)
+    except Exception as e:
+        logger.warning(f"Could not load language model {path}: {e}")
+        return None
+
+
+def _strip_html_fast(text: str) -> str:
+    """
+    Strip tags and entities from short HTML fragments (feed summaries).
+    
+    Args:
+        text: HTML fragment
+        
+    Returns:
+        str: Plain text
+    """
+    if "<" not in text and "&" not in text:
+        return text.strip()
+    return html.unescape(_HTML_TAG_RE.sub(" ", text)).strip()
+
+
+def _first_content_node(nodes):
+    """
+    Return the first node not nested inside a non-content element.
+    
+    Args:
+        nodes: Candidate selectolax or lxml nodes, in document order
+        
+    Returns:
+        First matching node or None
+    """
+    for node in nodes:
+        if isinstance(node, etree._Element):
+            if next(node.iterancestors(*NON_CONTENT_TAGS), None) is None:
+                return node
+            continue
+        
+        parent = node.parent
+        while parent is not None and parent.tag not in NON_CONTENT_TAGS:
+            parent = parent.parent
+        if parent is None:
+            return node
+    return None
+
+
+def _join_text(node) -> str:
+    """Join the stripped text fragments of an lxml element."""
+    return " ".join(
+        fragment.strip() for fragment in node.itertext() if fragment.strip()
+    )
+
+
 class MediaCollector(SyncCollector):
     """
     Collector for RSS feeds from media outlets and fact-checkers.
@@ -43,9 +264,9 @@ class MediaCollector(SyncCollector):
     Features:
     - RSS/Atom feed parsing
     - Full article text extraction (optional)
-    - Language detection
+    - Language detection (batched with fastText when available)
     - Fact-check record creation
-    - Rate limiting between requests
+    - Concurrent feed fetching with per-host rate limiting
     
     Attributes:
         headers: HTTP request headers
@@ -72,16 +293,50 @@ class MediaCollector(SyncCollector):
             "Accept-Language": "en-US,en;q=0.5,fr;q=0.3,ru;q=0.2"
         }
         self.timeout = settings.request_timeout
+        
+        # Pooled HTTP session (keep-alive across article fetches)
+        self._http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=[502, 503, 504]
+            )
+        )
+        self._http.mount("http://", adapter)
+        self._http.mount("https://", adapter)
+        self._http.headers.update(self.headers)
+        
+        # Load langdetect profiles once, up front (not on first detect())
+        init_factory()
+        
+        # Feed cache validators: url -> (etag, last_modified)
+        self._feed_validators: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        self._new_feed_validators: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        
+        # Per-host rate limiting for concurrent fetches
+        self._host_slots: Dict[str, threading.Semaphore] = {}
+        self._host_slots_lock = threading.Lock()
     
     @property
     def collector_type(self) -> str:
         """Return collector type identifier."""
         return "media"
     
+    def close(self):
+        """Close HTTP and database sessions."""
+        self._http.close()
+        super().close()
+    
     def _detect_language(self, text: str) -> str:
         """
         Detect language of text.
         
+        Only the first 400 characters are analyzed, which is enough
+        for a reliable guess and much faster on long articles.
+        
         Args:
             text: Text to analyze
             
@@ -92,10 +347,42 @@ class MediaCollector(SyncCollector):
             return "unknown"
         
         try:
-            return detect(text)
+            return detect(text[:400])
         except LangDetectException:
             return "unknown"
     
+    def _detect_languages(self, texts: List[str]) -> List[str]:
+        """
+        Detect languages of several texts in one batch.
+        
+        Uses a single fastText prediction call when the model is
+        available, per-text langdetect otherwise.
+        
+        Args:
+            texts: Texts to analyze
+            
+        Returns:
+            list: ISO language codes or 'unknown', in input order
+        """
+        model = _load_language_model(settings.language_model_path)
+        if model is None:
+            return [self._detect_language(text) for text in texts]
+        
+        languages = ["unknown"] * len(texts)
+        indices = [i for i, text in enumerate(texts) if text and len(text) >= 20]
+        if not indices:
+            return languages
+        
+        labels, probs = model.predict(
+            [texts[i].replace("\n", " ")[:500] for i in indices],
+            k=1
+        )
+        for i, label, prob in zip(indices, labels, probs):
+            if prob[0] >= 0.5:
+                languages[i] = label[0].replace("__label__", "")
+        
+        return languages
+    
     def _parse_feed_date(self, entry: dict) -> Optional[datetime]:
         """
         Parse publication date from feed entry.
@@ -129,38 +416,15 @@ class MediaCollector(SyncCollector):
             str: Extracted text or None on failure
         """
         try:
-            response = requests.get(
-                url,
-                headers=self.headers,
-                timeout=self.timeout,
-                allow_redirects=True
-            )
+            with self._host_slot(url):
+                response = self._http.get(
+                    url,
+                    timeout=self.timeout,
+                    allow_redirects=True
+                )
             response.raise_for_status()
             
-            # Parse HTML
-            soup = BeautifulSoup(response.content, "lxml")
-            
-            # Remove non-content elements
-            for element in soup(["script", "style", "nav", "footer", "header", "aside"]):
-                element.decompose()
-            
-            # Try to find article content
-            article = soup.find("article")
-            if article:
-                return article.get_text(separator=" ", strip=True)
-            
-            # Fallback to main content
-            main = soup.find("main")
-            if main:
-                return main.get_text(separator=" ", strip=True)
-            
-            # Last resort: body text (limited)
-            body = soup.find("body")
-            if body:
-                text = body.get_text(separator=" ", strip=True)
-                return text[:10000] if len(text) > 10000 else text
-            
-            return None
+            return self._html_to_text(response.content)
             
         except requests.RequestException as e:
             logger.debug(f"Failed to fetch {url}: {e}")
@@ -169,6 +433,75 @@ class MediaCollector(SyncCollector):
             logger.debug(f"Error extracting text from {url}: {e}")
             return None
     
+    @staticmethod
+    def _html_to_text(page: bytes) -> Optional[str]:
+        """
+        Extract main text from an HTML page.
+        
+        Looks for <article>, then <main>, then the (truncated) body,
+        ignoring containers nested in non-content elements, and removes
+        non-content elements from the chosen container only. Uses
+        selectolax when installed, lxml otherwise.
+        
+        Args:
+            page: Raw HTML content
+            
+        Returns:
+            str: Extracted text or None if no content node found
+        """
+        if SELECTOLAX_AVAILABLE:
+            tree = HTMLParser(page)
+            
+            # Locate the container first, then clean only that subtree
+            node = _first_content_node(tree.css("article"))
+            if node is None:
+                node = _first_content_node(tree.css("main"))
+            truncate = node is None
+            if truncate:
+                node = tree.body
+                if node is None:
+                    return None
+            
+            # Remove non-content elements (single selector, one traversal)
+            for noise in node.css(NON_CONTENT_SELECTOR):
+                noise.decompose()
+            text = node.text(separator=" ", strip=True)
+        else:
+            tree = lxml.html.fromstring(page)
+            
+            # Locate the container first, then clean only that subtree
+            node = _first_content_node(tree.iterfind(".//article"))
+            if node is None:
+                node = _first_content_node(tree.iterfind(".//main"))
+            truncate = node is None
+            if truncate:
+                node = tree.find(".//body")
+                if node is None:
+                    return None
+            
+            # Remove non-content elements (single C-level traversal)
+            etree.strip_elements(node, *NON_CONTENT_TAGS, with_tail=False)
+            text = _join_text(node)
+        
+        if not truncate:
+            return text
+        
+        # Last resort: body text (limited)
+        return text[:10000] if len(text) > 10000 else text
+    
+    @staticmethod
+    def _summary_is_sufficient(summary: str) -> bool:
+        """
+        Check whether a feed summary is long enough to skip full-text fetch.
+        
+        Args:
+            summary: Entry summary (plain text)
+            
+        Returns:
+            bool: True if the summary reaches settings.full_text_min_chars
+        """
+        return len(summary) >= settings.full_text_min_chars
+    
     def _parse_feed_config(self, config: dict) -> RSSFeedConfig:
         """
         Parse feed configuration from dict.
@@ -186,14 +519,130 @@ class MediaCollector(SyncCollector):
             feed_type=config.get("type", "media")
         )
     
-    def collect_feed(
+    def _host_slot(self, url: str) -> threading.Semaphore:
+        """
+        Get the per-host slot used to rate-limit requests.
+        
+        Requests to the same host are serialized while different
+        hosts are fetched concurrently.
+        
+        Args:
+            url: Request URL
+            
+        Returns:
+            threading.Semaphore: Slot for the URL host
+        """
+        host = urlparse(url).netloc
+        with self._host_slots_lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.Semaphore(1)
+        return slot
+    
+    def _parse_feed_fast(self, url: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Download and parse a RSS/Atom feed with lxml.
+        
+        Only the entry fields used by the collector are extracted.
+        Falls back to feedparser when lxml cannot recover any entry.
+        Sends If-None-Match / If-Modified-Since when validators are
+        known; an unchanged feed (304) yields no entries.
+        
+        Args:
+            url: Feed URL
+            
+        Returns:
+            list: Entry dicts (feedparser-compatible keys), or None
+                if the feed could not be fetched or parsed
+        """
+        # Conditional GET with the validators from the previous fetch
+        headers = {}
+        etag, last_modified = self._feed_validators.get(url, (None, None))
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        
+        try:
+            response = self._http.get(url, headers=headers, timeout=self.timeout)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.debug(f"Failed to fetch feed {url}: {e}")
+            return None
+        
+        if response.status_code == 304:
+            logger.debug(f"Feed not modified: {url}")
+            return []
+        
+        entries = self._parse_feed_bytes(response.content)
+        if entries is not None:
+            self._new_feed_validators[url] = (
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified")
+            )
+        return entries
+    
+    @staticmethod
+    def _parse_feed_bytes(raw: bytes) -> Optional[List[Dict[str, Any]]]:
+        """
+        Parse RSS/Atom feed content.
+        
+        Args:
+            raw: Feed document bytes
+            
+        Returns:
+            list: Entry dicts, or None if the feed could not be parsed
+        """
+        parser, find_items = _get_feed_tools()
+        try:
+            root = etree.fromstring(raw, parser=parser)
+        except etree.XMLSyntaxError:
+            root = None
+        
+        if root is not None:
+            items = find_items(root)
+            if items:
+                return [_entry_from_element(item) for item in items]
+        
+        # Fallback: feedparser is slower but more lenient (summaries are
+        # stripped with _strip_html_fast, so its sanitizer is not needed)
+        feed = feedparser.parse(
+            raw,
+            resolve_relative_uris=False,
+            sanitize_html=False
+        )
+        if feed.bozo and not feed.entries:
+            return None
+        return feed.entries
+    
+    def _load_feed_validators(self, urls: List[str]):
+        """
+        Load stored ETag / Last-Modified validators for feed URLs.
+        
+        Args:
+            urls: Feed URLs
+        """
+        urls = [url for url in urls if url]
+        if not urls:
+            return
+        
+        rows = self.session.query(
+            Source.url, Source.feed_etag, Source.feed_last_modified
+        ).filter(Source.url.in_(urls)).all()
+        
+        for url, etag, last_modified in rows:
+            self._feed_validators[url] = (etag, last_modified)
+    
+    def _fetch_feed(
         self,
         feed_config: RSSFeedConfig,
         extract_full_text: bool = False,
         limit: int = 50
-    ) -> int:
+    ) -> Optional[List[FeedCandidate]]:
         """
-        Collect articles from a single RSS feed.
+        Fetch and parse a feed (network only, no database access).
+        
+        Safe to run from worker threads.
         
         Args:
             feed_config: Feed configuration
@@ -201,48 +650,35 @@ class MediaCollector(SyncCollector):
             limit: Maximum entries to process
             
         Returns:
-            int: Number of new articles collected
+            list: (entry, title, link, text_content, text_hash) tuples,
+                or None if the feed could not be fetched
         """
         if not feed_config.url:
             logger.warning(f"Missing URL for feed: {feed_config.name}")
-            return 0
-        
-        collected_count = 0
+            return None
         
         try:
             # Parse feed
             logger.debug(f"Parsing feed: {feed_config.url}")
-            feed = feedparser.parse(feed_config.url)
+            with self._host_slot(feed_config.url):
+                entries = self._parse_feed_fast(feed_config.url)
             
             # Check for errors
-            if feed.bozo and not feed.entries:
+            if entries is None:
                 logger.warning(f"Invalid feed: {feed_config.url}")
-                return 0
-            
-            # Determine source type
-            source_type = (
-                SourceType.FACTCHECK 
-                if feed_config.feed_type == "factcheck" 
-                else SourceType.MEDIA
-            )
-            
-            # Get or create source
-            source = self.get_or_create_source(
-                name=feed_config.name,
-                source_type=source_type,
-                platform="web",
-                url=feed_config.url,
-                language=feed_config.language,
-                is_factchecker=feed_config.feed_type == "factcheck"
-            )
+                return None
             
-            # Process entries
-            for entry in feed.entries[:limit]:
+            # Build candidates (hash computed before any DB access)
+            candidates = []
+            seen_keys = set()
+            for entry in entries[:limit]:
                 try:
                     # Extract basic info
                     title = entry.get("title", "")
                     link = entry.get("link", "")
-                    summary = entry.get("summary", entry.get("description", ""))
+                    summary = _strip_html_fast(
+                        entry.get("summary", entry.get("description", ""))
+                    )
                     
                     # Skip if no content
                     if not title and not summary:
@@ -251,77 +687,219 @@ class MediaCollector(SyncCollector):
                     # Build text content
                     text_content = f"{title}\n\n{summary}"
                     
-                    # Optionally fetch full text
-                    if extract_full_text and link:
+                    # Optionally fetch full text (unless the summary suffices)
+                    if (
+                        extract_full_text
+                        and link
+                        and not self._summary_is_sufficient(summary)
+                    ):
                         full_text = self._extract_full_text(link)
                         if full_text:
                             text_content = f"{title}\n\n{full_text}"
                     
-                    # Compute hash
-                    text_hash = Content.compute_hash(text_content)
-                    
-                    # Skip duplicates
-                    if self.content_exists(text_hash):
+                    # Skip duplicates within the feed (fast non-crypto key)
+                    text_bytes = text_content.encode("utf-8")
+                    dedup_key = hashlib.blake2b(text_bytes, digest_size=16).digest()
+                    if dedup_key in seen_keys:
                         continue
+                    seen_keys.add(dedup_key)
+                    
+                    # Compute stored hash (SHA256, from the same bytes)
+                    text_hash = Content.compute_hash(text_bytes)
+                    
+                    candidates.append((entry, title, link, text_content, text_hash))
                     
+                except Exception as e:
+                    logger.debug(f"Error processing entry: {e}")
+                    continue
+            
+            return candidates
+            
+        except Exception as e:
+            self.record_error(f"Error collecting {feed_config.name}: {str(e)}")
+            return None
+    
+    def _persist_feed(
+        self,
+        feed_config: RSSFeedConfig,
+        candidates: List[FeedCandidate]
+    ) -> int:
+        """
+        Store new articles from fetched feed entries (database only).
+        
+        Each feed is its own transaction: it is committed on success
+        and rolled back as a whole on error, without affecting feeds
+        already stored. Must run on the thread owning the database
+        session.
+        
+        Args:
+            feed_config: Feed configuration
+            candidates: Entries returned by _fetch_feed
+            
+        Returns:
+            int: Number of new articles collected
+        """
+        collected_count = 0
+        
+        try:
+            # Determine source type
+            source_type = (
+                SourceType.FACTCHECK 
+                if feed_config.feed_type == "factcheck" 
+                else SourceType.MEDIA
+            )
+            
+            # Get or create source
+            source = self.get_or_create_source(
+                name=feed_config.name,
+                source_type=source_type,
+                platform="web",
+                url=feed_config.url,
+                language=feed_config.language,
+                is_factchecker=feed_config.feed_type == "factcheck"
+            )
+            
+            # Save cache validators for the next conditional GET
+            validators = self._new_feed_validators.pop(feed_config.url, None)
+            if validators is not None:
+                source.feed_etag, source.feed_last_modified = validators
+            
+            # Skip duplicates already stored (single query)
+            existing = self.existing_hashes([c[4] for c in candidates])
+            new_candidates = [c for c in candidates if c[4] not in existing]
+            
+            # Detect languages for the whole feed at once
+            detected_langs = self._detect_languages([c[3] for c in new_candidates])
+            
+            collected_at = datetime.utcnow()
+            rows = []
+            for (entry, title, link, text_content, text_hash), detected_lang in zip(
+                new_candidates, detected_langs
+            ):
+                try:
                     # Parse date
                     published_at = self._parse_feed_date(entry)
                     
-                    # Detect language (override config if different)
-                    detected_lang = self._detect_language(text_content)
+                    # Use detected language (override config if different)
                     language = (
                         detected_lang 
                         if detected_lang != "unknown" 
                         else feed_config.language
                     )
                     
-                    # Create content record
-                    content = Content(
-                        source_id=source.id,
-                        external_id=link or entry.get("id", ""),
-                        content_type=ContentType.ARTICLE.value,
-                        title=title[:500] if title else None,
-                        text_content=text_content,
-                        text_hash=text_hash,
-                        url=link,
-                        language=language,
-                        published_at=published_at,
-                        collected_at=datetime.utcnow()
-                    )
-                    
-                    if self.add_content(content):
-                        collected_count += 1
-                        
-                        # Create factcheck record for fact-checking sources
-                        if feed_config.feed_type == "factcheck":
-                            factcheck = Factcheck(
-                                content_id=content.id,
-                                claim_text=title or text_content[:500],
-                                verdict="unverified",
-                                factcheck_source=feed_config.name,
-                                factcheck_url=link,
-                                factcheck_date=published_at
-                            )
-                            self.session.add(factcheck)
+                    # Content row (id set upfront for the bulk insert)
+                    rows.append({
+                        "id": generate_uuid(),
+                        "source_id": source.id,
+                        "external_id": link or entry.get("id", ""),
+                        "content_type": ContentType.ARTICLE.value,
+                        "title": title[:500] if title else None,
+                        "text_content": text_content,
+                        "text_hash": text_hash,
+                        "url": link,
+                        "language": language,
+                        "published_at": published_at,
+                        "collected_at": collected_at
+                    })
                     
                 except Exception as e:
                     logger.debug(f"Error processing entry: {e}")
                     continue
             
+            # Insert, skipping content stored meanwhile (ON CONFLICT)
+            inserted = self.insert_contents(rows)
+            collected_count = len(inserted)
+            
+            # Create factcheck records for fact-checking sources
+            if feed_config.feed_type == "factcheck" and inserted:
+                factchecks = [
+                    {
+                        "content_id": inserted[row["text_hash"]],
+                        "claim_text": row["title"] or row["text_content"][:500],
+                        "verdict": "unverified",
+                        "factcheck_source": feed_config.name,
+                        "factcheck_url": row["url"],
+                        "factcheck_date": row["published_at"]
+                    }
+                    for row in rows
+                    if row["text_hash"] in inserted
+                ]
+                self.session.execute(insert(Factcheck), factchecks)
+            
             # Commit batch
             self.commit()
             
             logger.info(
                 f"Feed {feed_config.name}: "
-                f"{len(feed.entries)} entries, {collected_count} new"
+                f"{len(candidates)} entries, {collected_count} new"
             )
             
         except Exception as e:
+            # Feed transaction rolled back: nothing from this feed was stored
             self.record_error(f"Error collecting {feed_config.name}: {str(e)}")
             self.session.rollback()
+            self._items_new -= collected_count
+            collected_count = 0
         
         return collected_count
     
+    def collect_feed(
+        self,
+        feed_config: RSSFeedConfig,
+        extract_full_text: bool = False,
+        limit: int = 50
+    ) -> int:
+        """
+        Collect articles from a single RSS feed.
+        
+        Args:
+            feed_config: Feed configuration
+            extract_full_text: Whether to fetch full article text
+            limit: Maximum entries to process
+            
+        Returns:
+            int: Number of new articles collected
+        """
+        self._load_feed_validators([feed_config.url])
+        
+        candidates = self._fetch_feed(feed_config, extract_full_text, limit)
+        if candidates is None:
+            return 0
+        
+        return self._persist_feed(feed_config, candidates)
+    
+    def collect_feeds(self, jobs: List[Tuple[RSSFeedConfig, bool, int]]) -> int:
+        """
+        Collect several feeds, fetching them concurrently.
+        
+        Feeds are fetched by a thread pool (settings.feed_workers);
+        results are persisted on the calling thread so the database
+        session stays single-threaded.
+        
+        Args:
+            jobs: (feed_config, extract_full_text, limit) tuples
+            
+        Returns:
+            int: Total new articles collected
+        """
+        if not jobs:
+            return 0
+        
+        total_new = 0
+        workers = min(settings.feed_workers, len(jobs))
+        
+        # Loaded before fetching: worker threads must not use the session
+        self._load_feed_validators([job[0].url for job in jobs])
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(lambda job: self._fetch_feed(*job), jobs)
+            
+            for (feed_config, _, _), candidates in zip(jobs, results):
+                if candidates is not None:
+                    total_new += self._persist_feed(feed_config, candidates)
+        
+        return total_new
+    
     def collect_media_feeds(self) -> int:
         """
         Collect from all configured media feeds.
@@ -329,7 +907,7 @@ class MediaCollector(SyncCollector):
         Returns:
             int: Total new articles collected
         """
-        total_new = 0
+        jobs = []
         media_config = self.config.get("media", {})
         
         # Collect mainstream media by language
@@ -342,8 +920,7 @@ class MediaCollector(SyncCollector):
                 if isinstance(feed_dict, dict):
                     feed_config = self._parse_feed_config(feed_dict)
                     feed_config.language = lang  # Override with category language
-                    total_new += self.collect_feed(feed_config)
-                    time.sleep(0.5)  # Rate limiting
+                    jobs.append((feed_config, False, 50))
         
         # Collect alternative media (with full text extraction)
         alternative = media_config.get("alternative", [])
@@ -351,13 +928,9 @@ class MediaCollector(SyncCollector):
             if isinstance(feed_dict, dict):
                 feed_config = self._parse_feed_config(feed_dict)
                 feed_config.feed_type = "alternative"
-                total_new += self.collect_feed(
-                    feed_config, 
-                    extract_full_text=True
-                )
-                time.sleep(1)  # Longer delay for full text extraction
+                jobs.append((feed_config, True, 50))
         
-        return total_new
+        return self.collect_feeds(jobs)
     
     def collect_factcheckers(self) -> int:
         """
@@ -366,21 +939,16 @@ class MediaCollector(SyncCollector):
         Returns:
             int: Total new fact-checks collected
         """
-        total_new = 0
+        jobs = []
         factcheckers = self.config.get("factcheckers", [])
         
         for feed_dict in factcheckers:
             if isinstance(feed_dict, dict):
                 feed_config = self._parse_feed_config(feed_dict)
                 feed_config.feed_type = "factcheck"
-                total_new += self.collect_feed(
-                    feed_config,
-                    extract_full_text=True,
-                    limit=30
-                )
-                time.sleep(1)
+                jobs.append((feed_config, True, 30))
         
-        return total_new
+        return self.collect_feeds(jobs)
     
     def collect_all_sync(self) -> CollectionResult:
         """
@@ -14,13 +14,21 @@ Usage:
 """
 
 import asyncio
-from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+import atexit
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Optional, List, Dict, Any, Set, Tuple
 from pathlib import Path
 
 from loguru import logger
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 from telethon import TelegramClient
-from telethon.tl.types import Channel, Message
+from telethon.tl.types import Channel, InputPeerChannel, Message
 from telethon.errors import (
     ChannelPrivateError,
     UsernameNotOccupiedError,
@@ -28,7 +36,7 @@ from telethon.errors import (
     ChannelInvalidError
 )
 
-from collectors.base import BaseCollector
+from collectors.base import BaseCollector, NearDupFilter
 from database import (
     Content,
     CollectionResult,
@@ -36,9 +44,90 @@ from database import (
     ContentType,
     TelegramChannelConfig
 )
+from database.models import generate_uuid
 from config.settings import settings
 
 
+# Connected clients shared by collector instances, keyed by session/API ID
+_CLIENT_CACHE: Dict[str, TelegramClient] = {}
+
+
+async def close_shared_clients() -> None:
+    """Disconnect all cached Telegram clients from within their event loop."""
+    while _CLIENT_CACHE:
+        _, client = _CLIENT_CACHE.popitem()
+        try:
+            await client.disconnect()
+        except Exception as e:
+            logger.debug(f"Error closing Telegram client: {e}")
+
+
+def _shutdown_clients() -> None:
+    """Disconnect cached clients left open at exit (registered with atexit)."""
+    while _CLIENT_CACHE:
+        _, client = _CLIENT_CACHE.popitem()
+        try:
+            if client.is_connected():
+                client.disconnect()
+        except Exception as e:
+            logger.debug(f"Error closing Telegram client: {e}")
+
+
+atexit.register(_shutdown_clients)
+
+
+class _RpcThrottle:
+    """
+    Token bucket shared by all channel coroutines, plus a global pause.
+    
+    Every Telegram RPC first waits for any flood-wait pause, then takes
+    a token; tokens refill at `rate` per second up to `rate`.
+    """
+    
+    def __init__(self, rate: float):
+        self.rate = rate
+        self._tokens = rate
+        self._updated = 0.0
+        self._pause_until = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def pause(self, seconds: float) -> None:
+        """Hold back every RPC for `seconds` (after a FloodWaitError)."""
+        loop = asyncio.get_running_loop()
+        self._pause_until = max(self._pause_until, loop.time() + seconds)
+    
+    async def acquire(self) -> None:
+        """Wait for any pause and for a token."""
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._loop is not loop:
+            # asyncio.Lock is bound to one event loop
+            self._lock = asyncio.Lock()
+            self._loop = loop
+        
+        async with self._lock:
+            while True:
+                now = loop.time()
+                if now < self._pause_until:
+                    await asyncio.sleep(self._pause_until - now)
+                    continue
+                
+                if self._updated:
+                    self._tokens = min(
+                        self.rate,
+                        self._tokens + (now - self._updated) * self.rate
+                    )
+                self._updated = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+_RPC_THROTTLE = _RpcThrottle(settings.telegram_rps)
+
+
 class TelegramCollector(BaseCollector):
     """
     Collector for Telegram public channels.
@@ -48,7 +137,7 @@ class TelegramCollector(BaseCollector):
     
     Features:
     - Automatic authentication handling
-    - Rate limiting with backoff
+    - Concurrent channel collection (bounded) with flood-wait backoff
     - Forward detection
     - Media type extraction
     - Deduplication via content hash
@@ -58,6 +147,20 @@ class TelegramCollector(BaseCollector):
         connected: Connection status flag
     """
     
+    # Producer/consumer tuning for collect_channel
+    PAGE_SIZE = 100  # messages per history request (Telegram maximum)
+    QUEUE_SIZE = 200
+    BATCH_SIZE = 100
+    BATCH_TIMEOUT = 0.5  # seconds
+    
+    # (media type label, Message attribute)
+    _MEDIA_ATTRS: Tuple[Tuple[str, str], ...] = (
+        ("image", "photo"),
+        ("video", "video"),
+        ("document", "document"),
+        ("audio", "audio"),
+    )
+    
     def __init__(self, config_path: str = "config/sources.yaml"):
         """
         Initialize Telegram collector.
@@ -68,6 +171,13 @@ class TelegramCollector(BaseCollector):
         super().__init__(config_path)
         self.client: Optional[TelegramClient] = None
         self.connected = False
+        self._entities: Dict[str, Dict[str, Any]] = self._load_entity_cache()
+        self._near_dup: Optional[NearDupFilter] = None
+        if settings.near_dedup_enabled:
+            self._near_dup = NearDupFilter.load(
+                self._near_dup_path,
+                threshold=settings.near_dedup_threshold
+            )
         
         # Validate credentials
         if not settings.telegram_configured:
@@ -81,10 +191,81 @@ class TelegramCollector(BaseCollector):
         """Return collector type identifier."""
         return "telegram"
     
+    @property
+    def _entity_cache_path(self) -> Path:
+        """Location of the persisted channel entity cache."""
+        return Path(settings.data_dir) / "telegram_entities.json"
+    
+    def _load_entity_cache(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Load resolved channel entities saved by a previous run.
+        
+        Returns:
+            dict: channel username -> {"id", "access_hash", "username"}
+        """
+        path = self._entity_cache_path
+        if not path.exists():
+            return {}
+        try:
+            data = path.read_bytes()
+            return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring entity cache {path}: {e}")
+            return {}
+    
+    def _save_entity_cache(self) -> None:
+        """Persist resolved channel entities for the next run."""
+        path = self._entity_cache_path
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if ORJSON_AVAILABLE:
+                path.write_bytes(orjson.dumps(self._entities))
+            else:
+                path.write_text(json.dumps(self._entities), encoding="utf-8")
+        except OSError as e:
+            logger.warning(f"Could not save entity cache {path}: {e}")
+    
+    async def _resolve_channel(self, channel_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Resolve a channel username, using the on-disk cache when possible.
+        
+        Args:
+            channel_id: Channel username
+            
+        Returns:
+            dict: {"id", "access_hash", "username"}, or None if the
+            username does not point to a channel
+        """
+        cached = self._entities.get(channel_id)
+        if cached is not None:
+            return cached
+        
+        await _RPC_THROTTLE.acquire()
+        entity = await self.client.get_entity(channel_id)
+        if not isinstance(entity, Channel):
+            return None
+        
+        resolved = {
+            "id": entity.id,
+            "access_hash": entity.access_hash,
+            "username": entity.username,
+        }
+        self._entities[channel_id] = resolved
+        return resolved
+    
+    @property
+    def _near_dup_path(self) -> Path:
+        """Location of the persisted near-duplicate index."""
+        return Path(settings.data_dir) / "dedup_state.pkl"
+    
     async def connect(self) -> bool:
         """
         Establish connection to Telegram API.
         
+        Connected clients are cached per session and API ID, so later
+        collectors on the same event loop skip the handshake and
+        re-authentication.
+        
         Returns:
             bool: True if connection successful
         """
@@ -97,6 +278,18 @@ class TelegramCollector(BaseCollector):
             session_dir = Path(settings.data_dir)
             session_dir.mkdir(parents=True, exist_ok=True)
             session_path = session_dir / settings.telegram_session_name
+            key = f"{session_path}:{settings.telegram_api_id}"
+            
+            # Reuse a live client bound to this event loop
+            cached = _CLIENT_CACHE.get(key)
+            if (
+                cached is not None
+                and cached.is_connected()
+                and cached.loop is asyncio.get_running_loop()
+            ):
+                self.client = cached
+                self.connected = True
+                return True
             
             # Initialize client
             self.client = TelegramClient(
@@ -106,6 +299,7 @@ class TelegramCollector(BaseCollector):
             )
             
             await self.client.start()
+            _CLIENT_CACHE[key] = self.client
             
             # Verify connection
             me = await self.client.get_me()
@@ -120,11 +314,19 @@ class TelegramCollector(BaseCollector):
             return False
     
     async def disconnect(self):
-        """Disconnect from Telegram API."""
+        """
+        Release the Telegram connection.
+        
+        The shared client stays connected in the module cache for reuse;
+        close it with close_shared_clients() (or at interpreter exit).
+        """
+        if self._near_dup is not None:
+            self._near_dup.save(self._near_dup_path)
+        self._save_entity_cache()
         if self.client:
-            await self.client.disconnect()
+            self.client = None
             self.connected = False
-            logger.info("Disconnected from Telegram")
+            logger.info("Released Telegram client")
     
     def _parse_channel_config(self, config: dict) -> TelegramChannelConfig:
         """
@@ -164,19 +366,229 @@ class TelegramCollector(BaseCollector):
         
         return channels
     
+    async def _produce_messages(
+        self,
+        peer: InputPeerChannel,
+        queue: asyncio.Queue,
+        min_date: datetime,
+        limit: int,
+        min_id: int = 0
+    ) -> int:
+        """
+        Feed non-empty channel messages into the queue, oldest first.
+        
+        Messages are read forward from the checkpoint (or from min_date
+        on the first run), so when more than `limit` messages are
+        pending the next run resumes after the last one fetched instead
+        of skipping them. History is requested one PAGE_SIZE page at a
+        time, each page taking a throttle token (and honouring any
+        flood-wait pause). A None sentinel marks the end of the stream.
+        On error the sentinel is not sent; collect_channel cancels the
+        consumer.
+        
+        Args:
+            peer: Channel input peer
+            queue: Bounded queue shared with the consumer
+            min_date: Oldest message date to collect (first run only)
+            limit: Maximum messages to fetch
+            min_id: Only fetch messages newer than this ID
+            
+        Returns:
+            int: Highest message ID seen (min_id if none)
+        """
+        max_id = min_id
+        remaining = limit
+        
+        while remaining > 0:
+            page_size = min(self.PAGE_SIZE, remaining)
+            
+            await _RPC_THROTTLE.acquire()
+            # With reverse=True, offset_date means "newer than" this date;
+            # later pages continue after the last ID fetched
+            page = await self.client.get_messages(
+                peer,
+                limit=page_size,
+                min_id=max_id,
+                offset_date=(
+                    None if max_id else min_date.replace(tzinfo=timezone.utc)
+                ),
+                reverse=True
+            )
+            
+            for message in page:
+                max_id = max(max_id, message.id)
+                
+                # Skip empty messages
+                if message.text:
+                    await queue.put(message)
+            
+            if len(page) < page_size:
+                break
+            remaining -= len(page)
+        
+        await queue.put(None)
+        return max_id
+    
+    async def _consume_messages(
+        self,
+        queue: asyncio.Queue,
+        channel_peer_id: int,
+        source,
+        channel_config: TelegramChannelConfig
+    ) -> int:
+        """
+        Drain the queue and store messages in batches.
+        
+        A batch is flushed when it reaches BATCH_SIZE or when no
+        message arrived for BATCH_TIMEOUT seconds.
+        
+        Returns:
+            int: Number of new messages stored
+        """
+        collected_count = 0
+        seen_hashes: Set[str] = set()
+        done = False
+        
+        while not done:
+            batch = []
+            while len(batch) < self.BATCH_SIZE:
+                try:
+                    message = await asyncio.wait_for(
+                        queue.get(), self.BATCH_TIMEOUT
+                    )
+                except asyncio.TimeoutError:
+                    break
+                if message is None:
+                    done = True
+                    break
+                batch.append(message)
+            
+            if batch:
+                collected_count += self._store_messages(
+                    batch, channel_peer_id, source, channel_config, seen_hashes
+                )
+        
+        return collected_count
+    
+    def _store_messages(
+        self,
+        messages: List[Message],
+        channel_peer_id: int,
+        source,
+        channel_config: TelegramChannelConfig,
+        seen_hashes: Set[str]
+    ) -> int:
+        """
+        Insert a batch of messages and commit.
+        
+        Runs without awaiting, so concurrent channels never interleave
+        inside this transaction on the shared session. On failure the
+        batch is rolled back and its counters reverted.
+        
+        Args:
+            messages: Messages to store
+            channel_peer_id: Telegram channel ID
+            source: Source record for the channel
+            channel_config: Channel configuration
+            seen_hashes: Hashes already handled for this channel (updated)
+            
+        Returns:
+            int: Number of new messages stored
+        """
+        inserted = 0
+        indexed_keys: List[str] = []
+        
+        try:
+            # Hash messages, dropping duplicates within this channel
+            hashed = []
+            for message in messages:
+                # Skip near-identical reposts before hashing (opt-in)
+                if self._near_dup is not None:
+                    key = f"{channel_peer_id}:{message.id}"
+                    if self._near_dup.is_duplicate(key, message.text):
+                        continue
+                    indexed_keys.append(key)
+                
+                text_hash = Content.compute_hash(message.text)
+                if text_hash not in seen_hashes:
+                    seen_hashes.add(text_hash)
+                    hashed.append((message, text_hash))
+            
+            collected_at = datetime.utcnow()
+            rows = []
+            for message, text_hash in hashed:
+                # Determine content type (forward or regular message)
+                content_type = (
+                    ContentType.FORWARD.value 
+                    if message.fwd_from 
+                    else ContentType.MESSAGE.value
+                )
+                
+                # Extract media types
+                media_types = [
+                    name for name, attr in self._MEDIA_ATTRS
+                    if getattr(message, attr, None)
+                ]
+                has_media = bool(media_types) or message.media is not None
+                
+                # Content row
+                rows.append({
+                    "id": generate_uuid(),
+                    "source_id": source.id,
+                    "external_id": str(message.id),
+                    "content_type": content_type,
+                    "text_content": message.text,
+                    "text_hash": text_hash,
+                    "has_media": has_media,
+                    "media_types": media_types if media_types else None,
+                    "language": channel_config.language,
+                    "views_count": message.views,
+                    "shares_count": message.forwards,
+                    "published_at": message.date,
+                    "collected_at": collected_at
+                })
+            
+            # One INSERT for the whole batch; ON CONFLICT (text_hash)
+            # skips content already stored, no read beforehand
+            inserted = len(self.insert_contents(rows))
+            
+            # Commit batch
+            self.commit()
+            
+        except Exception:
+            self.session.rollback()
+            self._items_new -= inserted
+            if self._near_dup is not None:
+                self._near_dup.discard(indexed_keys)
+            raise
+        
+        return inserted
+    
     async def collect_channel(
         self,
         channel_config: TelegramChannelConfig,
         lookback_days: int = 7,
-        limit: int = 100
+        limit: int = 100,
+        retry_on_flood: bool = True
     ) -> int:
         """
         Collect messages from a single channel.
         
+        Fetching and storing overlap: a producer streams messages from
+        Telegram into a bounded queue while a consumer writes them to
+        the database in batches. Only messages newer than the source's
+        checkpoint are requested; the checkpoint advances once every
+        batch is stored.
+        
+        A FloodWaitError pauses every channel's RPCs; the channel is then
+        retried once after the pause and recorded as an error if it is
+        rate limited again.
+        
         Args:
             channel_config: Channel configuration
             lookback_days: Number of days to look back
             limit: Maximum messages to collect
+            retry_on_flood: Retry once after a flood wait
             
         Returns:
             int: Number of new messages collected
@@ -187,110 +599,97 @@ class TelegramCollector(BaseCollector):
             return 0
         
         collected_count = 0
+        flood_wait = None
         
         try:
-            # Get channel entity
-            entity = await self.client.get_entity(channel_id)
+            # Resolve channel (cached across runs: no get_entity round-trip)
+            channel = await self._resolve_channel(channel_id)
             
-            if not isinstance(entity, Channel):
+            if channel is None:
                 logger.warning(f"{channel_id} is not a channel")
                 return 0
             
-            # Get or create source
+            peer = InputPeerChannel(channel["id"], channel["access_hash"])
+            username = channel["username"]
+            
+            # Calculate date limit
+            min_date = datetime.utcnow() - timedelta(days=lookback_days)
+            
+            # Get or create source, committed right away so a rollback
+            # in another channel's batch cannot discard it
             source = self.get_or_create_source(
                 name=channel_config.name,
                 source_type=SourceType.TELEGRAM,
                 platform="telegram",
-                url=f"https://t.me/{entity.username}" if entity.username else None,
+                url=f"https://t.me/{username}" if username else None,
                 language=channel_config.language,
-                telegram_channel_id=entity.id,
+                telegram_channel_id=channel["id"],
                 is_doppelganger=channel_config.channel_type == "doppelganger",
                 is_amplifier=channel_config.channel_type == "amplifier"
             )
+            self.commit()
             
-            # Calculate date limit
-            min_date = datetime.utcnow() - timedelta(days=lookback_days)
+            last_id = source.telegram_last_message_id or 0
             
-            # Iterate through messages
-            async for message in self.client.iter_messages(
-                entity,
-                limit=limit,
-                offset_date=datetime.utcnow()
-            ):
-                # Skip old messages
-                if message.date.replace(tzinfo=None) < min_date:
-                    break
-                
-                # Skip empty messages
-                if not message.text:
-                    continue
-                
-                # Compute hash for deduplication
-                text_hash = Content.compute_hash(message.text)
-                
-                # Skip if already collected
-                if self.content_exists(text_hash):
-                    continue
-                
-                # Determine content type (forward or regular message)
-                content_type = (
-                    ContentType.FORWARD.value 
-                    if message.fwd_from 
-                    else ContentType.MESSAGE.value
-                )
-                
-                # Extract media types
-                media_types = []
-                has_media = message.media is not None
-                
-                if message.photo:
-                    media_types.append("image")
-                if message.video:
-                    media_types.append("video")
-                if message.document:
-                    media_types.append("document")
-                if message.audio:
-                    media_types.append("audio")
-                
-                # Create content record
-                content = Content(
-                    source_id=source.id,
-                    external_id=str(message.id),
-                    content_type=content_type,
-                    text_content=message.text,
-                    text_hash=text_hash,
-                    has_media=has_media,
-                    media_types=media_types if media_types else None,
-                    language=channel_config.language,
-                    views_count=message.views,
-                    shares_count=message.forwards,
-                    published_at=message.date,
-                    collected_at=datetime.utcnow()
-                )
-                
-                if self.add_content(content):
-                    collected_count += 1
+            queue: asyncio.Queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+            producer = asyncio.create_task(
+                self._produce_messages(peer, queue, min_date, limit, last_id)
+            )
+            consumer = asyncio.create_task(
+                self._consume_messages(queue, channel["id"], source, channel_config)
+            )
             
-            # Commit batch
-            self.commit()
+            try:
+                max_id, collected_count = await asyncio.gather(producer, consumer)
+            except BaseException:
+                producer.cancel()
+                consumer.cancel()
+                raise
+            
+            # Advance the checkpoint only after all batches are stored
+            if max_id > last_id:
+                source.telegram_last_message_id = max_id
+                self.commit()
             
             logger.info(
                 f"Channel {channel_id}: collected {collected_count} new messages"
             )
             
         except ChannelPrivateError:
+            self._entities.pop(channel_id, None)
             self.record_error(f"Channel {channel_id} is private")
         except UsernameNotOccupiedError:
+            self._entities.pop(channel_id, None)
             self.record_error(f"Channel {channel_id} does not exist")
         except ChannelInvalidError:
+            # Stale access hash: resolve again on the next run
+            self._entities.pop(channel_id, None)
             self.record_error(f"Invalid channel: {channel_id}")
         except FloodWaitError as e:
-            logger.warning(f"Rate limited, waiting {e.seconds}s")
-            await asyncio.sleep(e.seconds)
+            # Pause every channel, not just this one
+            logger.warning(f"Rate limited, pausing Telegram RPCs for {e.seconds}s")
+            _RPC_THROTTLE.pause(e.seconds)
+            flood_wait = e.seconds
         except Exception as e:
             self.record_error(f"Error collecting {channel_id}: {str(e)}")
             self.session.rollback()
         
+        if flood_wait is not None:
+            if not retry_on_flood:
+                self.record_error(
+                    f"Rate limited on {channel_id} (flood wait {flood_wait}s)"
+                )
+                return collected_count
+            # The checkpoint did not move: the retry resumes from it, and
+            # already stored messages are skipped as duplicates
+            logger.info(f"Retrying {channel_id} after flood wait")
+            return await self.collect_channel(
+                channel_config,
+                lookback_days=lookback_days,
+                limit=limit,
+                retry_on_flood=False
+            )
+        
         return collected_count
     
     async def collect_all(
@@ -328,20 +727,25 @@ class TelegramCollector(BaseCollector):
         channels = self._get_configured_channels()
         logger.info(f"Collecting from {len(channels)} Telegram channels")
         
-        # Collect from each channel
-        for channel in channels:
-            try:
-                await self.collect_channel(
+        # Collect channels concurrently (bounded; Telethon handles flood waits)
+        semaphore = asyncio.Semaphore(settings.telegram_concurrency)
+        
+        async def collect_one(channel: TelegramChannelConfig) -> int:
+            async with semaphore:
+                return await self.collect_channel(
                     channel,
                     lookback_days=lookback,
                     limit=limit
                 )
-                
-                # Rate limiting delay between channels
-                await asyncio.sleep(1)
-                
-            except Exception as e:
-                self.record_error(f"{channel.name}: {str(e)}")
+        
+        results = await asyncio.gather(
+            *(collect_one(channel) for channel in channels),
+            return_exceptions=True
+        )
+        
+        for channel, result in zip(channels, results):
+            if isinstance(result, Exception):
+                self.record_error(f"{channel.name}: {str(result)}")
         
         # Determine final status
         status = "completed"
@@ -365,6 +769,7 @@ async def main():
             logger.error("Failed to connect to Telegram")
     finally:
         await collector.disconnect()
+        await close_shared_clients()
         collector.close()
 
 
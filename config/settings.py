@@ -9,10 +9,10 @@ Usage:
     print(settings.database_url)
 """
 
-from functools import lru_cache
+from functools import lru_cache, cached_property
 from typing import Optional, List
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from pydantic import Field, field_validator
+from pydantic import Field, PrivateAttr, field_validator
 
 
 class Settings(BaseSettings):
@@ -30,6 +30,13 @@ class Settings(BaseSettings):
         collection_interval: Seconds between collection runs
         nlp_batch_size: Number of items to process per NLP batch
         network_lookback_days: Days to look back for network analysis
+        telegram_concurrency: Number of Telegram channels collected concurrently
+        telegram_rps: Telegram RPCs per second shared by all channels
+        near_dedup_enabled: Skip Telegram messages near-identical to known ones
+        feed_workers: Number of RSS feeds fetched concurrently
+        full_text_min_chars: Feed summaries this long skip article fetching
+        language_model_path: fastText model used for batched language detection
+        max_concurrent_analyses: Max orchestrated analyses running at once
     """
     
     model_config = SettingsConfigDict(
@@ -68,13 +75,21 @@ class Settings(BaseSettings):
     collection_interval: int = Field(default=300, description="Collection interval in seconds")
     initial_lookback_days: int = Field(default=7, description="Initial data lookback period")
     max_messages_per_channel: int = Field(default=100, description="Max messages per Telegram channel")
+    telegram_concurrency: int = Field(default=4, ge=1, description="Telegram channels collected concurrently")
+    telegram_rps: float = Field(default=20, gt=0, description="Telegram RPC rate limit (requests per second)")
+    near_dedup_enabled: bool = Field(default=False, description="MinHash-LSH near-duplicate filter for Telegram")
+    near_dedup_threshold: float = Field(default=0.85, gt=0, le=1, description="Near-duplicate Jaccard threshold")
     request_timeout: int = Field(default=30, description="HTTP request timeout")
+    feed_workers: int = Field(default=8, ge=1, description="Concurrent RSS feed fetches")
+    full_text_min_chars: int = Field(default=600, ge=0, description="Summary length that skips full-text extraction")
+    language_model_path: str = Field(default="./data/lid.176.ftz", description="fastText language identification model")
     
     # --- Analysis ---
     nlp_batch_size: int = Field(default=500, description="NLP processing batch size")
     network_lookback_days: int = Field(default=30, description="Network analysis lookback period")
     min_similarity_threshold: float = Field(default=0.5, description="Minimum similarity for propagation")
     propaganda_threshold: float = Field(default=0.7, description="Propaganda detection threshold")
+    max_concurrent_analyses: int = Field(default=2, ge=1, description="Max orchestrated analyses running at once")
     
     # --- Paths ---
     data_dir: str = Field(default="./data", description="Data directory path")
@@ -82,6 +97,8 @@ class Settings(BaseSettings):
     exports_dir: str = Field(default="./exports", description="Exports directory path")
     config_dir: str = Field(default="./config", description="Config directory path")
     
+    _database_url_cached: Optional[str] = PrivateAttr(default=None)
+    
     @field_validator("log_level")
     @classmethod
     def validate_log_level(cls, v: str) -> str:
@@ -91,14 +108,31 @@ class Settings(BaseSettings):
             raise ValueError(f"log_level must be one of {valid_levels}")
         return v.upper()
     
-    @property
+    @cached_property
     def telegram_configured(self) -> bool:
         """Check if Telegram credentials are configured."""
         return bool(self.telegram_api_id and self.telegram_api_hash)
     
+    def model_post_init(self, __context) -> None:
+        """Precompute the database URL once settings are validated."""
+        if self.postgres_password:
+            self._database_url_cached = self._build_database_url()
+    
+    def _build_database_url(self) -> str:
+        """Assemble the database URL from DATABASE_URL or its components."""
+        if self.database_url:
+            return self.database_url
+
+        return (
+            f"postgresql://{self.postgres_user}:{self.postgres_password}"
+            f"@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
+        )
+    
     def get_database_url(self) -> str:
         """
         Build database URL from components if DATABASE_URL not set.
+        
+        The URL is computed once, after validation.
 
         Returns:
             str: Complete PostgreSQL connection URL
@@ -112,13 +146,9 @@ class Settings(BaseSettings):
                 "See .env.example for configuration template."
             )
 
-        if self.database_url:
-            return self.database_url
-
-        return (
-            f"postgresql://{self.postgres_user}:{self.postgres_password}"
-            f"@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
-        )
+        if self._database_url_cached is None:
+            self._database_url_cached = self._build_database_url()
+        return self._database_url_cached
 
 
 @lru_cache()
@@ -19,20 +19,21 @@ import os
 import sys
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-from sqlalchemy import text
+from sqlalchemy import Float, case, cast, func, select, text, true
+from sqlalchemy.exc import ProgrammingError
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from database import (
-    get_session,
+    session_scope,
     Content,
     Source,
     NLPAnalysis,
@@ -57,64 +58,115 @@ st.set_page_config(
 
 
 # =============================================================================
-# DATABASE CONNECTION
+# FRAGMENTS
 # =============================================================================
 
-@st.cache_resource
-def get_db_session():
+# st.fragment (Streamlit >= 1.37) or st.experimental_fragment (>= 1.33)
+_st_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+
+
+def fragment(run_every: Optional[timedelta] = None):
     """
-    Get cached database session with connection test.
+    Rerun the decorated render function on its own on interaction.
     
-    Returns:
-        Session: Database session or None if connection fails
+    Falls back to a plain function call on Streamlit versions without
+    fragments.
+    
+    Args:
+        run_every: Optional interval for automatic refresh
     """
-    try:
-        session = get_session()
-        # Test connection
-        session.execute(text("SELECT 1"))
-        return session
-    except Exception as e:
-        st.error(f"❌ Database connection failed: {e}")
-        return None
+    def decorate(func):
+        if _st_fragment is None:
+            return func
+        return _st_fragment(func, run_every=run_every)
+    return decorate
 
 
 # =============================================================================
 # DATA FETCHING FUNCTIONS
 # =============================================================================
 
+@st.cache_data(ttl=60, show_spinner=False)
 def get_stats() -> DashboardStats:
     """
     Fetch overall dashboard statistics.
     
+    Reads the one-row ``dashboard_stats`` materialized view, refreshed
+    after each collection and analysis run. Databases without the view
+    fall back to counting the tables in a single round-trip.
+    
     Returns:
         DashboardStats: Current statistics
     """
-    session = get_db_session()
-    
-    if session is None:
-        return DashboardStats()
-    
     try:
-        return DashboardStats(
-            total_content=session.query(Content).count(),
-            total_sources=session.query(Source).count(),
-            analyzed_content=session.query(Content).filter(
-                Content.is_analyzed == True
-            ).count(),
-            doppelganger_sources=session.query(Source).filter(
-                Source.is_doppelganger == True
-            ).count(),
-            propaganda_detected=session.query(NLPAnalysis).filter(
-                NLPAnalysis.is_propaganda == True
-            ).count(),
-            cognitive_markers=session.query(CognitiveMarker).count(),
-            factchecks=session.query(Factcheck).count()
-        )
+        with session_scope() as session:
+            try:
+                row = session.execute(text(
+                    "SELECT total_content, total_sources, analyzed_content, "
+                    "doppelganger_sources, propaganda_detected, "
+                    "cognitive_markers, factchecks, analysis_rate "
+                    "FROM dashboard_stats LIMIT 1"
+                )).one_or_none()
+            except ProgrammingError:
+                # View missing or outdated: see migrations/add_dashboard_stats_*.sql
+                session.rollback()
+                row = None
+            
+            if row is None:
+                row = session.execute(live_stats_query()).one()
+            
+            return DashboardStats(**row._mapping)
     except Exception as e:
         st.warning(f"Error fetching stats: {e}")
         return DashboardStats()
 
 
+def live_stats_query():
+    """
+    Build the dashboard counters query against the base tables.
+    
+    One scan per table, with conditional aggregates for the
+    filtered counts.
+    """
+    def count_if(condition):
+        return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+    
+    def count(model, *criteria):
+        return select(func.count()).select_from(model).where(
+            *criteria
+        ).scalar_subquery()
+    
+    content_stats = select(
+        func.count().label("total"),
+        count_if(Content.is_analyzed == True).label("analyzed")
+    ).select_from(Content).subquery()
+    
+    source_stats = select(
+        func.count().label("total"),
+        count_if(Source.is_doppelganger == True).label("doppelganger")
+    ).select_from(Source).subquery()
+    
+    analysis_rate = case(
+        (content_stats.c.total > 0,
+         100.0 * content_stats.c.analyzed / content_stats.c.total),
+        else_=0.0
+    )
+    
+    return select(
+        content_stats.c.total.label("total_content"),
+        source_stats.c.total.label("total_sources"),
+        content_stats.c.analyzed.label("analyzed_content"),
+        source_stats.c.doppelganger.label("doppelganger_sources"),
+        count(
+            NLPAnalysis, NLPAnalysis.is_propaganda == True
+        ).label("propaganda_detected"),
+        count(CognitiveMarker).label("cognitive_markers"),
+        count(Factcheck).label("factchecks"),
+        cast(analysis_rate, Float).label("analysis_rate")
+    ).select_from(content_stats.join(source_stats, true()))
+
+
+@st.cache_data(ttl=60, show_spinner=False)
 def get_timeline_data(days: int = 30) -> pd.DataFrame:
     """
     Get content timeline data for visualization.
@@ -125,34 +177,29 @@ def get_timeline_data(days: int = 30) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Timeline data
     """
-    session = get_db_session()
-    
-    if session is None:
-        return pd.DataFrame()
-    
     try:
-        since = datetime.utcnow() - timedelta(days=days)
-        
-        contents = session.query(Content).filter(
-            Content.published_at >= since,
-            Content.published_at.isnot(None)
-        ).all()
-        
-        if not contents:
-            return pd.DataFrame()
-        
-        data = [{
-            "date": c.published_at.date(),
-            "source_id": c.source_id,
-            "language": c.language or "unknown",
-            "content_type": c.content_type
-        } for c in contents]
-        
-        return pd.DataFrame(data)
+        with session_scope() as session:
+            since = datetime.utcnow() - timedelta(days=days)
+            
+            day = func.date(Content.published_at)
+            stmt = select(
+                day.label("date"),
+                func.coalesce(Content.language, "unknown").label("language"),
+                Content.content_type,
+                func.count().label("count")
+            ).where(
+                Content.published_at >= since,
+                Content.published_at.isnot(None)
+            ).group_by(
+                day, Content.language, Content.content_type
+            )
+            
+            return pd.read_sql_query(stmt, session.connection())
     except Exception:
         return pd.DataFrame()
 
 
+@st.cache_data(ttl=60, show_spinner=False)
 def get_sentiment_distribution() -> pd.DataFrame:
     """
     Get sentiment analysis distribution.
@@ -160,30 +207,22 @@ def get_sentiment_distribution() -> pd.DataFrame:
     Returns:
         pd.DataFrame: Sentiment data
     """
-    session = get_db_session()
-    
-    if session is None:
-        return pd.DataFrame()
-    
     try:
-        analyses = session.query(NLPAnalysis).filter(
-            NLPAnalysis.sentiment_label.isnot(None)
-        ).all()
-        
-        if not analyses:
-            return pd.DataFrame()
-        
-        data = [{
-            "sentiment": a.sentiment_label,
-            "score": a.sentiment_score,
-            "is_propaganda": a.is_propaganda or False
-        } for a in analyses]
-        
-        return pd.DataFrame(data)
+        with session_scope() as session:
+            stmt = select(
+                NLPAnalysis.sentiment_label.label("sentiment"),
+                func.count().label("count"),
+                func.avg(NLPAnalysis.sentiment_score).label("avg_score")
+            ).where(
+                NLPAnalysis.sentiment_label.isnot(None)
+            ).group_by(NLPAnalysis.sentiment_label)
+            
+            return pd.read_sql_query(stmt, session.connection())
     except Exception:
         return pd.DataFrame()
 
 
+@st.cache_data(ttl=60, show_spinner=False)
 def get_cognitive_markers_data() -> pd.DataFrame:
     """
     Get cognitive markers distribution.
@@ -191,29 +230,26 @@ def get_cognitive_markers_data() -> pd.DataFrame:
     Returns:
         pd.DataFrame: Markers data
     """
-    session = get_db_session()
-    
-    if session is None:
-        return pd.DataFrame()
-    
     try:
-        markers = session.query(CognitiveMarker).all()
-        
-        if not markers:
-            return pd.DataFrame()
-        
-        data = [{
-            "type": m.marker_type,
-            "category": m.marker_category,
-            "severity": m.severity or "medium",
-            "confidence": m.confidence
-        } for m in markers]
-        
-        return pd.DataFrame(data)
+        with session_scope() as session:
+            severity = func.coalesce(CognitiveMarker.severity, "medium")
+            stmt = select(
+                CognitiveMarker.marker_type.label("type"),
+                CognitiveMarker.marker_category.label("category"),
+                severity.label("severity"),
+                func.count().label("count")
+            ).group_by(
+                CognitiveMarker.marker_type,
+                CognitiveMarker.marker_category,
+                severity
+            )
+            
+            return pd.read_sql_query(stmt, session.connection())
     except Exception:
         return pd.DataFrame()
 
 
+@st.cache_data(ttl=60, show_spinner=False)
 def get_sources_data() -> pd.DataFrame:
     """
     Get sources summary data.
@@ -221,38 +257,52 @@ def get_sources_data() -> pd.DataFrame:
     Returns:
         pd.DataFrame: Sources data
     """
-    session = get_db_session()
-    
-    if session is None:
+    try:
+        with session_scope() as session:
+            # One grouped query instead of a COUNT per source
+            stmt = select(
+                Source.name,
+                Source.source_type.label("type"),
+                func.coalesce(Source.language, "unknown").label("language"),
+                Source.is_doppelganger,
+                Source.is_amplifier,
+                func.count(Content.id).label("content_count"),
+                Source.last_collected_at.label("last_collected")
+            ).outerjoin(
+                Content, Content.source_id == Source.id
+            ).group_by(Source.id)
+            
+            df = pd.read_sql_query(stmt, session.connection())
+            
+            # Flags stay boolean; render_sources shows them as checkboxes
+            df["is_doppelganger"] = df["is_doppelganger"].fillna(False).astype(bool)
+            df["is_amplifier"] = df["is_amplifier"].fillna(False).astype(bool)
+            return df
+    except Exception:
         return pd.DataFrame()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def get_source_type_counts() -> pd.DataFrame:
+    """
+    Get source counts per type.
     
+    Returns:
+        pd.DataFrame: Columns type, count
+    """
     try:
-        sources = session.query(Source).all()
-        
-        if not sources:
-            return pd.DataFrame()
-        
-        data = []
-        for s in sources:
-            content_count = session.query(Content).filter(
-                Content.source_id == s.id
-            ).count()
+        with session_scope() as session:
+            stmt = select(
+                Source.source_type.label("type"),
+                func.count().label("count")
+            ).group_by(Source.source_type).order_by(func.count().desc())
             
-            data.append({
-                "name": s.name,
-                "type": s.source_type,
-                "language": s.language or "unknown",
-                "is_doppelganger": "🔴" if s.is_doppelganger else "",
-                "is_amplifier": "🟠" if s.is_amplifier else "",
-                "content_count": content_count,
-                "last_collected": s.last_collected_at
-            })
-        
-        return pd.DataFrame(data)
+            return pd.read_sql_query(stmt, session.connection())
     except Exception:
         return pd.DataFrame()
 
 
+@st.cache_data(ttl=60, show_spinner=False)
 def get_recent_content(limit: int = 20) -> pd.DataFrame:
     """
     Get most recent content items.
@@ -263,49 +313,54 @@ def get_recent_content(limit: int = 20) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Recent content
     """
-    session = get_db_session()
-    
-    if session is None:
-        return pd.DataFrame()
-    
     try:
-        contents = session.query(Content).order_by(
-            Content.collected_at.desc()
-        ).limit(limit).all()
-        
-        if not contents:
-            return pd.DataFrame()
-        
-        data = []
-        for c in contents:
-            source = session.query(Source).filter(
-                Source.id == c.source_id
-            ).first()
+        with session_scope() as session:
+            # Single query: source name and analysis joined in (was 2 per row)
+            contents = session.query(
+                Content.id,
+                Content.title,
+                func.substr(Content.text_content, 1, 80),
+                Content.content_type,
+                Content.language,
+                Content.published_at,
+                Source.name,
+                NLPAnalysis.sentiment_label,
+                NLPAnalysis.is_propaganda
+            ).outerjoin(
+                Source, Source.id == Content.source_id
+            ).outerjoin(
+                NLPAnalysis, NLPAnalysis.content_id == Content.id
+            ).order_by(
+                Content.collected_at.desc()
+            ).limit(limit).all()
             
-            analysis = session.query(NLPAnalysis).filter(
-                NLPAnalysis.content_id == c.id
-            ).first()
+            if not contents:
+                return pd.DataFrame()
             
-            title = c.title or c.text_content[:80]
-            if len(title) > 80:
-                title = title[:77] + "..."
+            data = []
+            for (content_id, title, excerpt, content_type, language,
+                    published_at, source_name, sentiment, is_propaganda) in contents:
+                title = title or excerpt
+                if len(title) > 80:
+                    title = title[:77] + "..."
+                
+                data.append({
+                    "id": str(content_id)[:8],
+                    "title": title,
+                    "source": source_name or "Unknown",
+                    "type": content_type,
+                    "language": language or "?",
+                    "sentiment": sentiment or "N/A",
+                    "propaganda": "⚠️" if is_propaganda else "",
+                    "published": published_at.strftime("%Y-%m-%d %H:%M") if published_at else "N/A"
+                })
             
-            data.append({
-                "id": str(c.id)[:8],
-                "title": title,
-                "source": source.name if source else "Unknown",
-                "type": c.content_type,
-                "language": c.language or "?",
-                "sentiment": analysis.sentiment_label if analysis else "N/A",
-                "propaganda": "⚠️" if (analysis and analysis.is_propaganda) else "",
-                "published": c.published_at.strftime("%Y-%m-%d %H:%M") if c.published_at else "N/A"
-            })
-        
-        return pd.DataFrame(data)
+            return pd.DataFrame(data)
     except Exception:
         return pd.DataFrame()
 
 
+@st.cache_data(ttl=60, show_spinner=False)
 def get_language_distribution() -> pd.DataFrame:
     """
     Get content language distribution.
@@ -313,30 +368,16 @@ def get_language_distribution() -> pd.DataFrame:
     Returns:
         pd.DataFrame: Language distribution
     """
-    session = get_db_session()
-    
-    if session is None:
-        return pd.DataFrame()
-    
     try:
-        contents = session.query(Content).filter(
-            Content.language.isnot(None)
-        ).all()
-        
-        if not contents:
-            return pd.DataFrame()
-        
-        lang_counts: Dict[str, int] = {}
-        for c in contents:
-            lang = c.language or "unknown"
-            lang_counts[lang] = lang_counts.get(lang, 0) + 1
-        
-        data = [
-            {"language": lang, "count": count}
-            for lang, count in lang_counts.items()
-        ]
-        
-        return pd.DataFrame(data)
+        with session_scope() as session:
+            stmt = select(
+                Content.language,
+                func.count().label("count")
+            ).where(
+                Content.language.isnot(None)
+            ).group_by(Content.language)
+            
+            return pd.read_sql_query(stmt, session.connection())
     except Exception:
         return pd.DataFrame()
 
@@ -344,7 +385,13 @@ def get_language_distribution() -> pd.DataFrame:
 # =============================================================================
 # VISUALIZATION FUNCTIONS
 # =============================================================================
+# Figures are cached by DataFrame content: reruns triggered by unrelated
+# widgets reuse the built figure instead of re-running Plotly.
+
+# Constant uirevision: Plotly updates charts in place instead of resetting them
+UI_REVISION = "dashboard"
 
+@st.cache_data(ttl=60, show_spinner=False)
 def create_timeline_chart(df: pd.DataFrame) -> go.Figure:
     """
     Create timeline visualization.
@@ -358,8 +405,8 @@ def create_timeline_chart(df: pd.DataFrame) -> go.Figure:
     if df.empty:
         return go.Figure()
     
-    # Group by date
-    daily_counts = df.groupby("date").size().reset_index(name="count")
+    # Sum the per-language/type counts by date
+    daily_counts = df.groupby("date", as_index=False)["count"].sum()
     
     fig = px.area(
         daily_counts,
@@ -372,12 +419,14 @@ def create_timeline_chart(df: pd.DataFrame) -> go.Figure:
     fig.update_layout(
         xaxis_title="Date",
         yaxis_title="Content Count",
-        hovermode="x unified"
+        hovermode="x unified",
+        uirevision=UI_REVISION  # keep zoom state when cached data refreshes
     )
     
     return fig
 
 
+@st.cache_data(ttl=60, show_spinner=False)
 def create_sentiment_chart(df: pd.DataFrame) -> go.Figure:
     """
     Create sentiment distribution chart.
@@ -391,9 +440,6 @@ def create_sentiment_chart(df: pd.DataFrame) -> go.Figure:
     if df.empty:
         return go.Figure()
     
-    sentiment_counts = df["sentiment"].value_counts().reset_index()
-    sentiment_counts.columns = ["sentiment", "count"]
-    
     colors = {
         "positive": "#2ecc71",
         "neutral": "#95a5a6",
@@ -401,17 +447,22 @@ def create_sentiment_chart(df: pd.DataFrame) -> go.Figure:
     }
     
     fig = px.pie(
-        sentiment_counts,
+        df,
         values="count",
         names="sentiment",
         title="Sentiment Distribution",
         color="sentiment",
-        color_discrete_map=colors
+        color_discrete_map=colors,
+        hover_data=["avg_score"]
     )
     
+    # Keep zoom/legend state when cached data refreshes
+    fig.update_layout(uirevision=UI_REVISION)
+    
     return fig
 
 
+@st.cache_data(ttl=60, show_spinner=False)
 def create_markers_chart(df: pd.DataFrame) -> go.Figure:
     """
     Create cognitive markers chart.
@@ -425,8 +476,12 @@ def create_markers_chart(df: pd.DataFrame) -> go.Figure:
     if df.empty:
         return go.Figure()
     
-    marker_counts = df["type"].value_counts().head(10).reset_index()
-    marker_counts.columns = ["marker_type", "count"]
+    marker_counts = (
+        df.groupby("type")["count"].sum()
+        .nlargest(10)
+        .rename_axis("marker_type")
+        .reset_index()
+    )
     
     fig = px.bar(
         marker_counts,
@@ -437,11 +492,15 @@ def create_markers_chart(df: pd.DataFrame) -> go.Figure:
         labels={"marker_type": "Marker Type", "count": "Occurrences"}
     )
     
-    fig.update_layout(yaxis={"categoryorder": "total ascending"})
+    fig.update_layout(
+        yaxis={"categoryorder": "total ascending"},
+        uirevision=UI_REVISION  # keep zoom state when cached data refreshes
+    )
     
     return fig
 
 
+@st.cache_data(ttl=60, show_spinner=False)
 def create_language_chart(df: pd.DataFrame) -> go.Figure:
     """
     Create language distribution chart.
@@ -462,6 +521,9 @@ def create_language_chart(df: pd.DataFrame) -> go.Figure:
         title="Content by Language"
     )
     
+    # Keep zoom/legend state when cached data refreshes
+    fig.update_layout(uirevision=UI_REVISION)
+    
     return fig
 
 
@@ -469,6 +531,7 @@ def create_language_chart(df: pd.DataFrame) -> go.Figure:
 # PAGE RENDERERS
 # =============================================================================
 
+@fragment(run_every=timedelta(seconds=60))
 def render_overview():
     """Render the overview/home page."""
     st.header("📊 Dashboard Overview")
@@ -531,13 +594,9 @@ def render_overview():
         )
     
     with col4:
-        analysis_rate = (
-            (stats.analyzed_content / stats.total_content * 100)
-            if stats.total_content > 0 else 0
-        )
         st.metric(
             label="📈 Analysis Rate",
-            value=f"{analysis_rate:.1f}%"
+            value=f"{stats.analysis_rate:.1f}%"
         )
     
     st.markdown("---")
@@ -589,6 +648,7 @@ def render_overview():
             st.info("No cognitive markers detected yet")
 
 
+@fragment()
 def render_sources():
     """Render the sources page."""
     st.header("📡 Sources")
@@ -602,11 +662,9 @@ def render_sources():
         with col1:
             st.metric("Total Sources", len(sources_df))
         with col2:
-            doppelganger_count = len(sources_df[sources_df["is_doppelganger"] == "🔴"])
-            st.metric("Doppelganger", doppelganger_count)
+            st.metric("Doppelganger", int(sources_df["is_doppelganger"].sum()))
         with col3:
-            amplifier_count = len(sources_df[sources_df["is_amplifier"] == "🟠"])
-            st.metric("Amplifiers", amplifier_count)
+            st.metric("Amplifiers", int(sources_df["is_amplifier"].sum()))
         
         st.markdown("---")
         
@@ -615,15 +673,22 @@ def render_sources():
         st.dataframe(
             sources_df,
             use_container_width=True,
-            hide_index=True
+            hide_index=True,
+            column_config={
+                "is_doppelganger": st.column_config.CheckboxColumn("🔴 DG"),
+                "is_amplifier": st.column_config.CheckboxColumn("🟠 Amp"),
+                "content_count": st.column_config.ProgressColumn(
+                    "Content",
+                    format="%d",
+                    min_value=0,
+                    max_value=max(int(sources_df["content_count"].max()), 1)
+                ),
+            }
         )
         
-        # Type distribution
-        type_counts = sources_df["type"].value_counts().reset_index()
-        type_counts.columns = ["type", "count"]
-        
+        # Type distribution (aggregated by PostgreSQL)
         fig = px.bar(
-            type_counts,
+            get_source_type_counts(),
             x="type",
             y="count",
             title="Sources by Type"
@@ -633,6 +698,7 @@ def render_sources():
         st.info("No sources registered yet")
 
 
+@fragment()
 def render_content():
     """Render the content analysis page."""
     st.header("📄 Content Analysis")
@@ -640,7 +706,11 @@ def render_content():
     # Recent content
     st.subheader("Recent Content")
     
-    recent_df = get_recent_content(30)
+    # Row count is part of the cache key of get_recent_content
+    limit = st.number_input(
+        "Rows", min_value=10, max_value=500, value=30, step=10
+    )
+    recent_df = get_recent_content(int(limit))
     
     if not recent_df.empty:
         st.dataframe(recent_df, use_container_width=True, hide_index=True)
@@ -649,31 +719,47 @@ def render_content():
     
     st.markdown("---")
     
-    # Search
+    render_search()
+
+
+@fragment()
+def render_search():
+    """Render the content search box (reruns alone while typing)."""
     st.subheader("🔍 Search Content")
-    search_query = st.text_input("Enter search terms")
-    
-    if search_query:
-        session = get_db_session()
-        
-        if session:
+    search_query = st.text_input("Enter search terms").strip()
+    
+    # The trigram index (idx_content_text_trgm) needs at least 3 characters;
+    # shorter patterns would scan the whole content table
+    if search_query and len(search_query) < 3:
+        st.info("Enter at least 3 characters")
+    elif search_query:
+        with session_scope() as session:
             try:
-                results = session.query(Content).filter(
-                    Content.text_content.ilike(f"%{search_query}%")
-                ).limit(20).all()
+                # Literal substring match: % and _ in the input are escaped.
+                # Only the rendered columns are fetched, and the preview is
+                # cut by PostgreSQL so long texts never leave the database.
+                results = session.execute(
+                    select(
+                        Content.title,
+                        func.left(Content.text_content, 500).label("preview"),
+                        Content.content_type,
+                        Content.language,
+                        Content.published_at,
+                    ).where(
+                        Content.text_content.icontains(search_query, autoescape=True)
+                    ).limit(20)
+                ).all()
                 
                 if results:
                     st.success(f"Found {len(results)} results")
                     
-                    for r in results:
-                        with st.expander(
-                            f"📄 {r.title or r.text_content[:50]}..."
-                        ):
-                            st.write(r.text_content[:500])
+                    for title, preview, content_type, language, published_at in results:
+                        with st.expander(f"📄 {title or preview[:50]}..."):
+                            st.write(preview)
                             st.caption(
-                                f"Type: {r.content_type} | "
-                                f"Language: {r.language} | "
-                                f"Published: {r.published_at}"
+                                f"Type: {content_type} | "
+                                f"Language: {language} | "
+                                f"Published: {published_at}"
                             )
                 else:
                     st.warning("No results found")
@@ -681,6 +767,43 @@ def render_content():
                 st.error(f"Search error: {e}")
 
 
+@st.cache_data(max_entries=10, show_spinner=False)
+def read_export(path: str, mtime: float) -> bytes:
+    """
+    Read an export file, cached until the file changes.
+    
+    Args:
+        path: File path
+        mtime: Modification time (part of the cache key)
+        
+    Returns:
+        bytes: File contents
+    """
+    return Path(path).read_bytes()
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def list_exports(directory: str, dir_mtime: float) -> List[Tuple[str, str, float]]:
+    """
+    List GEXF exports, oldest first, with one scandir pass.
+    
+    Args:
+        directory: Exports directory
+        dir_mtime: Directory modification time (part of the cache key)
+        
+    Returns:
+        List of (name, path, mtime) tuples
+    """
+    exports = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.endswith(".gexf") and entry.is_file():
+                exports.append((entry.name, entry.path, entry.stat().st_mtime))
+    exports.sort(key=lambda export: export[2])
+    return exports
+
+
+@fragment()
 def render_network():
     """Render the network analysis page."""
     st.header("🕸️ Network Analysis")
@@ -701,85 +824,90 @@ def render_network():
     exports_dir = Path("exports/graphs")
     
     if exports_dir.exists():
-        gexf_files = list(exports_dir.glob("*.gexf"))
+        gexf_files = list_exports(str(exports_dir), exports_dir.stat().st_mtime)
         
         if gexf_files:
             st.success(f"📁 {len(gexf_files)} graph file(s) available for download")
             
-            for f in gexf_files[-5:]:  # Show last 5
+            for name, path, mtime in gexf_files[-5:]:  # Show 5 most recent
                 col1, col2 = st.columns([3, 1])
                 with col1:
-                    st.text(f.name)
+                    st.text(name)
                 with col2:
-                    with open(f, "rb") as file:
-                        st.download_button(
-                            "📥 Download",
-                            file.read(),
-                            f.name,
-                            "application/gexf+xml",
-                            key=f.name
-                        )
+                    st.download_button(
+                        "📥 Download",
+                        read_export(path, mtime),
+                        name,
+                        "application/gexf+xml",
+                        key=name
+                    )
         else:
             st.info("No graph exports available. Run network analysis first.")
     else:
         st.info("Export directory not found. Run network analysis to generate graphs.")
 
 
+@fragment(run_every=timedelta(seconds=60))
 def render_alerts():
     """Render the alerts page."""
     st.header("🚨 Alerts & Detections")
     
-    session = get_db_session()
-    
-    if session is None:
-        st.error("Database not available")
-        return
-    
     try:
-        # Propaganda alerts
-        st.subheader("⚠️ Propaganda Content Detected")
-        
-        propaganda = session.query(NLPAnalysis).filter(
-            NLPAnalysis.is_propaganda == True,
-            NLPAnalysis.propaganda_confidence >= 0.7
-        ).order_by(NLPAnalysis.analyzed_at.desc()).limit(10).all()
-        
-        if propaganda:
-            for p in propaganda:
-                content = session.query(Content).filter(
-                    Content.id == p.content_id
-                ).first()
-                
-                if content:
+        with session_scope() as session:
+            # Propaganda alerts
+            st.subheader("⚠️ Propaganda Content Detected")
+            
+            # Content joined in: one query instead of one per alert.
+            # Techniques are joined by PostgreSQL and rows come back as
+            # plain tuples, so no ORM instances are built.
+            propaganda = session.query(
+                NLPAnalysis.propaganda_confidence,
+                NLPAnalysis.sentiment_label,
+                NLPAnalysis.sentiment_score,
+                func.array_to_string(
+                    NLPAnalysis.propaganda_techniques, ", "
+                ).label("techniques"),
+                Content.title,
+                Content.text_content,
+            ).join(
+                Content, Content.id == NLPAnalysis.content_id
+            ).filter(
+                NLPAnalysis.is_propaganda == True,
+                NLPAnalysis.propaganda_confidence >= 0.7
+            ).order_by(NLPAnalysis.analyzed_at.desc()).limit(10).all()
+            
+            if propaganda:
+                for (confidence, sentiment_label, sentiment_score,
+                     techniques, title, text_content) in propaganda:
                     with st.expander(
-                        f"🚨 Confidence: {p.propaganda_confidence:.0%} | "
-                        f"{content.title or 'Untitled'}"
+                        f"🚨 Confidence: {confidence:.0%} | "
+                        f"{title or 'Untitled'}"
                     ):
-                        st.write(content.text_content[:500])
-                        st.write(f"**Techniques:** {', '.join(p.propaganda_techniques or [])}")
-                        st.write(f"**Sentiment:** {p.sentiment_label} ({p.sentiment_score:.2f})")
-        else:
-            st.success("✅ No high-confidence propaganda detected recently")
-        
-        st.markdown("---")
-        
-        # High-severity markers
-        st.subheader("🎯 High-Severity Cognitive Markers")
-        
-        high_markers = session.query(CognitiveMarker).filter(
-            CognitiveMarker.severity == "high",
-            CognitiveMarker.confidence >= 0.8
-        ).limit(10).all()
-        
-        if high_markers:
-            for m in high_markers:
-                st.warning(
-                    f"**{m.marker_type}** ({m.marker_category}) - "
-                    f"Confidence: {m.confidence:.0%}"
-                )
-        else:
-            st.success("✅ No high-severity markers detected")
-        
+                        st.write(text_content[:500])
+                        st.write(f"**Techniques:** {techniques or ''}")
+                        st.write(f"**Sentiment:** {sentiment_label} ({sentiment_score:.2f})")
+            else:
+                st.success("✅ No high-confidence propaganda detected recently")
+            
+            st.markdown("---")
+            
+            # High-severity markers
+            st.subheader("🎯 High-Severity Cognitive Markers")
+            
+            high_markers = session.query(CognitiveMarker).filter(
+                CognitiveMarker.severity == "high",
+                CognitiveMarker.confidence >= 0.8
+            ).limit(10).all()
+            
+            if high_markers:
+                for m in high_markers:
+                    st.warning(
+                        f"**{m.marker_type}** ({m.marker_category}) - "
+                        f"Confidence: {m.confidence:.0%}"
+                    )
+            else:
+                st.success("✅ No high-severity markers detected")
+            
     except Exception as e:
         st.error(f"Error loading alerts: {e}")
 
@@ -852,6 +980,10 @@ def main():
     
     st.sidebar.markdown("---")
     
+    # Cached queries expire after a minute; force a reload on demand
+    if st.sidebar.button("🔄 Refresh"):
+        st.cache_data.clear()
+    
     # Last update info
     st.sidebar.caption(f"🕐 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
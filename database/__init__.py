@@ -8,8 +8,11 @@ from .models import (
     # Engine and session
     get_engine,
     get_session,
+    session_scope,
+    ScopedSession,
     init_db,
     drop_db,
+    refresh_dashboard_stats,
     Base,
     
     # Models
@@ -62,8 +65,11 @@ __all__ = [
     # Engine and session
     "get_engine",
     "get_session",
+    "session_scope",
+    "ScopedSession",
     "init_db",
     "drop_db",
+    "refresh_dashboard_stats",
     "Base",
     
     # Models
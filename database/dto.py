@@ -15,7 +15,21 @@ from enum import Enum
 # ENUMS
 # =============================================================================
 
-class SourceType(str, Enum):
+class _ValueLookupMixin:
+    """
+    Value-to-member lookup for the string enums below.
+    
+    ``from_value`` reads a table built once at import time instead of
+    going through ``Enum.__call__`` for every converted row.
+    """
+    
+    @classmethod
+    def from_value(cls, value: str):
+        """Return the member for ``value`` (KeyError if unknown)."""
+        return _ENUM_BY_VALUE[cls][value]
+
+
+class SourceType(_ValueLookupMixin, str, Enum):
     """Source type categories."""
     TELEGRAM = "telegram"
     DOMAIN = "domain"
@@ -24,7 +38,7 @@ class SourceType(str, Enum):
     SOCIAL = "social"
 
 
-class ContentType(str, Enum):
+class ContentType(_ValueLookupMixin, str, Enum):
     """Content type categories."""
     ARTICLE = "article"
     POST = "post"
@@ -33,14 +47,14 @@ class ContentType(str, Enum):
     COMMENT = "comment"
 
 
-class SentimentLabel(str, Enum):
+class SentimentLabel(_ValueLookupMixin, str, Enum):
     """Sentiment classification labels."""
     POSITIVE = "positive"
     NEGATIVE = "negative"
     NEUTRAL = "neutral"
 
 
-class Severity(str, Enum):
+class Severity(_ValueLookupMixin, str, Enum):
     """Severity levels for markers."""
     LOW = "low"
     MEDIUM = "medium"
@@ -48,7 +62,7 @@ class Severity(str, Enum):
     CRITICAL = "critical"
 
 
-class PropagationType(str, Enum):
+class PropagationType(_ValueLookupMixin, str, Enum):
     """Types of content propagation."""
     FORWARD = "forward"
     QUOTE = "quote"
@@ -58,7 +72,7 @@ class PropagationType(str, Enum):
     SIMILAR = "similar"
 
 
-class MutationType(str, Enum):
+class MutationType(_ValueLookupMixin, str, Enum):
     """Types of content mutation during propagation."""
     NONE = "none"
     AMPLIFICATION = "amplification"
@@ -70,7 +84,7 @@ class MutationType(str, Enum):
 # SOURCE DTOs
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class SourceDTO:
     """
     Data transfer object for Source entities.
@@ -103,7 +117,7 @@ class SourceDTO:
     last_collected_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TelegramChannelConfig:
     """
     Configuration for a Telegram channel to monitor.
@@ -122,7 +136,7 @@ class TelegramChannelConfig:
     priority: str = "medium"
 
 
-@dataclass
+@dataclass(slots=True)
 class RSSFeedConfig:
     """
     Configuration for an RSS feed to monitor.
@@ -143,7 +157,7 @@ class RSSFeedConfig:
 # CONTENT DTOs
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ContentDTO:
     """
     Data transfer object for Content entities.
@@ -177,7 +191,7 @@ class ContentDTO:
     is_analyzed: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ContentSearchResult:
     """
     Search result with relevance score.
@@ -191,7 +205,7 @@ class ContentSearchResult:
 # ANALYSIS DTOs
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class EntityDTO:
     """
     Named entity extracted from text.
@@ -210,7 +224,7 @@ class EntityDTO:
     confidence: float = 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class SentimentResult:
     """
     Sentiment analysis result.
@@ -225,7 +239,7 @@ class SentimentResult:
     confidence: float
 
 
-@dataclass
+@dataclass(slots=True)
 class NLPAnalysisResult:
     """
     Complete NLP analysis result.
@@ -252,7 +266,7 @@ class NLPAnalysisResult:
     propaganda_techniques: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class CognitiveMarkerDTO:
     """
     Detected cognitive warfare marker.
@@ -275,7 +289,7 @@ class CognitiveMarkerDTO:
     evidence_end: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NarrativeMatch:
     """
     Detected narrative match.
@@ -296,7 +310,7 @@ class NarrativeMatch:
 # PROPAGATION DTOs
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class PropagationLink:
     """
     Link between propagated content.
@@ -319,7 +333,7 @@ class PropagationLink:
     time_delta_seconds: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SimilarContentMatch:
     """
     Similar content match result.
@@ -334,7 +348,7 @@ class SimilarContentMatch:
 # NETWORK DTOs
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class NetworkNode:
     """
     Node in the propagation network.
@@ -351,7 +365,7 @@ class NetworkNode:
     attributes: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class NetworkEdge:
     """
     Edge in the propagation network.
@@ -370,7 +384,7 @@ class NetworkEdge:
     attributes: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class SuperspreaderInfo:
     """
     Information about a superspreader node.
@@ -395,7 +409,7 @@ class SuperspreaderInfo:
     is_doppelganger: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class NetworkStats:
     """
     Network statistics summary.
@@ -415,7 +429,7 @@ class NetworkStats:
     is_connected: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class CoordinatedBehaviorEvent:
     """
     Detected coordinated behavior event.
@@ -438,7 +452,7 @@ class CoordinatedBehaviorEvent:
 # COLLECTION DTOs
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class CollectionResult:
     """
     Result of a collection run.
@@ -464,7 +478,7 @@ class CollectionResult:
     error_messages: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """
     Result of an analysis run.
@@ -487,7 +501,7 @@ class AnalysisResult:
 # REPORT DTOs
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class DashboardStats:
     """
     Dashboard statistics summary.
@@ -500,6 +514,7 @@ class DashboardStats:
         propaganda_detected: Propaganda content count
         cognitive_markers: Total markers detected
         factchecks: Fact-check count
+        analysis_rate: Percentage of content analyzed
     """
     total_content: int = 0
     total_sources: int = 0
@@ -508,9 +523,10 @@ class DashboardStats:
     propaganda_detected: int = 0
     cognitive_markers: int = 0
     factchecks: int = 0
+    analysis_rate: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class TimelineDataPoint:
     """
     Data point for timeline visualization.
@@ -520,7 +536,7 @@ class TimelineDataPoint:
     category: str = "all"
 
 
-@dataclass
+@dataclass(slots=True)
 class AlertInfo:
     """
     Alert information for detected issues.
@@ -539,3 +555,16 @@ class AlertInfo:
     description: str
     content_id: Optional[str] = None
     detected_at: Optional[datetime] = None
+
+
+# =============================================================================
+# ENUM LOOKUP TABLES
+# =============================================================================
+
+_ENUM_BY_VALUE: Dict[type, Dict[str, Enum]] = {
+    enum_cls: {member.value: member for member in enum_cls}
+    for enum_cls in (
+        SourceType, ContentType, SentimentLabel,
+        Severity, PropagationType, MutationType,
+    )
+}
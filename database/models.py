@@ -20,20 +20,23 @@ Models:
 from __future__ import annotations
 
 import hashlib
+import os
+import time
+import uuid
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional, List, Any
-from uuid import uuid4
+from typing import Optional, List, Any, Union, Iterator
 from dataclasses import dataclass, field
 
 from sqlalchemy import (
     create_engine, Column, String, Text, Boolean, Integer, Float,
     DateTime, ForeignKey, ARRAY, BigInteger, Index, UniqueConstraint, CheckConstraint,
-    event
+    event, text
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import (
     DeclarativeBase, Mapped, mapped_column, relationship,
-    sessionmaker, Session
+    sessionmaker, scoped_session, Session
 )
 from sqlalchemy.pool import QueuePool
 
@@ -68,6 +71,10 @@ def get_engine():
 engine = get_engine()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Thread-local session registry: one session per thread, released with
+# ScopedSession.remove()
+ScopedSession = scoped_session(SessionLocal)
+
 
 def get_session() -> Session:
     """
@@ -87,6 +94,29 @@ def get_session() -> Session:
     return SessionLocal()
 
 
+@contextmanager
+def session_scope() -> Iterator[Session]:
+    """
+    Provide a transactional scope around a series of operations.
+    
+    Commits on success, rolls back on error, and always closes the
+    session so its connection goes back to the pool.
+    
+    Example:
+        with session_scope() as session:
+            session.add(source)
+    """
+    session = SessionLocal()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
 # =============================================================================
 # BASE MODEL
 # =============================================================================
@@ -97,8 +127,18 @@ class Base(DeclarativeBase):
 
 
 def generate_uuid() -> str:
-    """Generate a new UUID string."""
-    return str(uuid4())
+    """
+    Generate a new time-ordered UUID (version 7, RFC 9562) string.
+    
+    The leading 48 bits are the Unix time in milliseconds, so new rows
+    land at the right edge of the primary-key B-tree instead of on
+    random pages. The remaining 74 bits are random.
+    """
+    value = (time.time_ns() // 1_000_000) << 80
+    value |= int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)    # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)    # RFC 4122 variant
+    return str(uuid.UUID(int=value))
 
 
 # =============================================================================
@@ -123,6 +163,9 @@ class Source(Base):
         is_active: Whether source is being actively collected
         first_seen_at: First observation timestamp
         last_collected_at: Last successful collection timestamp
+        feed_etag: HTTP ETag of the last fetched feed (conditional GET)
+        feed_last_modified: HTTP Last-Modified of the last fetched feed
+        telegram_last_message_id: Highest Telegram message ID collected
         created_at: Record creation timestamp
         updated_at: Last update timestamp
     """
@@ -156,6 +199,13 @@ class Source(Base):
     first_seen_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
     last_collected_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
     
+    # Feed cache validators (RSS conditional GET)
+    feed_etag: Mapped[Optional[str]] = mapped_column(Text)
+    feed_last_modified: Mapped[Optional[str]] = mapped_column(Text)
+    
+    # Telegram checkpoint (incremental collection via min_id)
+    telegram_last_message_id: Mapped[Optional[int]] = mapped_column(BigInteger)
+    
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), 
@@ -168,10 +218,14 @@ class Source(Base):
     )
     
     # Relationships
+    # Never loaded implicitly: a source can hold tens of thousands of rows.
+    # Query Content by source_id, or opt in with selectinload(Source.contents).
+    # Deletes are left to the database (ON DELETE SET NULL).
     contents: Mapped[List["Content"]] = relationship(
         "Content", 
         back_populates="source",
-        lazy="dynamic"
+        lazy="raise_on_sql",
+        passive_deletes=True
     )
     
     # Indexes
@@ -249,7 +303,9 @@ class Content(Base):
     # Content
     title: Mapped[Optional[str]] = mapped_column(Text)
     text_content: Mapped[str] = mapped_column(Text, nullable=False)
-    text_hash: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
+    text_hash: Mapped[str] = mapped_column(
+        String(64), nullable=False, unique=True, index=True
+    )
     
     # Media
     has_media: Mapped[bool] = mapped_column(Boolean, default=False)
@@ -323,10 +379,14 @@ class Content(Base):
         uselist=False,
         cascade="all, delete-orphan"
     )
+    # Opt in with selectinload(Content.cognitive_markers) when listing
+    # content; deletes cascade in the database (ON DELETE CASCADE)
     cognitive_markers: Mapped[List["CognitiveMarker"]] = relationship(
         "CognitiveMarker",
         back_populates="content",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True
     )
     factchecks: Mapped[List["Factcheck"]] = relationship(
         "Factcheck",
@@ -340,23 +400,26 @@ class Content(Base):
         Index("idx_content_type", "content_type"),
         Index("idx_content_language", "language"),
         Index("idx_content_analyzed", "is_analyzed"),
+        Index("idx_content_published_lang_type", "published_at", "language", "content_type"),
     )
     
     def __repr__(self) -> str:
         return f"<Content(id='{self.id[:8]}...', type='{self.content_type}')>"
     
     @staticmethod
-    def compute_hash(text: str) -> str:
+    def compute_hash(text: Union[str, bytes]) -> str:
         """
         Compute SHA256 hash for text content.
         
         Args:
-            text: Text to hash
+            text: Text to hash, or its UTF-8 bytes (avoids re-encoding)
             
         Returns:
             str: Hexadecimal hash string
         """
-        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+        if isinstance(text, str):
+            text = text.encode("utf-8")
+        return hashlib.sha256(text).hexdigest()
     
     def to_dict(self) -> dict:
         """Convert to dictionary representation."""
@@ -640,6 +703,13 @@ class CognitiveMarker(Base):
         Index("idx_markers_type", "marker_type"),
         Index("idx_markers_category", "marker_category"),
         Index("idx_markers_severity", "severity"),
+        
+        # Partial index for the dashboard's high-severity alerts
+        Index(
+            "idx_markers_high_confidence",
+            "confidence",
+            postgresql_where=(severity == "high")
+        ),
     )
     
     def __repr__(self) -> str:
@@ -916,6 +986,51 @@ class CollectionRun(Base):
         self.error_messages.append(error)
 
 
+# =============================================================================
+# MATERIALIZED VIEWS
+# =============================================================================
+
+# Pre-aggregated dashboard counters, one row. Refreshed by collectors and
+# analyzers after each run so the dashboard reads a single row instead of
+# counting every table on page load. The unique index on ``id`` is required
+# by REFRESH ... CONCURRENTLY.
+DASHBOARD_STATS_DDL = (
+    """
+    CREATE MATERIALIZED VIEW IF NOT EXISTS dashboard_stats AS
+    SELECT
+        1 AS id,
+        counts.*,
+        CASE WHEN counts.total_content > 0
+            THEN 100.0 * counts.analyzed_content / counts.total_content
+            ELSE 0
+        END::DOUBLE PRECISION AS analysis_rate,
+        NOW() AS refreshed_at
+    FROM (
+        SELECT
+            (SELECT COUNT(*) FROM content) AS total_content,
+            (SELECT COUNT(*) FROM sources) AS total_sources,
+            (SELECT COUNT(*) FROM content WHERE is_analyzed) AS analyzed_content,
+            (SELECT COUNT(*) FROM sources WHERE is_doppelganger) AS doppelganger_sources,
+            (SELECT COUNT(*) FROM nlp_analysis WHERE is_propaganda) AS propaganda_detected,
+            (SELECT COUNT(*) FROM cognitive_markers) AS cognitive_markers,
+            (SELECT COUNT(*) FROM factchecks) AS factchecks
+    ) AS counts
+    """,
+    "CREATE UNIQUE INDEX IF NOT EXISTS ix_dashboard_stats_id ON dashboard_stats (id)",
+)
+
+
+def refresh_dashboard_stats() -> None:
+    """
+    Refresh the dashboard_stats materialized view.
+    
+    Uses CONCURRENTLY so dashboard reads are not blocked while the
+    counts are recomputed.
+    """
+    with engine.begin() as conn:
+        conn.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY dashboard_stats"))
+
+
 # =============================================================================
 # DATABASE INITIALIZATION
 # =============================================================================
@@ -924,9 +1039,13 @@ def init_db():
     """
     Initialize database tables.
     
-    Creates all tables defined in models if they don't exist.
+    Creates all tables defined in models if they don't exist,
+    then the materialized views built on top of them.
     """
     Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        for statement in DASHBOARD_STATS_DDL:
+            conn.execute(text(statement))
 
 
 def drop_db():
@@ -935,6 +1054,8 @@ def drop_db():
     
     Warning: This will delete all data!
     """
+    with engine.begin() as conn:
+        conn.execute(text("DROP MATERIALIZED VIEW IF EXISTS dashboard_stats"))
     Base.metadata.drop_all(bind=engine)
 
 
@@ -37,6 +37,13 @@ CREATE TABLE IF NOT EXISTS sources (
     first_seen_at TIMESTAMP WITH TIME ZONE,
     last_collected_at TIMESTAMP WITH TIME ZONE,
     
+    -- Feed cache validators (RSS conditional GET)
+    feed_etag TEXT,
+    feed_last_modified TEXT,
+    
+    -- Telegram checkpoint (incremental collection via min_id)
+    telegram_last_message_id BIGINT,
+    
     -- Timestamps
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
@@ -110,12 +117,13 @@ CREATE TABLE IF NOT EXISTS content (
 );
 
 -- Indexes for content
-CREATE INDEX IF NOT EXISTS idx_content_hash ON content(text_hash);
+CREATE UNIQUE INDEX IF NOT EXISTS ix_content_text_hash ON content(text_hash);
 CREATE INDEX IF NOT EXISTS idx_content_source ON content(source_id);
 CREATE INDEX IF NOT EXISTS idx_content_published ON content(published_at);
 CREATE INDEX IF NOT EXISTS idx_content_type ON content(content_type);
 CREATE INDEX IF NOT EXISTS idx_content_language ON content(language);
 CREATE INDEX IF NOT EXISTS idx_content_analyzed ON content(is_analyzed);
+CREATE INDEX IF NOT EXISTS idx_content_published_lang_type ON content(published_at, language, content_type);
 CREATE INDEX IF NOT EXISTS idx_content_text_trgm ON content 
     USING gin(text_content gin_trgm_ops);
 
@@ -236,6 +244,8 @@ CREATE INDEX IF NOT EXISTS idx_markers_content ON cognitive_markers(content_id);
 CREATE INDEX IF NOT EXISTS idx_markers_type ON cognitive_markers(marker_type);
 CREATE INDEX IF NOT EXISTS idx_markers_category ON cognitive_markers(marker_category);
 CREATE INDEX IF NOT EXISTS idx_markers_severity ON cognitive_markers(severity);
+CREATE INDEX IF NOT EXISTS idx_markers_high_confidence ON cognitive_markers(confidence)
+    WHERE severity = 'high';
 
 -- =============================================================================
 -- FACTCHECKS TABLE
@@ -483,6 +493,32 @@ FROM content c
 LEFT JOIN sources s ON c.source_id = s.id
 LEFT JOIN nlp_analysis n ON n.content_id = c.id;
 
+-- Pre-aggregated dashboard counters (one row), refreshed after each
+-- collection and analysis run with:
+--   REFRESH MATERIALIZED VIEW CONCURRENTLY dashboard_stats;
+CREATE MATERIALIZED VIEW IF NOT EXISTS dashboard_stats AS
+SELECT
+    1 AS id,
+    counts.*,
+    CASE WHEN counts.total_content > 0
+        THEN 100.0 * counts.analyzed_content / counts.total_content
+        ELSE 0
+    END::DOUBLE PRECISION AS analysis_rate,
+    NOW() AS refreshed_at
+FROM (
+    SELECT
+        (SELECT COUNT(*) FROM content) AS total_content,
+        (SELECT COUNT(*) FROM sources) AS total_sources,
+        (SELECT COUNT(*) FROM content WHERE is_analyzed) AS analyzed_content,
+        (SELECT COUNT(*) FROM sources WHERE is_doppelganger) AS doppelganger_sources,
+        (SELECT COUNT(*) FROM nlp_analysis WHERE is_propaganda) AS propaganda_detected,
+        (SELECT COUNT(*) FROM cognitive_markers) AS cognitive_markers,
+        (SELECT COUNT(*) FROM factchecks) AS factchecks
+) AS counts;
+
+-- Required by REFRESH ... CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS ix_dashboard_stats_id ON dashboard_stats (id);
+
 -- =============================================================================
 -- COMPLETION
 -- =============================================================================
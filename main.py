@@ -75,6 +75,11 @@ def cmd_collect(args):
                         collector.close()
                     except Exception as e:
                         log_error("Telegram collection failed", e, source_type="telegram")
+                    finally:
+                        # Close the shared client inside this event loop
+                        telegram_module = sys.modules.get("collectors.telegram_collector")
+                        if telegram_module is not None:
+                            await telegram_module.close_shared_clients()
 
             # Media collection
             if not args.telegram_only:
@@ -0,0 +1,42 @@
+-- =============================================================================
+-- Doppelganger Tracker - Database Migration
+-- =============================================================================
+-- Make content.text_hash unique so collectors can insert with
+-- INSERT ... ON CONFLICT (text_hash) DO NOTHING
+-- Date: 2026-10-15
+-- Version: 2.1
+-- =============================================================================
+
+BEGIN;
+
+-- =============================================================================
+-- CONTENT TABLE - Check for existing duplicates
+-- =============================================================================
+
+-- The unique index cannot be built while duplicates exist.
+-- List them first and resolve manually if this returns rows:
+--
+-- SELECT text_hash, COUNT(*)
+-- FROM content
+-- GROUP BY text_hash
+-- HAVING COUNT(*) > 1;
+
+-- =============================================================================
+-- CONTENT TABLE - Replace hash index with a unique index
+-- =============================================================================
+
+CREATE UNIQUE INDEX IF NOT EXISTS ix_content_text_hash ON content(text_hash);
+
+-- Superseded by the unique index
+DROP INDEX IF EXISTS idx_content_hash;
+
+ANALYZE content;
+
+COMMIT;
+
+-- =============================================================================
+-- Rollback Script (if needed)
+-- =============================================================================
+
+-- CREATE INDEX IF NOT EXISTS idx_content_hash ON content(text_hash);
+-- DROP INDEX IF EXISTS ix_content_text_hash;
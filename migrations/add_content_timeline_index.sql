@@ -0,0 +1,23 @@
+-- =============================================================================
+-- Doppelganger Tracker - Database Migration
+-- =============================================================================
+-- Composite index backing the dashboard's grouped timeline query
+-- (published_at range, grouped by language and content type)
+-- Date: 2026-10-15
+-- Version: 2.3
+-- =============================================================================
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_content_published_lang_type
+    ON content(published_at, language, content_type);
+
+ANALYZE content;
+
+COMMIT;
+
+-- =============================================================================
+-- Rollback Script (if needed)
+-- =============================================================================
+
+-- DROP INDEX IF EXISTS idx_content_published_lang_type;
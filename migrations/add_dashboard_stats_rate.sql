@@ -0,0 +1,46 @@
+-- =============================================================================
+-- Doppelganger Tracker - Database Migration
+-- =============================================================================
+-- Add the precomputed analysis_rate (percent of content analyzed) to the
+-- dashboard_stats materialized view. Materialized views cannot gain
+-- columns, so the view is recreated.
+-- Date: 2026-10-15
+-- Version: 2.7
+-- Requires: add_dashboard_stats_view.sql (2.5)
+-- =============================================================================
+
+BEGIN;
+
+DROP MATERIALIZED VIEW IF EXISTS dashboard_stats;
+
+CREATE MATERIALIZED VIEW dashboard_stats AS
+SELECT
+    1 AS id,
+    counts.*,
+    CASE WHEN counts.total_content > 0
+        THEN 100.0 * counts.analyzed_content / counts.total_content
+        ELSE 0
+    END::DOUBLE PRECISION AS analysis_rate,
+    NOW() AS refreshed_at
+FROM (
+    SELECT
+        (SELECT COUNT(*) FROM content) AS total_content,
+        (SELECT COUNT(*) FROM sources) AS total_sources,
+        (SELECT COUNT(*) FROM content WHERE is_analyzed) AS analyzed_content,
+        (SELECT COUNT(*) FROM sources WHERE is_doppelganger) AS doppelganger_sources,
+        (SELECT COUNT(*) FROM nlp_analysis WHERE is_propaganda) AS propaganda_detected,
+        (SELECT COUNT(*) FROM cognitive_markers) AS cognitive_markers,
+        (SELECT COUNT(*) FROM factchecks) AS factchecks
+) AS counts;
+
+-- Required by REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS ix_dashboard_stats_id ON dashboard_stats (id);
+
+COMMIT;
+
+-- =============================================================================
+-- Rollback Script (if needed)
+-- =============================================================================
+
+-- Re-run add_dashboard_stats_view.sql after:
+-- DROP MATERIALIZED VIEW IF EXISTS dashboard_stats;
@@ -0,0 +1,33 @@
+-- =============================================================================
+-- Doppelganger Tracker - Database Migration
+-- =============================================================================
+-- Pre-aggregate the dashboard counters in a one-row materialized view,
+-- refreshed by collectors and analyzers after each run
+-- Date: 2026-10-15
+-- Version: 2.5
+-- =============================================================================
+
+BEGIN;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS dashboard_stats AS
+SELECT
+    1 AS id,
+    (SELECT COUNT(*) FROM content) AS total_content,
+    (SELECT COUNT(*) FROM sources) AS total_sources,
+    (SELECT COUNT(*) FROM content WHERE is_analyzed) AS analyzed_content,
+    (SELECT COUNT(*) FROM sources WHERE is_doppelganger) AS doppelganger_sources,
+    (SELECT COUNT(*) FROM nlp_analysis WHERE is_propaganda) AS propaganda_detected,
+    (SELECT COUNT(*) FROM cognitive_markers) AS cognitive_markers,
+    (SELECT COUNT(*) FROM factchecks) AS factchecks,
+    NOW() AS refreshed_at;
+
+-- Required by REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS ix_dashboard_stats_id ON dashboard_stats (id);
+
+COMMIT;
+
+-- =============================================================================
+-- Rollback Script (if needed)
+-- =============================================================================
+
+-- DROP MATERIALIZED VIEW IF EXISTS dashboard_stats;
@@ -0,0 +1,24 @@
+-- =============================================================================
+-- Doppelganger Tracker - Database Migration
+-- =============================================================================
+-- Partial index backing the dashboard's high-severity marker alerts
+-- (severity = 'high' AND confidence >= threshold)
+-- Date: 2026-10-15
+-- Version: 2.6
+-- =============================================================================
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_markers_high_confidence
+    ON cognitive_markers(confidence)
+    WHERE severity = 'high';
+
+ANALYZE cognitive_markers;
+
+COMMIT;
+
+-- =============================================================================
+-- Rollback Script (if needed)
+-- =============================================================================
+
+-- DROP INDEX IF EXISTS idx_markers_high_confidence;
@@ -0,0 +1,22 @@
+-- =============================================================================
+-- Doppelganger Tracker - Database Migration
+-- =============================================================================
+-- Store RSS feed cache validators (ETag / Last-Modified) on sources so the
+-- media collector can issue conditional GETs and skip unchanged feeds
+-- Date: 2026-10-15
+-- Version: 2.2
+-- =============================================================================
+
+BEGIN;
+
+ALTER TABLE sources ADD COLUMN IF NOT EXISTS feed_etag TEXT;
+ALTER TABLE sources ADD COLUMN IF NOT EXISTS feed_last_modified TEXT;
+
+COMMIT;
+
+-- =============================================================================
+-- Rollback Script (if needed)
+-- =============================================================================
+
+-- ALTER TABLE sources DROP COLUMN IF EXISTS feed_etag;
+-- ALTER TABLE sources DROP COLUMN IF EXISTS feed_last_modified;
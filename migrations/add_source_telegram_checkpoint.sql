@@ -0,0 +1,20 @@
+-- =============================================================================
+-- Doppelganger Tracker - Database Migration
+-- =============================================================================
+-- Store the highest collected Telegram message ID per channel so the
+-- collector only requests newer messages (iter_messages min_id)
+-- Date: 2026-10-15
+-- Version: 2.4
+-- =============================================================================
+
+BEGIN;
+
+ALTER TABLE sources ADD COLUMN IF NOT EXISTS telegram_last_message_id BIGINT;
+
+COMMIT;
+
+-- =============================================================================
+-- Rollback Script (if needed)
+-- =============================================================================
+
+-- ALTER TABLE sources DROP COLUMN IF EXISTS telegram_last_message_id;
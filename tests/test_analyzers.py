@@ -4,6 +4,9 @@ Doppelganger Tracker - Analyzer Tests
 Unit tests for NLP and network analyzers.
 """
 
+import threading
+import time
+
 import pytest
 from unittest.mock import MagicMock, patch
 from datetime import datetime
@@ -397,3 +400,186 @@ class TestKeywordExtraction:
         result = analyzer_for_keywords.extract_keywords("Test text", "en", top_n=5)
         
         assert isinstance(result, list)
+
+
+class TestTopicTransform:
+    """Tests for BERTopicAnalyzer.transform on a reloaded model."""
+    
+    def test_transform_loaded_model_uses_bertopic_embedder(self):
+        """A model from load_from has no local encoder: embeddings=None."""
+        from analyzers import topic_analyzer
+        
+        fake_model = MagicMock()
+        fake_model.topics_ = [0, 1]
+        fake_model.transform.return_value = ([0, 1], None)
+        fake_bertopic = MagicMock()
+        fake_bertopic.load.return_value = fake_model
+        
+        with patch.object(topic_analyzer, "_lazy_import_bertopic", return_value=True), \
+             patch.object(topic_analyzer, "BERTOPIC_AVAILABLE", True), \
+             patch.object(topic_analyzer, "BERTopic", fake_bertopic):
+            analyzer = topic_analyzer.BERTopicAnalyzer(load_from="/tmp/model")
+            assignments = analyzer.transform([
+                {"id": "a", "text": "first document"},
+                {"id": "b", "text": "second document"},
+            ])
+        
+        fake_model.transform.assert_called_once()
+        assert fake_model.transform.call_args.kwargs["embeddings"] is None
+        assert [a.topic_id for a in assignments] == [0, 1]
+        assert [a.doc_id for a in assignments] == ["a", "b"]
+
+
+class TestBertopicAvailability:
+    """Tests for the package-level BERTopic availability flag."""
+    
+    def test_package_flag_follows_deferred_import(self):
+        """analyzers.BERTOPIC_AVAILABLE reflects the import result, not find_spec."""
+        import analyzers
+        from analyzers import topic_analyzer
+        
+        with patch.object(topic_analyzer, "BERTOPIC_AVAILABLE", True), \
+             patch.object(topic_analyzer, "_lazy_import_bertopic", return_value=False):
+            assert analyzers.BERTOPIC_AVAILABLE is False
+
+
+class TestCapabilities:
+    """Tests for the capability reports of the orchestrator module."""
+    
+    def test_check_analysis_capabilities_returns_copies(self):
+        """Mutating one result does not leak into later calls."""
+        from analyzers.orchestrator import check_analysis_capabilities
+        
+        first = check_analysis_capabilities()
+        first["bertopic"] = "tampered"
+        
+        assert check_analysis_capabilities()["bertopic"] != "tampered"
+
+
+class TestEncodePool:
+    """Tests for the multi-GPU encode pool shared across analyzers."""
+    
+    def test_one_pool_per_model_stopped_at_exit(self):
+        """The pool is started once per model and its shutdown registered with atexit."""
+        from analyzers import topic_analyzer
+        
+        model = MagicMock()
+        fake_st = MagicMock()
+        topic_analyzer._get_encode_pool.cache_clear()
+        with patch.object(topic_analyzer, "_get_sentence_transformer", return_value=model), \
+             patch.object(topic_analyzer, "SentenceTransformer", fake_st), \
+             patch.object(topic_analyzer.atexit, "register") as register:
+            first = topic_analyzer._get_encode_pool("model", "fp32")
+            second = topic_analyzer._get_encode_pool("model", "fp32")
+        topic_analyzer._get_encode_pool.cache_clear()
+        
+        assert first is second
+        model.start_multi_process_pool.assert_called_once()
+        register.assert_called_once_with(fake_st.stop_multi_process_pool, first)
+
+
+class TestTopicAnalyzerCache:
+    """Tests for the analyzers shared by extract_topics."""
+    
+    def test_clear_closes_cached_analyzers(self):
+        """clear_topic_analyzers closes every cached analyzer, then empties the cache."""
+        from analyzers import topic_analyzer
+        
+        topic_analyzer.clear_topic_analyzers()
+        with patch.object(topic_analyzer, "BERTopicAnalyzer", side_effect=lambda config: MagicMock()):
+            first = topic_analyzer._get_topic_analyzer("french", 10, "model")
+            assert topic_analyzer._get_topic_analyzer("french", 10, "model") is first
+            second = topic_analyzer._get_topic_analyzer("english", 10, "model")
+            
+            topic_analyzer.clear_topic_analyzers()
+            
+            first.close.assert_called_once()
+            second.close.assert_called_once()
+            assert topic_analyzer._get_topic_analyzer("french", 10, "model") is not first
+        topic_analyzer.clear_topic_analyzers()
+    
+    def test_evicted_analyzer_is_closed(self):
+        """The least recently used analyzer is closed when the cache is full."""
+        from analyzers import topic_analyzer
+        
+        topic_analyzer.clear_topic_analyzers()
+        with patch.object(topic_analyzer, "BERTopicAnalyzer", side_effect=lambda config: MagicMock()):
+            analyzers = [
+                topic_analyzer._get_topic_analyzer("french", size, "model")
+                for size in range(topic_analyzer._TOPIC_ANALYZERS_MAX + 1)
+            ]
+            
+            analyzers[0].close.assert_called_once()
+            for analyzer in analyzers[1:]:
+                analyzer.close.assert_not_called()
+        topic_analyzer.clear_topic_analyzers()
+    
+    def test_concurrent_extract_topics_do_not_overlap(self):
+        """Two extract_topics calls sharing an analyzer run fit_transform one at a time."""
+        from analyzers import topic_analyzer
+        
+        active = []
+        overlaps = []
+        
+        def fit_transform(contents):
+            active.append(contents)
+            overlaps.append(len(active) > 1)
+            time.sleep(0.05)
+            active.remove(contents)
+            return contents
+        
+        def make_analyzer(config):
+            analyzer = MagicMock()
+            analyzer._lock = threading.Lock()
+            analyzer.fit_transform.side_effect = fit_transform
+            return analyzer
+        
+        topic_analyzer.clear_topic_analyzers()
+        with patch.object(topic_analyzer, "BERTopicAnalyzer", side_effect=make_analyzer):
+            threads = [
+                threading.Thread(target=topic_analyzer.extract_topics, args=([{"id": str(i)}],))
+                for i in range(2)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        topic_analyzer.clear_topic_analyzers()
+        
+        assert overlaps == [False, False]
+    
+    def test_eviction_waits_for_running_fit(self):
+        """An evicted analyzer is only closed once its fit_transform has returned."""
+        from analyzers import topic_analyzer
+        
+        fitting = threading.Event()
+        events = []
+        
+        def make_analyzer(config):
+            analyzer = MagicMock()
+            analyzer._lock = threading.Lock()
+            
+            def fit_transform(contents):
+                fitting.set()
+                time.sleep(0.05)
+                events.append(("fit", config.min_topic_size))
+            
+            analyzer.fit_transform.side_effect = fit_transform
+            analyzer.close.side_effect = lambda: events.append(("close", config.min_topic_size))
+            return analyzer
+        
+        topic_analyzer.clear_topic_analyzers()
+        with patch.object(topic_analyzer, "BERTopicAnalyzer", side_effect=make_analyzer):
+            worker = threading.Thread(
+                target=topic_analyzer.extract_topics, args=([], 0)
+            )
+            worker.start()
+            fitting.wait()
+            for size in range(1, topic_analyzer._TOPIC_ANALYZERS_MAX + 1):
+                topic_analyzer._get_topic_analyzer(
+                    "multilingual", size, topic_analyzer.DEFAULT_EMBEDDING_MODEL
+                )
+            worker.join()
+        topic_analyzer.clear_topic_analyzers()
+        
+        assert events.index(("fit", 0)) < events.index(("close", 0))
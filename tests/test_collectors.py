@@ -75,6 +75,78 @@ class TestMediaCollector:
         entry = {"published_parsed": None}
         result = collector._parse_feed_date(entry)
         assert result is None
+    
+    def test_parse_feed_fast_rss(self, collector):
+        """RSS items should be parsed into feedparser-like entries."""
+        rss = (
+            b"<rss><channel><item><title>Hello &amp; world</title>"
+            b"<link>https://example.com/1</link><description>Summary</description>"
+            b"<pubDate>Mon, 15 Jan 2024 10:30:00 +0100</pubDate></item></channel></rss>"
+        )
+        collector._http = Mock()
+        collector._http.get.return_value = Mock(content=rss)
+        
+        entries = collector._parse_feed_fast("https://example.com/feed")
+        
+        assert len(entries) == 1
+        assert entries[0]["title"] == "Hello & world"
+        assert entries[0]["link"] == "https://example.com/1"
+        assert entries[0]["summary"] == "Summary"
+        assert collector._parse_feed_date(entries[0]) == datetime(2024, 1, 15, 9, 30, 0)
+    
+    def test_parse_feed_fast_atom(self, collector):
+        """Atom entries should use the alternate link and content."""
+        atom = (
+            b'<feed xmlns="http://www.w3.org/2005/Atom"><entry><title>T</title>'
+            b'<link rel="self" href="https://example.com/self"/>'
+            b'<link href="https://example.com/2"/><content>Body</content>'
+            b'<updated>2024-01-15T10:30:00Z</updated></entry></feed>'
+        )
+        collector._http = Mock()
+        collector._http.get.return_value = Mock(content=atom)
+        
+        entries = collector._parse_feed_fast("https://example.com/feed")
+        
+        assert entries[0]["link"] == "https://example.com/2"
+        assert entries[0]["summary"] == "Body"
+        assert collector._parse_feed_date(entries[0]) == datetime(2024, 1, 15, 10, 30, 0)
+    
+    def test_parse_feed_fast_not_modified(self, collector):
+        """A 304 response should yield no entries and send validators."""
+        collector._feed_validators["https://example.com/feed"] = ('"abc"', None)
+        collector._http = Mock()
+        collector._http.get.return_value = Mock(status_code=304)
+        
+        entries = collector._parse_feed_fast("https://example.com/feed")
+        
+        assert entries == []
+        headers = collector._http.get.call_args.kwargs["headers"]
+        assert headers == {"If-None-Match": '"abc"'}
+    
+    def test_html_to_text_prefers_article(self, collector):
+        """Article text should be extracted without non-content elements."""
+        html = (
+            b"<html><body><nav>Menu</nav><article><h1>Title</h1>"
+            b"<script>var x = 1;</script><p>Article body</p></article>"
+            b"<footer>Footer</footer></body></html>"
+        )
+        result = collector._html_to_text(html)
+        assert result == "Title Article body"
+    
+    def test_html_to_text_skips_article_in_aside(self, collector):
+        """Articles nested in non-content elements should be ignored."""
+        html = (
+            b"<html><body><aside><article>Related</article></aside>"
+            b"<article><p>Main story</p><nav>Share</nav></article></body></html>"
+        )
+        result = collector._html_to_text(html)
+        assert result == "Main story"
+    
+    def test_html_to_text_body_fallback(self, collector):
+        """Body text should be used when no article or main element exists."""
+        html = b"<html><body><header>Site</header><div>Some text</div></body></html>"
+        result = collector._html_to_text(html)
+        assert result == "Some text"
 
 
 class TestBaseCollector:
@@ -153,6 +225,67 @@ class TestTelegramChannelConfig:
         assert config.priority == "medium"
 
 
+class TestTelegramProducer:
+    """Tests for the Telegram message producer."""
+    
+    @staticmethod
+    def _collector(channel_size: int):
+        """Collector whose client serves IDs 1..channel_size, oldest first."""
+        from collectors.telegram_collector import TelegramCollector
+        
+        calls = []
+        
+        async def get_messages(peer, limit, min_id, offset_date, reverse):
+            calls.append({"limit": limit, "min_id": min_id, "reverse": reverse})
+            ids = range(min_id + 1, min(min_id + limit, channel_size) + 1)
+            return [Mock(id=i, text=f"message {i}") for i in ids]
+        
+        collector = TelegramCollector.__new__(TelegramCollector)
+        collector.client = Mock(get_messages=get_messages)
+        return collector, calls
+    
+    @staticmethod
+    def _produce(collector, limit: int, min_id: int):
+        import asyncio
+        
+        async def run():
+            queue = asyncio.Queue()
+            max_id = await collector._produce_messages(
+                Mock(), queue, datetime(2026, 1, 1), limit=limit, min_id=min_id
+            )
+            return max_id, [queue.get_nowait() for _ in range(queue.qsize())]
+        
+        return asyncio.run(run())
+    
+    def test_reads_forward_from_checkpoint(self):
+        """Messages are read oldest-first after the checkpoint, without gaps."""
+        collector, calls = self._collector(channel_size=13)
+        
+        max_id, queued = self._produce(collector, limit=100, min_id=10)
+        
+        assert calls[0]["reverse"] is True
+        assert calls[0]["min_id"] == 10
+        assert max_id == 13
+        assert [m.id for m in queued[:-1]] == [11, 12, 13]
+        assert queued[-1] is None
+    
+    def test_throttles_every_page(self):
+        """Each history page takes its own throttle token."""
+        from collectors import telegram_collector
+        
+        collector, calls = self._collector(channel_size=1000)
+        with patch.object(
+            telegram_collector._RPC_THROTTLE, "acquire", new_callable=AsyncMock
+        ) as acquire:
+            max_id, queued = self._produce(collector, limit=250, min_id=0)
+        
+        assert [c["limit"] for c in calls] == [100, 100, 50]
+        assert [c["min_id"] for c in calls] == [0, 100, 200]
+        assert acquire.await_count == 3
+        assert max_id == 250
+        assert len(queued) == 251
+
+
 class TestCollectorErrorHandling:
     """Tests for error handling in collectors."""
     
@@ -180,3 +313,152 @@ class TestCollectorErrorHandling:
         mock_collector.record_error("Error 3")
         
         assert len(mock_collector._errors) == 3
+
+
+class TestContentDeduplication:
+    """Tests for the in-memory hash pre-filter."""
+    
+    @pytest.fixture
+    def mock_collector(self):
+        """Create a collector with a mocked session."""
+        with patch.object(MediaCollector, '_load_config') as mock_config:
+            mock_config.return_value = {}
+            collector = MediaCollector()
+            collector.session = Mock()
+            yield collector
+    
+    def test_unknown_hash_skips_database(self, mock_collector):
+        """Hashes missing from the pre-filter should not hit the database."""
+        from database import Content
+        
+        mock_collector._hash_filter = mock_collector._new_hash_filter()
+        
+        assert not mock_collector.content_exists(Content.compute_hash("new"))
+        mock_collector.session.query.assert_not_called()
+    
+    def test_known_hash_checks_database(self, mock_collector):
+        """Pre-filter hits should be confirmed against the database."""
+        from database import Content
+        
+        text_hash = Content.compute_hash("known")
+        mock_collector._hash_filter = mock_collector._new_hash_filter()
+        mock_collector._hash_filter.add(mock_collector._hash_key(text_hash))
+        
+        assert mock_collector.content_exists(text_hash)
+        mock_collector.session.query.assert_called_once()
+
+
+class TestNearDupFilter:
+    """Tests for the MinHash-LSH near-duplicate filter."""
+    
+    def test_reworded_repost_is_duplicate(self):
+        """Texts differing by a word should match, unrelated ones not."""
+        pytest.importorskip("datasketch")
+        from collectors.base import NearDupFilter
+        
+        words = [f"word{i}" for i in range(60)]
+        near_dup = NearDupFilter()
+        
+        assert not near_dup.is_duplicate("a", " ".join(words))
+        assert near_dup.is_duplicate("b", " ".join(words[:-1]) + " END")
+        assert not near_dup.is_duplicate("c", "something else entirely here today")
+    
+    def test_tokenize_non_latin(self):
+        """Cyrillic and accented words should be kept whole."""
+        from collectors.base import tokenize
+        
+        assert tokenize("Россия готовит новое наступление") == [
+            "россия", "готовит", "новое", "наступление"
+        ]
+        assert tokenize("Élection présidentielle") == ["élection", "présidentielle"]
+    
+    def test_distinct_cyrillic_texts_not_duplicates(self):
+        """Unrelated Russian posts must not collapse into one signature."""
+        pytest.importorskip("datasketch")
+        from collectors.base import NearDupFilter
+        
+        near_dup = NearDupFilter()
+        
+        assert not near_dup.is_duplicate(
+            "a", "Россия готовит новое наступление на востоке страны сегодня"
+        )
+        assert not near_dup.is_duplicate(
+            "b", "Министерство опубликовало отчёт о ценах на энергию за год"
+        )
+        assert not near_dup.is_duplicate("c", "!!! ???")
+        assert not near_dup.is_duplicate("d", "!!! ???")
+    
+    def test_inert_without_datasketch(self):
+        """Without datasketch the filter never reports duplicates."""
+        from collectors import base
+        
+        with patch.object(base, "DATASKETCH_AVAILABLE", False):
+            near_dup = base.NearDupFilter()
+        
+        assert not near_dup.enabled
+        assert not near_dup.is_duplicate("a", "same text")
+        assert not near_dup.is_duplicate("b", "same text")
+
+
+class TestFeedPersistence:
+    """Tests for bulk persistence of feed entries."""
+    
+    @pytest.fixture
+    def mock_collector(self):
+        """Create a collector with a mocked session and source."""
+        with patch.object(MediaCollector, '_load_config') as mock_config:
+            mock_config.return_value = {}
+            collector = MediaCollector()
+            collector.session = Mock()
+            collector.session.query.return_value.filter.return_value.all.return_value = []
+            collector.get_or_create_source = Mock(return_value=Mock(id="source-1"))
+            yield collector
+    
+    def test_factchecks_linked_by_text_hash(self, mock_collector):
+        """Fact-checks should only be created for inserted content, by hash."""
+        from database import Content, RSSFeedConfig
+        
+        texts = ["First claim\n\nFirst summary", "Second claim\n\nSecond summary"]
+        candidates = [
+            ({}, text.split("\n")[0], f"https://example.com/{i}", text,
+             Content.compute_hash(text))
+            for i, text in enumerate(texts)
+        ]
+        
+        # Only the second row is new (the first hits ON CONFLICT)
+        insert_result = Mock()
+        insert_result.all.return_value = [("content-2", candidates[1][4])]
+        mock_collector.session.execute.side_effect = [insert_result, None]
+        
+        feed_config = RSSFeedConfig(
+            name="Checker", url="https://example.com/feed",
+            language="en", feed_type="factcheck"
+        )
+        collected = mock_collector._persist_feed(feed_config, candidates)
+        
+        assert collected == 1
+        factcheck_rows = mock_collector.session.execute.call_args_list[1].args[1]
+        assert len(factcheck_rows) == 1
+        assert factcheck_rows[0]["content_id"] == "content-2"
+        assert factcheck_rows[0]["claim_text"] == "Second claim"
+    
+    def test_failed_feed_rolls_back_counters(self, mock_collector):
+        """A feed failing at commit should not count its rows as new."""
+        from database import Content, RSSFeedConfig
+        
+        text = "Claim\n\nSummary"
+        text_hash = Content.compute_hash(text)
+        insert_result = Mock()
+        insert_result.all.return_value = [("content-1", text_hash)]
+        mock_collector.session.execute.return_value = insert_result
+        mock_collector.session.commit.side_effect = RuntimeError("db down")
+        
+        feed_config = RSSFeedConfig(name="Feed", url="https://example.com/feed")
+        collected = mock_collector._persist_feed(
+            feed_config, [({}, "Claim", "https://example.com/1", text, text_hash)]
+        )
+        
+        assert collected == 0
+        assert mock_collector._items_new == 0
+        assert len(mock_collector._errors) == 1
+        mock_collector.session.rollback.assert_called()
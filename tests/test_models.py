@@ -4,6 +4,9 @@ Doppelganger Tracker - Database Model Tests
 Unit tests for database models and DTOs.
 """
 
+import time
+import uuid
+
 import pytest
 from datetime import datetime
 from uuid import uuid4
@@ -41,6 +44,16 @@ class TestGenerateUUID:
         """Each call should generate unique UUID."""
         uuids = [generate_uuid() for _ in range(100)]
         assert len(set(uuids)) == 100
+    
+    def test_generate_uuid_is_time_ordered(self):
+        """UUIDs should be version 7 and sort by creation time."""
+        first = generate_uuid()
+        time.sleep(0.002)
+        second = generate_uuid()
+        parsed = uuid.UUID(first)
+        assert parsed.version == 7
+        assert parsed.variant == uuid.RFC_4122
+        assert first < second
 
 
 class TestContentModel:
@@ -68,6 +81,11 @@ class TestContentModel:
         """Hash should handle unicode text."""
         result = Content.compute_hash("Тест на русском 测试中文")
         assert len(result) == 64
+    
+    def test_compute_hash_accepts_bytes(self):
+        """Hashing UTF-8 bytes should match hashing the text."""
+        text = "Тест на русском 测试中文"
+        assert Content.compute_hash(text.encode("utf-8")) == Content.compute_hash(text)
 
 
 class TestSourceDTO:
@@ -252,6 +270,7 @@ class TestDashboardStats:
         assert stats.total_content == 0
         assert stats.total_sources == 0
         assert stats.propaganda_detected == 0
+        assert stats.analysis_rate == 0.0
 
 
 class TestEnums:
@@ -282,3 +301,11 @@ class TestEnums:
         assert MutationType.NONE.value == "none"
         assert MutationType.AMPLIFICATION.value == "amplification"
         assert MutationType.DISTORTION.value == "distortion"
+    
+    def test_from_value_lookup(self):
+        """from_value should return the same member as enum construction."""
+        for enum_cls in (SourceType, ContentType, Severity, MutationType):
+            for member in enum_cls:
+                assert enum_cls.from_value(member.value) is enum_cls(member.value)
+        with pytest.raises(KeyError):
+            SourceType.from_value("unknown")